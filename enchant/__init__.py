@@ -74,23 +74,63 @@ _DOC_ERRORS = ["enchnt", "enchnt", "incant", "fr"]
 
 __version__ = "3.3.0"
 
+import contextlib
 import os
+import threading
+import time
 import warnings
-
-try:
-    from enchant import _enchant as _e
-except ImportError:
-    if not os.environ.get("PYENCHANT_IGNORE_MISSING_LIB", False):
-        raise
-    _e = None  # type: ignore
-
-from typing import Any, List, NoReturn, Optional, Tuple, Type, Union  # noqa F401
-
+import weakref
+from collections import OrderedDict
+from typing import (  # noqa F401
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from enchant.cache import LRUCache, SuggestionCache
 from enchant.errors import *  # noqa F401,F403
 from enchant.errors import DictNotFoundError, Error
 from enchant.pypwl import PyPWL
 from enchant.utils import get_default_language
 
+#  Dictionaries from these providers are not usable in a forked child
+#  process, as they talk to other processes or system services.
+_FORK_UNSAFE_PROVIDERS = frozenset(["applespell", "zemberek"])
+
+#  The ctypes bindings to the C library are only loaded on first use,
+#  so that importing e.g. enchant.tokenize stays cheap.
+_e = None  # type: Any
+
+
+def _load_lib() -> Any:
+    """Load the bindings to the enchant C library, if not done already.
+
+    This returns the :py:mod:`enchant._enchant` module, or `None` if the
+    C library is missing and the `PYENCHANT_IGNORE_MISSING_LIB` environment
+    variable is set.
+    """
+    global _e
+    if _e is None:
+        try:
+            from enchant import _enchant
+        except ImportError:
+            if not os.environ.get("PYENCHANT_IGNORE_MISSING_LIB", False):
+                raise
+            return None
+        _e = _enchant
+    return _e
+
+
+_load_lib._DOC_ERRORS = ["PYENCHANT", "LIB"]  # type: ignore
+
 
 class ProviderDesc:
     """Simple class describing an Enchant provider.
@@ -127,6 +167,41 @@ class ProviderDesc:
         return hash(self.name + self.desc + self.file)
 
 
+def _timed_call(func, *args):
+    """Call `func` with the given arguments, also returning the time taken."""
+    start = time.perf_counter()
+    res = func(*args)
+    return res, time.perf_counter() - start
+
+
+def _resident_bytes() -> Optional[int]:
+    """Get the resident memory of this process, if it can be found out."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class _DictHandle:
+    """Information shared by all `Dict` objects using the same C dictionary.
+
+    A `Broker` hands out the same underlying dictionary to every request
+    for a given language, and keeps one of these objects for each of them
+    so that the dictionary only needs to be described once.
+    """
+
+    __slots__ = ("tag", "provider", "generation", "replacements")
+
+    def __init__(self, tag: str, provider: ProviderDesc) -> None:
+        self.tag = tag
+        self.provider = provider
+        # Incremented each time the set of accepted words may have changed
+        self.generation = 0
+        # Incremented each time a replacement spelling is stored
+        self.replacements = 0
+
+
 class _EnchantObject:
     """Base class for enchant objects.
 
@@ -143,9 +218,9 @@ class _EnchantObject:
     def __init__(self) -> None:
         """_EnchantObject constructor."""
         self._this = None
-        #  To be importable when enchant C lib is missing, we need
+        #  To be usable when enchant C lib is missing, we need
         #  to create a dummy default broker.
-        if _e is not None:
+        if _load_lib() is not None:
             self._init_this()
 
     def _check_this(self, msg: str = None) -> None:
@@ -187,6 +262,7 @@ class _EnchantObject:
 
     def __setstate__(self, state):
         self.__dict__.update(state)
+        _load_lib()
         self._init_this()
 
 
@@ -204,21 +280,62 @@ class Broker(_EnchantObject):
         * :py:meth:`request_dict`:  obtain a dictionary for specific language
         * :py:meth:`set_ordering`:  specify which dictionaries to try for a given language.
 
+    The lists of available providers and dictionaries are looked up once,
+    and then remembered until :py:meth:`refresh` is called.
+
+    When the process forks, the dictionaries loaded by a broker remain
+    usable in the child process, sharing their memory with the parent
+    until either of them changes it; see :py:meth:`preload`.  If the
+    :py:attr:`reload_after_fork` attribute is set to `True`, the child
+    instead loads them anew, as it does for providers which cannot be
+    used after a fork.  Words added to the session are then forgotten
+    in the child.
+
+    A broker serving many languages can be given a budget for the number
+    of dictionaries it keeps loaded, or for the memory they take, with
+    :py:meth:`set_dict_budget`.
     """
 
+    _DOC_ERRORS = ["preload"]
+
+    #: Whether to load the dictionaries anew in child processes
+    reload_after_fork = False
+
     def __init__(self) -> None:
         """Broker object constructor.
 
         This method is the constructor for the `Broker` object.  No
         arguments are required.
         """
+        self._preloaded = {}  # type: dict
+        self._max_dicts = None  # type: Optional[int]
+        self._max_bytes = None  # type: Optional[int]
+        self._budgeted = False
+        #: The number of dictionaries unloaded to stay within the budget
+        self.evictions = 0
         super().__init__()
+        _brokers.add(self)
 
     def _init_this(self) -> None:
         self._this = _e.broker_init()
         if not self._this:
             raise Error("Could not initialise an enchant broker.")
         self._live_dicts = {}
+        self._dict_handles = {}
+        # The language dictionaries, least recently used first, along
+        # with the memory taken by loading them.  The order is only kept
+        # up to date when there is a budget.
+        self._lru = OrderedDict()  # type: OrderedDict[_e.t_dict, int]
+        # The dictionary last loaded for each tag
+        self._loaded_tags = {}  # type: dict
+        # The Dict objects using this broker, to update them after a fork
+        self._dicts = weakref.WeakSet()  # type: weakref.WeakSet[Dict]
+        self.refresh()
+        # Replay any configuration, e.g. after unpickling.
+        orderings = getattr(self, "_orderings", {})
+        self._orderings = {}
+        for tag, ordering in orderings.items():
+            self.set_ordering(tag, ordering)
 
     def __del__(self) -> None:
         """Broker object destructor."""
@@ -231,8 +348,162 @@ class Broker(_EnchantObject):
     def __getstate__(self):
         state = super().__getstate__()
         state.pop("_live_dicts")
+        state.pop("_dict_handles")
+        state.pop("_dicts")
+        state.pop("_lru")
+        state.pop("_loaded_tags")
+        state["_preloaded"] = list(self._preloaded)
         return state
 
+    def __setstate__(self, state):
+        tags = state.pop("_preloaded")
+        state["_preloaded"] = {}
+        super().__setstate__(state)
+        _brokers.add(self)
+        self.preload(tags)
+
+    def preload(self, tags: Iterable[str]) -> None:
+        """Load the dictionaries for the given languages ahead of time.
+
+        The dictionaries are kept loaded for as long as the broker exists,
+        so that creating a :py:class:`Dict` for one of these languages is
+        cheap.  Calling this method in the parent process of a forking
+        server means that the work is done once, and that the children
+        share the memory holding the dictionaries.
+        """
+        for tag in tags:
+            if tag not in self._preloaded:
+                self._preloaded[tag] = self.request_dict(tag)
+        # Also remember what is available
+        self.list_dicts()
+
+    def _after_fork(self) -> None:
+        """Make this broker usable in a child process after a fork."""
+        if self._this is None:
+            return
+        dicts = [d for d in self._dicts if d._this is not None]
+        if not self.reload_after_fork and not any(
+            d.provider.name in _FORK_UNSAFE_PROVIDERS for d in dicts
+        ):
+            return
+        # Load everything anew.  The C objects inherited from the parent
+        # are left alone: freeing them would run code of the providers.
+        self._this = None
+        for d in dicts:
+            d._this = None
+        self._init_this()
+        for d in dicts:
+            pwl = getattr(d, "_pwl", None)
+            if pwl is None:
+                this = self._request_dict_data(d.tag)
+            else:
+                this = self._request_pwl_dict_data(pwl)
+            d._switch_this(this, self)
+            d._check_cache_token = None
+
+    def _sibling(self) -> "Broker":
+        """Create a new `Broker` configured in the same way as this one.
+
+        The C library hands out a single shared dictionary per language
+        from each broker, so this is the way to get an independent
+        dictionary object for the same language and provider.
+        """
+        sibling = Broker()
+        for tag, ordering in self._orderings.items():
+            sibling.set_ordering(tag, ordering)
+        if self._budgeted:
+            sibling.set_dict_budget(self._max_dicts, self._max_bytes)
+        return sibling
+
+    def set_dict_budget(
+        self, max_dicts: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        """Limit the language dictionaries kept loaded by this broker.
+
+        When loading a dictionary brings the number of loaded dictionaries
+        above `max_dicts`, or the memory they take above `max_bytes`, the
+        least recently used ones are unloaded.  A :py:class:`Dict` whose
+        dictionary was unloaded loads it again the next time it is used.
+        Passing `None` for both arguments removes the budget.
+
+        Dictionaries whose session was changed, e.g. by adding words to
+        it, are never unloaded, and neither are those given to
+        :py:meth:`preload` or personal word lists.  The memory taken by a
+        dictionary is estimated from the growth of the process when it was
+        loaded, and is only known where that can be measured, on Linux.
+        See :py:meth:`dict_usage` and the :py:attr:`evictions` attribute
+        to find out how the budget works out.
+
+        Unloading dictionaries is not safe while they are used by other
+        threads.
+        """
+        self._max_dicts = max_dicts
+        self._max_bytes = max_bytes
+        self._budgeted = max_dicts is not None or max_bytes is not None
+        self._enforce_budget()
+
+    set_dict_budget._DOC_ERRORS = ["preload"]  # type: ignore
+
+    def dict_usage(self) -> List[Tuple[str, ProviderDesc, int]]:
+        """List the language dictionaries loaded by this broker.
+
+        Each entry in the list is a three-tuple of the form:
+
+            (tag,provider,size)
+
+        where `size` is the estimated number of bytes of memory taken by
+        the dictionary, or zero if unknown.  Sizes are only measured for
+        dictionaries loaded while there is a budget.  When there is one,
+        the least recently used dictionaries come first.
+        """
+        res = []
+        for dict, size in self._lru.items():
+            handle = self._get_dict_handle(dict)
+            res.append((handle.tag, handle.provider, size))
+        return res
+
+    def _touch(self, dict: "_e.t_dict") -> None:
+        """Record the use of a dictionary, for the budget."""
+        try:
+            self._lru.move_to_end(dict)
+        except KeyError:
+            pass
+
+    def _enforce_budget(self, keep: "Optional[_e.t_dict]" = None) -> None:
+        """Unload dictionaries until the budget is respected."""
+        if not self._budgeted or self._this is None:
+            return
+        pinned = {d._this for d in self._preloaded.values()}
+        pinned.add(keep)
+        candidates = []
+        for dict in self._lru:
+            handle = self._dict_handles.get(dict)
+            if dict in pinned or handle is None:
+                continue
+            if handle.generation or handle.replacements:
+                continue
+            candidates.append(dict)
+        count = len(self._lru)
+        nbytes = sum(self._lru.values())
+        for dict in candidates:
+            if (self._max_dicts is None or count <= self._max_dicts) and (
+                self._max_bytes is None or nbytes <= self._max_bytes
+            ):
+                break
+            count -= 1
+            nbytes -= self._lru[dict]
+            self._evict(dict)
+
+    def _evict(self, dict: "_e.t_dict") -> None:
+        """Unload a dictionary, to be loaded again by the objects using it."""
+        for d in list(self._dicts):
+            if d._this == dict:
+                d._this = None
+                d._evicted = True
+        while dict in self._live_dicts:
+            self._free_dict_data(dict)
+        self.evictions += 1
+
     def _raise_error(
         self, default: str = "Unspecified Error", eclass: Type[Error] = Error
     ) -> NoReturn:
@@ -259,6 +530,8 @@ class Broker(_EnchantObject):
                     count -= 1
             _e.broker_free(self._this)
             self._this = None
+            self._dict_handles.clear()
+            self.refresh()
 
     def request_dict(self, tag: str = None) -> "Dict":
         """Request a :py:class:`Dict` object for the language specified by `tag`.
@@ -282,13 +555,18 @@ class Broker(_EnchantObject):
 
     request_dict._DOC_ERRORS = ["fr"]  # type: ignore
 
-    def _request_dict_data(self, tag: str) -> _e.t_dict:
+    def _request_dict_data(self, tag: str) -> "_e.t_dict":
         """Request raw C pointer data for a dictionary.
 
         This method call passes on the call to the C library, and does
         some internal bookkeeping.
         """
         self._check_this()
+        # Measure the memory taken when there is a budget, unless the
+        # dictionary is known to be loaded already.
+        start = None
+        if self._budgeted and self._loaded_tags.get(tag) not in self._live_dicts:
+            start = _resident_bytes()
         new_dict = _e.broker_request_dict(self._this, tag.encode())
         if new_dict is None:
             e_str = "Dictionary for language '%s' could not be found\n"
@@ -296,6 +574,14 @@ class Broker(_EnchantObject):
             self._raise_error(e_str % (tag,), DictNotFoundError)
         if new_dict not in self._live_dicts:
             self._live_dicts[new_dict] = 1
+            size = 0
+            if start is not None:
+                end = _resident_bytes()
+                if end is not None:
+                    size = max(end - start, 0)
+            self._lru[new_dict] = size
+            self._loaded_tags[tag] = new_dict
+            self._enforce_budget(new_dict)
         else:
             self._live_dicts[new_dict] += 1
         return new_dict
@@ -308,6 +594,14 @@ class Broker(_EnchantObject):
         referencing a personal word list.  A personal word list is a file
         of custom dictionary entries, one word per line.
         """
+        new_dict = self._request_pwl_dict_data(pwl)
+        d = Dict(False)
+        d._switch_this(new_dict, self)
+        d._pwl = pwl
+        return d
+
+    def _request_pwl_dict_data(self, pwl: str) -> "_e.t_dict":
+        """Request raw C pointer data for a personal word list."""
         self._check_this()
         new_dict = _e.broker_request_pwl_dict(self._this, pwl.encode())
         if new_dict is None:
@@ -317,9 +611,7 @@ class Broker(_EnchantObject):
             self._live_dicts[new_dict] = 1
         else:
             self._live_dicts[new_dict] += 1
-        d = Dict(False)
-        d._switch_this(new_dict, self)
-        return d
+        return new_dict
 
     def _free_dict(self, dict: "Dict") -> None:
         """Free memory associated with a dictionary.
@@ -332,13 +624,43 @@ class Broker(_EnchantObject):
         dict._this = None
         dict._broker = None
 
-    def _free_dict_data(self, dict: _e.t_dict) -> None:
+    def _free_dict_data(self, dict: "_e.t_dict") -> None:
         """Free the underlying pointer for a dict."""
         self._check_this()
         _e.broker_free_dict(self._this, dict)
         self._live_dicts[dict] -= 1
         if self._live_dicts[dict] == 0:
             del self._live_dicts[dict]
+            self._dict_handles.pop(dict, None)
+            self._lru.pop(dict, None)
+
+    def _get_dict_handle(self, dict: "_e.t_dict") -> _DictHandle:
+        """Get the shared information for a live dictionary pointer."""
+        try:
+            return self._dict_handles[dict]
+        except KeyError:
+            pass
+        tag, name, desc, file = self.__describe_dict(dict)
+        handle = _DictHandle(tag, ProviderDesc(name, desc, file))
+        self._dict_handles[dict] = handle
+        return handle
+
+    def refresh(self) -> None:
+        """Forget what is known about the available dictionaries.
+
+        The results of :py:meth:`dict_exists`, :py:meth:`describe`,
+        :py:meth:`list_dicts` and :py:meth:`list_languages` are remembered
+        by the broker.  Call this method when dictionaries or providers may
+        have been installed or removed since, so that they are looked up
+        again.  It is called automatically by :py:meth:`set_ordering` and
+        :py:meth:`set_param`.
+        """
+        self._dict_exists_cache = {}
+        self._describe_cache = None  # type: Optional[List[ProviderDesc]]
+        self._list_dicts_cache = None  # type: Optional[List[Tuple[str, ProviderDesc]]]
+        self._list_languages_cache = None  # type: Optional[List[str]]
+
+    refresh._DOC_ERRORS = ["param"]  # type: ignore
 
     def dict_exists(self, tag: str) -> bool:
         """Check availability of a dictionary.
@@ -347,9 +669,14 @@ class Broker(_EnchantObject):
         the language specified by `tag`.  It returns `True` if a dictionary
         is available, and `False` otherwise.
         """
+        try:
+            return self._dict_exists_cache[tag]
+        except KeyError:
+            pass
         self._check_this()
-        val = _e.broker_dict_exists(self._this, tag.encode())
-        return bool(val)
+        val = bool(_e.broker_dict_exists(self._this, tag.encode()))
+        self._dict_exists_cache[tag] = val
+        return val
 
     def set_ordering(self, tag: str, ordering: str) -> None:
         """Set dictionary preferences for a language.
@@ -365,6 +692,8 @@ class Broker(_EnchantObject):
         """
         self._check_this()
         _e.broker_set_ordering(self._this, tag.encode(), ordering.encode())
+        self._orderings[tag] = ordering
+        self.refresh()
 
     def describe(self) -> List[ProviderDesc]:
         """Return list of provider descriptions.
@@ -373,10 +702,12 @@ class Broker(_EnchantObject):
         dictionary providers available.  Each entry in the list is a
         :py:class:`ProviderDesc` object.
         """
-        self._check_this()
-        self.__describe_result = []
-        _e.broker_describe(self._this, self.__describe_callback)
-        return [ProviderDesc(*r) for r in self.__describe_result]
+        if self._describe_cache is None:
+            self._check_this()
+            self.__describe_result = []
+            _e.broker_describe(self._this, self.__describe_callback)
+            self._describe_cache = [ProviderDesc(*r) for r in self.__describe_result]
+        return list(self._describe_cache)
 
     def __describe_callback(self, name: bytes, desc: bytes, file: bytes) -> None:
         """Collector callback for dictionary description.
@@ -402,10 +733,14 @@ class Broker(_EnchantObject):
         `provider` is a :py:class:`ProviderDesc` object describing the provider
         through which that dictionary can be obtained.
         """
-        self._check_this()
-        self.__list_dicts_result = []
-        _e.broker_list_dicts(self._this, self.__list_dicts_callback)
-        return [(r[0], ProviderDesc(*r[1])) for r in self.__list_dicts_result]
+        if self._list_dicts_cache is None:
+            self._check_this()
+            self.__list_dicts_result = []
+            _e.broker_list_dicts(self._this, self.__list_dicts_callback)
+            self._list_dicts_cache = [
+                (r[0], ProviderDesc(*r[1])) for r in self.__list_dicts_result
+            ]
+        return list(self._list_dicts_cache)
 
     def __list_dicts_callback(self, tag, name, desc, file):
         """Collector callback for listing dictionaries.
@@ -426,11 +761,15 @@ class Broker(_EnchantObject):
         This function returns a list of language tags for which a
         dictionary is available.
         """
-        langs = []
-        for tag, prov in self.list_dicts():
-            if tag not in langs:
-                langs.append(tag)
-        return langs
+        if self._list_languages_cache is None:
+            langs = []
+            seen = set()
+            for tag, prov in self.list_dicts():
+                if tag not in seen:
+                    seen.add(tag)
+                    langs.append(tag)
+            self._list_languages_cache = langs
+        return list(self._list_languages_cache)
 
     def __describe_dict(self, dict_data):
         """Get the description tuple for a dict data object.
@@ -487,6 +826,7 @@ class Broker(_EnchantObject):
         if value is not None:
             value = value.encode()
         _e.broker_set_param(self._this, name, value)
+        self.refresh()
 
 
 class Dict(_EnchantObject):
@@ -501,7 +841,9 @@ class Dict(_EnchantObject):
     The important methods of this class include:
 
         * :py:meth:`check()`:              check whether a word is spelled correctly
+        * :py:meth:`check_many()`:         check the spelling of many words at once
         * :py:meth:`suggest()`:            suggest correct spellings for a word
+        * :py:meth:`suggest_many()`:       suggest spellings for many words at once
         * :py:meth:`add()`:                add a word to the user's personal dictionary
         * :py:meth:`remove()`:             add a word to the user's personal exclude list
         * :py:meth:`add_to_session()`:     add a word to the current spellcheck session
@@ -513,8 +855,17 @@ class Dict(_EnchantObject):
         * :py:attr:`tag`:        the language tag of the dictionary
         * :py:attr:`provider`:   a :py:class:`ProviderDesc` object for the dictionary provider
 
+    The results of :py:meth:`check()` can be remembered by calling
+    :py:meth:`enable_check_cache()`.  The cache is then available as the
+    :py:attr:`check_cache` attribute.
+
+    The results of :py:meth:`suggest()` are remembered if the
+    :py:attr:`suggestion_cache` attribute is set to a
+    :py:class:`~enchant.cache.SuggestionCache` object.
     """
 
+    _DOC_ERRORS = ["SuggestionCache"]
+
     def __init__(
         self, tag: Optional[str] = None, broker: Optional[Broker] = None
     ) -> None:
@@ -537,6 +888,12 @@ class Dict(_EnchantObject):
         """
         # Initialise misc object attributes to None
         self.provider = None
+        self.check_cache = None  # type: Optional[LRUCache]
+        self._check_cache_token = None  # type: Any
+        self.suggestion_cache = None  # type: Optional[SuggestionCache]
+        self._handle = None  # type: Optional[_DictHandle]
+        # Whether the dictionary was unloaded by the broker, to save memory
+        self._evicted = False
         # If no tag was given, use the default language
         if tag is None:
             tag = get_default_language()
@@ -547,7 +904,7 @@ class Dict(_EnchantObject):
         self.tag = tag
         # If no broker was given, use the default broker
         if broker is None:
-            broker = _broker
+            broker = _get_default_broker()
         self._broker = broker
         # Now let the superclass initialise the C-library object
         super().__init__()
@@ -556,6 +913,7 @@ class Dict(_EnchantObject):
         # Create dead object if False was given as the tag.
         # Otherwise, use the broker to get C-library pointer data.
         self._this = None
+        self._evicted = False
         if self.tag:
             this = self._broker._request_dict_data(self.tag)
             self._switch_this(this, self._broker)
@@ -586,10 +944,12 @@ class Dict(_EnchantObject):
         # Hook in the new stuff
         self._this = this
         self._broker = broker
-        # Update object properties
-        desc = self.__describe(check_this=False)
-        self.tag = desc[0]
-        self.provider = ProviderDesc(*desc[1:])
+        # Update object properties, described once per C-library pointer
+        handle = broker._get_dict_handle(this)
+        self.tag = handle.tag
+        self.provider = handle.provider
+        self._handle = handle
+        broker._dicts.add(self)
 
     _switch_this._DOC_ERRORS = ["init"]  # type: ignore
 
@@ -599,9 +959,19 @@ class Dict(_EnchantObject):
         It is possible for the managing Broker object to be freed without
         freeing the `Dict`.  Thus validity checking must take into account
         `self._broker._this` as well as `self._this`.
+
+        A dictionary unloaded by the broker to stay within its budget is
+        loaded again.
         """
-        if self._broker is None or self._broker._this is None:
+        broker = self._broker
+        if broker is None or broker._this is None:
             self._this = None
+        elif self._this is None:
+            if self._evicted:
+                self._evicted = False
+                self._switch_this(broker._request_dict_data(self.tag), broker)
+        elif broker._budgeted:
+            broker._touch(self._this)
         super()._check_this(msg)
 
     def _raise_error(
@@ -626,12 +996,91 @@ class Dict(_EnchantObject):
             if self._broker is not None and self._broker._this is not None:
                 self._broker._free_dict(self)
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        # The new C-library object will not share the session of this one
+        state["_handle"] = None
+        state["_check_cache_token"] = None
+        if self.check_cache is not None:
+            state["check_cache"] = LRUCache(self.check_cache.maxsize)
+        cache = self.suggestion_cache
+        if cache is not None:
+            state["suggestion_cache"] = SuggestionCache(
+                cache.maxsize, cache.max_bytes, cache.ttl
+            )
+        return state
+
+    def enable_check_cache(self, maxsize: int = 10000) -> None:
+        """Remember the results of :py:meth:`check()` for later calls.
+
+        Up to `maxsize` words are remembered, discarding the least recently
+        checked ones when there are more.  Adding or removing words, or
+        changing the session lists, clears the cache, including when done
+        through another object sharing the same dictionary.  Changes made
+        to the personal word lists by other programs are not noticed.
+
+        The cache is available as the :py:attr:`check_cache` attribute,
+        which counts how often a word was found in it or not.
+        """
+        self.check_cache = LRUCache(maxsize)
+        self._check_cache_token = None
+
+    enable_check_cache._DOC_ERRORS = ["maxsize"]  # type: ignore
+
+    def disable_check_cache(self) -> None:
+        """Stop remembering the results of :py:meth:`check()`."""
+        self.check_cache = None
+        self._check_cache_token = None
+
+    def _cache_token(self) -> Any:
+        """Get a value changing each time the accepted words may change."""
+        return self._handle.generation
+
+    def _suggest_state(self) -> Any:
+        """Get a value identifying what the suggestions may depend on."""
+        handle = self._handle
+        # Dictionaries for personal word lists all share the same tag and
+        # provider, but differ in the file they read.
+        pwl = getattr(self, "_pwl", None)
+        if pwl is not None:
+            pwl = os.path.abspath(pwl)
+        key = (self.tag, self.provider, pwl)
+        if handle.generation or handle.replacements:
+            # Only this dictionary knows about the changes
+            key += (handle, handle.generation, handle.replacements)
+        return key
+
+    def _changed(self) -> None:
+        """Record that the set of accepted words may have changed."""
+        self._handle.generation += 1
+
+    def _get_check_cache(self) -> LRUCache:
+        """Get the check cache, emptied if it may be out of date."""
+        self._check_this()
+        cache = self.check_cache
+        token = self._cache_token()
+        if token != self._check_cache_token:
+            cache.clear()
+            self._check_cache_token = token
+        return cache
+
     def check(self, word: str) -> bool:
         """Check spelling of a word.
 
         This method takes a word in the dictionary language and returns
         `True` if it is correctly spelled, and `False` otherwise.
         """
+        if self.check_cache is None:
+            return self._check(word)
+        cache = self._get_check_cache()
+        val = cache.get(word)
+        if val is None:
+            val = self._check(word)
+            cache.put(word, val)
+        return val
+
+    def _check(self, word: str) -> bool:
+        """Check spelling of a word, bypassing the check cache."""
         self._check_this()
         # Enchant asserts that the word is non-empty.
         # Check it up-front to avoid nasty warnings on stderr.
@@ -644,29 +1093,158 @@ class Dict(_EnchantObject):
             return False
         self._raise_error()
 
-    def suggest(self, word: str) -> List[str]:
+    def check_many(self, words: Iterable[str]) -> bytearray:
+        """Check spelling of many words at once.
+
+        This method takes a sequence of words in the dictionary language
+        and returns a `bytearray` aligned with it, holding 1 for each word
+        that is correctly spelled and 0 for each word that is not.
+
+        The result is the same as calling :py:meth:`check` on each word in
+        turn, but the per-word overhead of doing so is paid only once.
+        """
+        if self.check_cache is None:
+            return self._check_many(words)
+        cache = self._get_check_cache()
+        words = list(words)
+        res = bytearray(len(words))
+        missing = {}  # type: dict
+        for i, word in enumerate(words):
+            val = cache.get(word)
+            if val is None:
+                missing.setdefault(word, []).append(i)
+            else:
+                res[i] = val
+        if missing:
+            vals = self._check_many(list(missing))
+            for (word, indexes), val in zip(missing.items(), vals):
+                cache.put(word, bool(val))
+                for i in indexes:
+                    res[i] = val
+        return res
+
+    def _check_many(self, words: Iterable[str]) -> bytearray:
+        """Check spelling of many words, bypassing the check cache."""
+        self._check_this()
+        encoded = [w.encode() for w in words]
+        # Enchant asserts that the word is non-empty.
+        # Check it up-front to avoid nasty warnings on stderr.
+        if not all(encoded):
+            raise ValueError("can't check spelling of empty string")
+        vals = _e.dict_check_many(self._this, encoded)
+        if vals and min(vals) < 0:
+            self._raise_error()
+        return bytearray(val == 0 for val in vals)
+
+    check_many._DOC_ERRORS = ["bytearray"]  # type: ignore
+
+    def suggest(self, word: str, max_suggestions: Optional[int] = None) -> List[str]:
         """Suggest possible spellings for a word.
 
         This method tries to guess the correct spelling for a given
-        word, returning the possibilities in a list.
+        word, returning the possibilities in a list.  If `max_suggestions`
+        is given, at most that many suggestions are returned, the best
+        ones first.
         """
+        cache = self.suggestion_cache
+        if cache is None:
+            return self._suggest(word, max_suggestions)
+        self._check_this()
+        key = (self._suggest_state(), word, max_suggestions)
+        suggs = cache.get(key)
+        if suggs is None:
+            suggs = self._suggest(word, max_suggestions)
+            cache.put(key, suggs)
+        return suggs
+
+    def _suggest(self, word: str, max_suggestions: Optional[int] = None) -> List[str]:
+        """Suggest possible spellings for a word, bypassing the cache."""
         self._check_this()
         # Enchant asserts that the word is non-empty.
         # Check it up-front to avoid nasty warnings on stderr.
         if len(word) == 0:
             raise ValueError("can't suggest spellings for empty string")
-        suggs = _e.dict_suggest(self._this, word.encode())
-        return [w.decode() for w in suggs]
+        suggs = _e.dict_suggest(self._this, word.encode(), max_suggestions)
+        if not suggs:
+            return []
+        # Decode all the suggestions at once
+        return b"\0".join(suggs).decode().split("\0")
+
+    def suggest_many(
+        self,
+        words: Iterable[str],
+        max_workers: Optional[int] = None,
+        timings: Optional[List[float]] = None,
+    ) -> List[List[str]]:
+        """Suggest possible spellings for many words at once.
+
+        This method returns a list holding the result of :py:meth:`suggest`
+        for each of the given words, in the same order.  The words are
+        spread over a pool of up to `max_workers` threads (by default, one
+        per processor).  Since the C library is not thread-safe, each
+        thread uses its own dictionary object, loaded through a broker
+        configured in the same way as the one owning this dictionary.
+
+        Loading those dictionaries has a cost, so this pays off for large
+        batches of words.  Words added to the session of this dictionary
+        are not seen by the worker threads.
+
+        If `timings` is given, it must be a list; the time taken to
+        compute the suggestions for each word, in seconds, is appended
+        to it in the same order as the words.
+        """
+        self._check_this()
+        words = list(words)
+        # Enchant asserts that the word is non-empty.
+        # Check it up-front to avoid nasty warnings on stderr.
+        if not all(words):
+            raise ValueError("can't suggest spellings for empty string")
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(words))
+        if max_workers <= 1 or not self._broker.dict_exists(self.tag):
+            # Nothing to gain, or no way to load an independent copy
+            # of this dictionary (e.g. for a personal word list).
+            results = [_timed_call(Dict._suggest, self, w) for w in words]
+        else:
+            # Imported here as it is slow to import, and rarely needed.
+            from concurrent.futures import ThreadPoolExecutor
+
+            local = threading.local()
+            workers = []  # type: List[Dict]
+            lock = threading.Lock()
+
+            def init_worker() -> None:
+                local.dict = Dict(self.tag, self._broker._sibling())
+                with lock:
+                    workers.append(local.dict)
+
+            def suggest(word: str) -> Tuple[List[str], float]:
+                return _timed_call(Dict._suggest, local.dict, word)
+
+            try:
+                with ThreadPoolExecutor(max_workers, initializer=init_worker) as ex:
+                    results = list(ex.map(suggest, words))
+            finally:
+                for d in workers:
+                    broker = d._broker
+                    d._free()
+                    broker._free()
+        if timings is not None:
+            timings.extend(t for (_, t) in results)
+        return [suggs for (suggs, _) in results]
 
     def add(self, word: str) -> None:
         """Add a word to the user's personal word list."""
         self._check_this()
         _e.dict_add(self._this, word.encode())
+        self._changed()
 
     def remove(self, word: str) -> None:
         """Add a word to the user's personal exclude list."""
         self._check_this()
         _e.dict_remove(self._this, word.encode())
+        self._changed()
 
     def add_to_pwl(self, word: str) -> None:
         """Add a word to the user's personal word list."""
@@ -677,16 +1255,19 @@ class Dict(_EnchantObject):
         )
         self._check_this()
         _e.dict_add_to_pwl(self._this, word.encode())
+        self._changed()
 
     def add_to_session(self, word: str) -> None:
         """Add a word to the session personal list."""
         self._check_this()
         _e.dict_add_to_session(self._this, word.encode())
+        self._changed()
 
     def remove_from_session(self, word: str) -> None:
         """Add a word to the session exclude list."""
         self._check_this()
         _e.dict_remove_from_session(self._this, word.encode())
+        self._changed()
 
     def is_added(self, word: str) -> bool:
         """Check whether a word is in the personal word list."""
@@ -712,42 +1293,10 @@ class Dict(_EnchantObject):
             raise ValueError("can't store empty string as a replacement")
         self._check_this()
         _e.dict_store_replacement(self._this, mis.encode(), cor.encode())
+        self._handle.replacements += 1
 
     store_replacement._DOC_ERRORS = ["mis", "mis"]  # type: ignore
 
-    def __describe(self, check_this: bool = True) -> Tuple[str, str, str, str]:
-        """Return a tuple describing the dictionary.
-
-        This method returns a four-element tuple describing the underlying
-        spellchecker system providing the dictionary.  It will contain the
-        following strings:
-
-            * language tag
-            * name of dictionary provider
-            * description of dictionary provider
-            * dictionary file
-
-        Direct use of this method is not recommended - instead, access this
-        information through the attributes :py:attr:`tag` and :py:attr:`provider`.
-        """
-        if check_this:
-            self._check_this()
-        _e.dict_describe(self._this, self.__describe_callback)
-        return self.__describe_result
-
-    def __describe_callback(self, tag, name, desc, file):
-        """Collector callback for dictionary description.
-
-        This method is used as a callback into the `_enchant` function
-        `enchant_dict_describe`.  It collects the given arguments in
-        a tuple and stores them in the attribute :py:attr:`__describe_result`.
-        """
-        tag = tag.decode()
-        name = name.decode()
-        desc = desc.decode()
-        file = file.decode()
-        self.__describe_result = (tag, name, desc, file)
-
 
 class DictWithPWL(Dict):
     """Dictionary with separately-managed personal word list.
@@ -771,6 +1320,13 @@ class DictWithPWL(Dict):
     This will prevent calls to :py:meth:`add()` and :py:meth:`remove()` from affecting the user's
     default word lists.
 
+    The suggestions given by :py:meth:`suggest()` are those of the
+    dictionary, in the order given by the dictionary, followed by those
+    from the personal word list which are not already present.  Words of
+    the exclude list are left out.  When `max_suggestions` is given, the
+    personal word list is only searched if the dictionary does not give
+    enough suggestions.
+
     The `Dict` object managing the PWL is available as the :py:attr:`pwl` attribute.
     The `Dict` object managing the PEL is available as the :py:attr:`pel` attribute.
 
@@ -793,6 +1349,9 @@ class DictWithPWL(Dict):
         exclude list.  If this file does not exist, it is created with
         default permissions.
         """
+        # Sets of the words in the in-memory word lists, along with the
+        # identity and generation of the list they were taken from.
+        self._snapshots = {}  # type: dict
         super().__init__(tag, broker)
         if pwl is not None:
             if not os.path.exists(pwl):
@@ -833,33 +1392,175 @@ class DictWithPWL(Dict):
             self.pel = None
         super()._free()
 
-    def check(self, word: str) -> bool:
-        """Check spelling of a word.
+    def _cache_token(self) -> Any:
+        """Extend :py:meth:`Dict._cache_token()` to cover the word lists."""
+        return (
+            super()._cache_token(),
+            self.pwl._cache_token(),
+            self.pel._cache_token(),
+        )
 
-        This method takes a word in the dictionary language and returns
-        `True` if it is correctly spelled, and `False` otherwise.  It checks
-        both the dictionary and the personal word list.
+    def _words_of(self, name: str) -> Optional[Set[str]]:
+        """Get the set of words in the `pwl` or `pel` word list.
+
+        This is only available for in-memory word lists, as other ones
+        may be changed behind our back.  `None` is returned for them.
+        """
+        wordlist = getattr(self, name)
+        if not isinstance(wordlist, PyPWL):
+            return None
+        snapshot = self._snapshots.get(name)
+        state = (wordlist._identity, wordlist._generation)
+        if snapshot is None or snapshot[0] != state:
+            snapshot = (state, set(wordlist._words))
+            self._snapshots[name] = snapshot
+        return snapshot[1]
+
+    _words_of._DOC_ERRORS = ["pel"]  # type: ignore
+
+    def _edit(self, name: str, method: str, word: str) -> None:
+        """Add or remove a word from the `pwl` or `pel` word list.
+
+        The set of words of an in-memory word list is updated along with
+        it, rather than taken anew.
+        """
+        wordlist = getattr(self, name)
+        snapshot = self._snapshots.get(name)
+        getattr(wordlist, method)(word)
+        if (
+            snapshot is not None
+            and isinstance(wordlist, PyPWL)
+            and snapshot[0] == (wordlist._identity, wordlist._generation - 1)
+        ):
+            if method == "remove":
+                snapshot[1].discard(word)
+            else:
+                snapshot[1].add(word)
+            state = (wordlist._identity, wordlist._generation)
+            self._snapshots[name] = (state, snapshot[1])
+
+    _edit._DOC_ERRORS = ["pel"]  # type: ignore
+
+    def _check(self, word: str) -> bool:
+        """Check spelling of a word, bypassing the check cache.
+
+        Both the dictionary and the personal word lists are checked.
         """
-        if self.pel.check(word):
+        self._check_this()
+        excluded = self._words_of("pel")
+        if word in excluded if excluded is not None else self.pel.check(word):
             return False
-        if self.pwl.check(word):
+        added = self._words_of("pwl")
+        if word in added if added is not None else self.pwl.check(word):
             return True
-        if super().check(word):
+        if super()._check(word):
             return True
         return False
 
-    def suggest(self, word: str) -> List[str]:
-        """Suggest possible spellings for a word.
+    def _check_many(self, words: Iterable[str]) -> bytearray:
+        """Check spelling of many words, bypassing the check cache.
 
-        This method tries to guess the correct spelling for a given
-        word, returning the possibilities in a list.
+        Only words not settled by the personal word list or the exclude
+        list are passed on to the dictionary.
         """
-        suggs = super().suggest(word)
-        suggs.extend([w for w in self.pwl.suggest(word) if w not in suggs])
-        for i in range(len(suggs) - 1, -1, -1):
-            if self.pel.check(suggs[i]):
-                del suggs[i]
-        return suggs
+        self._check_this()
+        words = list(words)
+        res = bytearray(len(words))
+        todo = []
+        pel_words = self._words_of("pel")
+        pwl_words = self._words_of("pwl")
+        if pel_words is not None and pwl_words is not None:
+            for i, word in enumerate(words):
+                if word in pel_words:
+                    continue
+                if word in pwl_words:
+                    res[i] = 1
+                else:
+                    todo.append(i)
+        else:
+            excluded = self.pel.check_many(words)
+            added = self.pwl.check_many(words)
+            for i in range(len(words)):
+                if excluded[i]:
+                    continue
+                if added[i]:
+                    res[i] = 1
+                else:
+                    todo.append(i)
+        if todo:
+            vals = super()._check_many([words[i] for i in todo])
+            for i, val in zip(todo, vals):
+                res[i] = val
+        return res
+
+    def _suggest_state(self) -> Any:
+        """Extend :py:meth:`Dict._suggest_state()` to cover the word lists."""
+        return (
+            super()._suggest_state(),
+            self.pwl._suggest_state(),
+            self.pel._suggest_state(),
+        )
+
+    def _suggest(self, word: str, max_suggestions: Optional[int] = None) -> List[str]:
+        """Suggest possible spellings for a word, bypassing the cache.
+
+        The suggestions from the dictionary are completed using the
+        personal word list, and filtered using the exclude list.
+        """
+        self._check_this()
+        excluded = self._words_of("pel")
+        if excluded is not None and not excluded:
+            # Nothing to filter out, so only the best ones are needed
+            suggs = super()._suggest(word, max_suggestions)
+        else:
+            suggs = super()._suggest(word)
+        return self._complete_suggestions(word, suggs, max_suggestions)
+
+    def _complete_suggestions(
+        self, word: str, suggs: List[str], max_suggestions: Optional[int] = None
+    ) -> List[str]:
+        """Merge and filter the suggestions for `word` from the dictionary.
+
+        Duplicates and excluded words are removed, keeping the order of
+        the dictionary.  If there are less than `max_suggestions` left,
+        suggestions from the personal word list are appended.
+        """
+        res = self._exclude(dict.fromkeys(suggs))
+        if max_suggestions is None or len(res) < max_suggestions:
+            seen = set(res)
+            more = (w for w in self.pwl.suggest(word) if w not in seen)
+            res.extend(self._exclude(dict.fromkeys(more)))
+        return res[:max_suggestions]
+
+    def _exclude(self, words: Iterable[str]) -> List[str]:
+        """Remove the words of the exclude list from `words`."""
+        excluded = self._words_of("pel")
+        if excluded is not None:
+            return [w for w in words if w not in excluded]
+        words = list(words)
+        if not words:
+            return words
+        return [w for w, flag in zip(words, self.pel.check_many(words)) if not flag]
+
+    def suggest_many(
+        self,
+        words: Iterable[str],
+        max_workers: Optional[int] = None,
+        timings: Optional[List[float]] = None,
+    ) -> List[List[str]]:
+        """Suggest possible spellings for many words at once.
+
+        This method behaves as :py:meth:`Dict.suggest_many`, with the
+        suggestions for each word completed using the personal word list
+        and filtered using the exclude list as in :py:meth:`suggest`.
+        Only the dictionary queries are spread over several threads.
+        """
+        words = list(words)
+        results = super().suggest_many(words, max_workers, timings)
+        return [
+            self._complete_suggestions(word, suggs)
+            for (word, suggs) in zip(words, results)
+        ]
 
     def add(self, word: str) -> None:
         """Add a word to the associated personal word list.
@@ -868,14 +1569,14 @@ class DictWithPWL(Dict):
         automatically saves the list to disk.
         """
         self._check_this()
-        self.pwl.add(word)
-        self.pel.remove(word)
+        self._edit("pwl", "add", word)
+        self._edit("pel", "remove", word)
 
     def remove(self, word: str) -> None:
         """Add a word to the associated exclude list."""
         self._check_this()
-        self.pwl.remove(word)
-        self.pel.add(word)
+        self._edit("pwl", "remove", word)
+        self._edit("pel", "add", word)
 
     def add_to_pwl(self, word: str) -> None:
         """Add a word to the associated personal word list.
@@ -884,8 +1585,8 @@ class DictWithPWL(Dict):
         automatically saves the list to disk.
         """
         self._check_this()
-        self.pwl.add_to_pwl(word)
-        self.pel.remove(word)
+        self._edit("pwl", "add_to_pwl", word)
+        self._edit("pel", "remove", word)
 
     def is_added(self, word: str) -> bool:
         """Check whether a word is in the personal word list."""
@@ -898,22 +1599,519 @@ class DictWithPWL(Dict):
         return self.pel.is_added(word)
 
 
-##  Create a module-level default broker object, and make its important
-##  methods available at the module level.
-_broker = Broker()
-request_dict = _broker.request_dict
-request_pwl_dict = _broker.request_pwl_dict
-dict_exists = _broker.dict_exists
-list_dicts = _broker.list_dicts
-list_languages = _broker.list_languages
-get_param = _broker.get_param
-set_param = _broker.set_param
+class DictPool:
+    """Pool of dictionaries for a single language, shared between threads.
+
+    The dictionary objects of the C library must not be used by several
+    threads at once.  A `DictPool` holds up to `size` independent
+    :py:class:`Dict` objects for the language `tag` (by default, one per
+    processor) and lends them out to one thread at a time::
+
+        >>> pool = enchant.DictPool("en_US")
+        >>> with pool.acquire() as d:
+        ...     d.check("hello")
+        True
+
+    Since a broker hands out a single dictionary per language, each
+    dictionary of the pool is loaded through a broker of its own,
+    configured in the same way as `broker` (by default, the default
+    broker).  If all of them are in use, :py:meth:`acquire()` waits until
+    one is given back.  A thread is lent the dictionary it used last
+    whenever it is available.
+
+    The methods :py:meth:`check()`, :py:meth:`check_many()` and
+    :py:meth:`suggest()` borrow a dictionary for the duration of a
+    single call.
+
+    Words added or removed using the methods of the pool are seen by all
+    of its dictionaries: the change is made on one of them, and replayed
+    as a session change on the others before they are next lent out.
+    Changes made directly on a borrowed dictionary are only seen by that
+    dictionary.
+    """
+
+    # How changes made on one dictionary are replayed on the others
+    _REPLAY = {
+        "add": "add_to_session",
+        "remove": "remove_from_session",
+        "add_to_session": "add_to_session",
+        "remove_from_session": "remove_from_session",
+    }
+
+    def __init__(
+        self,
+        tag: Optional[str] = None,
+        size: Optional[int] = None,
+        broker: Optional[Broker] = None,
+    ) -> None:
+        """DictPool constructor.
+
+        If `tag` is not given or is `None`, the language currently in use
+        is determined as for :py:class:`Dict`.  One dictionary is loaded
+        straight away, so that :py:exc:`~.errors.DictNotFoundError` is
+        raised if there is no dictionary for the language.
+        """
+        if tag is None:
+            tag = get_default_language()
+            if tag is None:
+                raise Error(
+                    "No tag specified and default language could not be determined."
+                )
+        if size is None:
+            size = os.cpu_count() or 1
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if broker is None:
+            broker = _get_default_broker()
+        self.tag = tag
+        self.size = size
+        self._broker = broker
+        self._lock = threading.Condition()
+        self._local = threading.local()
+        # Number of dictionaries loaded, whether idle or lent out
+        self._count = 0
+        self._idle = []  # type: List[Dict]
+        # Changes made through the pool, and how many of them have been
+        # applied to each of its dictionaries.
+        self._log = []  # type: List[Tuple[str, str]]
+        self._applied = {}  # type: dict
+        self._closed = False
+        self._idle.append(self._new_dict())
+        self._count = 1
+
+    def __enter__(self) -> "DictPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _new_dict(self) -> Dict:
+        """Load a new dictionary for the pool."""
+        broker = self._broker._sibling()
+        try:
+            d = Dict(self.tag, broker)
+        except Exception:
+            broker._free()
+            raise
+        with self._lock:
+            self._applied[id(d)] = 0
+        return d
+
+    def _free_dict(self, d: Dict) -> None:
+        """Free a dictionary of the pool along with its broker."""
+        broker = d._broker
+        d._free()
+        broker._free()
+
+    def _sync(self, d: Dict) -> None:
+        """Replay on `d` the changes it has not seen.  Needs the lock."""
+        for op, word in self._log[self._applied[id(d)] :]:
+            getattr(d, self._REPLAY[op])(word)
+        self._applied[id(d)] = len(self._log)
+
+    @contextlib.contextmanager
+    def acquire(self) -> Iterator[Dict]:
+        """Borrow a dictionary from the pool.
+
+        This method is a context manager giving a :py:class:`Dict` for the
+        exclusive use of the current thread until the end of the `with`
+        block.  It waits for a dictionary to become available if
+        necessary.
+        """
+        last = getattr(self._local, "dict", None)
+        d = None
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise Error("DictPool has been closed")
+                if self._idle:
+                    if last is not None and last in self._idle:
+                        d = last
+                        self._idle.remove(d)
+                    else:
+                        d = self._idle.pop()
+                    break
+                if self._count < self.size:
+                    self._count += 1
+                    break
+                self._lock.wait()
+        if d is None:
+            try:
+                d = self._new_dict()
+            except Exception:
+                with self._lock:
+                    self._count -= 1
+                    self._lock.notify()
+                raise
+        try:
+            with self._lock:
+                self._sync(d)
+            self._local.dict = d
+            yield d
+        finally:
+            with self._lock:
+                if self._closed:
+                    self._count -= 1
+                    del self._applied[id(d)]
+                    self._free_dict(d)
+                else:
+                    self._idle.append(d)
+                self._lock.notify()
+
+    def close(self) -> None:
+        """Free the dictionaries of the pool.
+
+        Dictionaries currently lent out are freed when they are given back.
+        """
+        with self._lock:
+            self._closed = True
+            for d in self._idle:
+                self._count -= 1
+                del self._applied[id(d)]
+                self._free_dict(d)
+            self._idle = []
+            self._lock.notify_all()
+
+    def _change(self, op: str, word: str) -> None:
+        """Make a change on one dictionary, and record it for the others."""
+        with self.acquire() as d:
+            with self._lock:
+                self._sync(d)
+                getattr(d, op)(word)
+                self._log.append((op, word))
+                self._applied[id(d)] = len(self._log)
+
+    def check(self, word: str) -> bool:
+        """Check spelling of a word, as :py:meth:`Dict.check` does."""
+        with self.acquire() as d:
+            return d.check(word)
+
+    def check_many(self, words: Iterable[str]) -> bytearray:
+        """Check spelling of many words, as :py:meth:`Dict.check_many` does."""
+        with self.acquire() as d:
+            return d.check_many(words)
+
+    def suggest(self, word: str, max_suggestions: Optional[int] = None) -> List[str]:
+        """Suggest possible spellings, as :py:meth:`Dict.suggest` does."""
+        with self.acquire() as d:
+            return d.suggest(word, max_suggestions)
+
+    def add(self, word: str) -> None:
+        """Add a word to the user's personal word list."""
+        self._change("add", word)
+
+    def remove(self, word: str) -> None:
+        """Add a word to the user's personal exclude list."""
+        self._change("remove", word)
+
+    def add_to_session(self, word: str) -> None:
+        """Add a word to the session personal list."""
+        self._change("add_to_session", word)
+
+    def remove_from_session(self, word: str) -> None:
+        """Add a word to the session exclude list."""
+        self._change("remove_from_session", word)
+
+
+class MultiDict:
+    """Dictionary accepting the words of any of several dictionaries.
+
+    This class is useful to spellcheck text mixing several languages::
+
+        >>> d = enchant.MultiDict(["en_US", "de_DE", "fr_FR"])
+        >>> d.check("Hund")
+        True
+
+    It can be used wherever a :py:class:`Dict` is expected, for example as
+    the dictionary of a :py:class:`~enchant.checker.SpellChecker`.  Its
+    `tag` attribute is that of the first dictionary, which is used to
+    choose how the text is split into words.
+
+    A word is correctly spelled if any of the dictionaries accepts it.  The
+    dictionary which last accepted a word is tried first, so that a run
+    of words in the same language takes a single check per word.
+
+    The dictionaries are asked for suggestions in parallel, and their
+    suggestions are merged.  Since the C library is not thread-safe, the
+    threads use copies of the dictionaries of their own, loaded through
+    brokers configured in the same way, and the suggestion caches of the
+    dictionaries are only used from the calling thread.  Dictionaries
+    which cannot be copied, such as personal word lists or those whose
+    session was changed, are asked in the calling thread.  Like a
+    :py:class:`Dict`, a `MultiDict` must not be used from several threads
+    at once, and neither must its dictionaries.  Suggestions are ranked by
+    their distance from the misspelled word, as computed by the function
+    given as the `distance` argument (by default
+    :py:func:`~enchant.utils.levenshtein`), and then by their position in
+    the suggestions of each dictionary.
+
+    Words added using :py:meth:`add()` or :py:meth:`add_to_session()` go
+    to the first dictionary, while words removed are removed from all of
+    them.  The dictionaries are available as the :py:attr:`dicts`
+    attribute.
+    """
+
+    _DOC_ERRORS = ["Hund", "levenshtein"]
+
+    def __init__(
+        self,
+        dicts: Iterable[Union[str, Dict]],
+        broker: Optional[Broker] = None,
+        distance: Optional[Callable[[str, str], int]] = None,
+    ) -> None:
+        """MultiDict constructor.
+
+        Each item of `dicts` is either a :py:class:`Dict` object, or a
+        language tag for which a dictionary is requested from `broker`
+        (by default, the default broker).
+        """
+        self.dicts = [
+            Dict(d, broker) if isinstance(d, str) else d for d in dicts
+        ]  # type: List[Dict]
+        if not self.dicts:
+            raise ValueError("MultiDict needs at least one dictionary")
+        self.tag = self.dicts[0].tag
+        self.provider = self.dicts[0].provider
+        if distance is None:
+            from enchant.utils import levenshtein as distance
+        self.distance = distance
+        # Index of the dictionary which last accepted a word
+        self._last = 0
+        self._executor = None  # type: Any
+        # The dictionary copies used by the threads, by index in `dicts`,
+        # along with the dictionary they are a copy of
+        self._copies = {}  # type: dict
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_copies"] = {}
+        return state
+
+    def __enter__(self) -> "MultiDict":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the threads used to compute suggestions, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for _, copy in self._copies.values():
+            if copy is not None:
+                broker = copy._broker
+                copy._free()
+                broker._free()
+        self._copies = {}
+
+    def _copy(self, i: int) -> Optional[Dict]:
+        """Get the copy of the `i`-th dictionary used by the threads.
+
+        `None` is returned if the dictionary cannot be copied, in which
+        case the calling thread uses it directly.
+        """
+        d = self.dicts[i]
+        handle = d._handle
+        if (
+            type(d) is not Dict
+            or getattr(d, "_pwl", None) is not None
+            or handle is None
+            or handle.generation
+            or handle.replacements
+        ):
+            # The copy would miss what sets the dictionary apart
+            return None
+        entry = self._copies.get(i)
+        if entry is None or entry[0] is not d:
+            copy = None
+            if d._broker.dict_exists(d.tag):
+                copy = Dict(d.tag, d._broker._sibling())
+            entry = self._copies[i] = (d, copy)
+        return entry[1]
+
+    def check(self, word: str) -> bool:
+        """Check whether any of the dictionaries accepts a word."""
+        dicts = self.dicts
+        last = self._last
+        if dicts[last].check(word):
+            return True
+        for i, d in enumerate(dicts):
+            if i != last and d.check(word):
+                self._last = i
+                return True
+        return False
+
+    def check_many(self, words: Iterable[str]) -> bytearray:
+        """Check spelling of many words, as :py:meth:`Dict.check_many` does.
+
+        Each dictionary is only asked about the words rejected by those
+        asked before it.
+        """
+        words = list(words)
+        res = bytearray(len(words))
+        todo = list(range(len(words)))
+        last = self._last
+        order = [last] + [i for i in range(len(self.dicts)) if i != last]
+        for i in order:
+            vals = self.dicts[i].check_many([words[j] for j in todo])
+            if any(vals):
+                self._last = i
+            rejected = []
+            for j, val in zip(todo, vals):
+                if val:
+                    res[j] = 1
+                else:
+                    rejected.append(j)
+            todo = rejected
+            if not todo:
+                break
+        return res
+
+    def suggest(self, word: str, max_suggestions: Optional[int] = None) -> List[str]:
+        """Suggest possible spellings for a word, from all the dictionaries.
+
+        At most `max_suggestions` suggestions are returned if it is given.
+        """
+        if len(self.dicts) == 1:
+            results = [self.dicts[0].suggest(word, max_suggestions)]
+        else:
+            results = self._suggest_all(word, max_suggestions)
+        ranked = {}  # type: dict
+        for i, suggs in enumerate(results):
+            for pos, sugg in enumerate(suggs):
+                if sugg not in ranked:
+                    ranked[sugg] = (self.distance(word, sugg), pos, i)
+        res = sorted(ranked, key=ranked.__getitem__)
+        if max_suggestions is not None:
+            del res[max_suggestions:]
+        return res
+
+    def _suggest_all(
+        self, word: str, max_suggestions: Optional[int]
+    ) -> List[List[str]]:
+        """Get the suggestions of each dictionary, using the threads."""
+        results = [[] for _ in self.dicts]  # type: List[List[str]]
+        futures = []
+        local = []
+        for i, d in enumerate(self.dicts):
+            copy = self._copy(i)
+            if copy is None:
+                local.append(i)
+                continue
+            key = None
+            if d.suggestion_cache is not None:
+                key = (d._suggest_state(), word, max_suggestions)
+                suggs = d.suggestion_cache.get(key)
+                if suggs is not None:
+                    results[i] = suggs
+                    continue
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._executor = ThreadPoolExecutor(len(self.dicts))
+            fut = self._executor.submit(Dict._suggest, copy, word, max_suggestions)
+            futures.append((i, key, fut))
+        for i in local:
+            results[i] = self.dicts[i].suggest(word, max_suggestions)
+        for i, key, fut in futures:
+            results[i] = fut.result()
+            cache = self.dicts[i].suggestion_cache
+            if key is not None and cache is not None:
+                cache.put(key, results[i])
+        return results
+
+    def add(self, word: str) -> None:
+        """Add a word to the personal word list of the first dictionary."""
+        self.dicts[0].add(word)
+
+    def remove(self, word: str) -> None:
+        """Add a word to the personal exclude list of all the dictionaries."""
+        for d in self.dicts:
+            d.remove(word)
+
+    def add_to_session(self, word: str) -> None:
+        """Add a word to the session list of the first dictionary."""
+        self.dicts[0].add_to_session(word)
+
+    def remove_from_session(self, word: str) -> None:
+        """Add a word to the session exclude list of all the dictionaries."""
+        for d in self.dicts:
+            d.remove_from_session(word)
+
+    def is_added(self, word: str) -> bool:
+        """Check whether a word was added to any of the dictionaries."""
+        return any(d.is_added(word) for d in self.dicts)
+
+    def is_removed(self, word: str) -> bool:
+        """Check whether a word was removed from any of the dictionaries."""
+        return any(d.is_removed(word) for d in self.dicts)
+
+    def store_replacement(self, mis: str, cor: str) -> None:
+        """Store a replacement spelling in all the dictionaries."""
+        for d in self.dicts:
+            d.store_replacement(mis, cor)
+
+
+##  A module-level default broker object is created on first use, and
+##  its important methods made available at the module level.
+_DEFAULT_BROKER_METHODS = (
+    "request_dict",
+    "request_pwl_dict",
+    "dict_exists",
+    "list_dicts",
+    "list_languages",
+    "get_param",
+    "set_param",
+)
+_default_broker_lock = threading.Lock()
+
+#  All the brokers in existence, to be fixed up after a fork
+_brokers = weakref.WeakSet()  # type: weakref.WeakSet[Broker]
+
+
+def _after_fork_in_child() -> None:
+    global _default_broker_lock
+    # The lock may have been held by another thread of the parent
+    _default_broker_lock = threading.Lock()
+    for broker in list(_brokers):
+        broker._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _get_default_broker() -> Broker:
+    """Return the module-level default broker, creating it if needed."""
+    broker = globals().get("_broker")
+    if broker is None:
+        with _default_broker_lock:
+            broker = globals().get("_broker")
+            if broker is None:
+                broker = Broker()
+                for name in _DEFAULT_BROKER_METHODS:
+                    globals()[name] = getattr(broker, name)
+                globals()["_broker"] = broker
+    return broker
+
+
+def __getattr__(name: str) -> Any:
+    if name == "_broker" or name in _DEFAULT_BROKER_METHODS:
+        _get_default_broker()
+        return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | {"_broker"} | set(_DEFAULT_BROKER_METHODS))
 
 
 #  Expose the "get_version" function.
 def get_enchant_version() -> str:
     """Get the version string for the underlying enchant library."""
-    return _e.get_version().decode()
+    return _load_lib().get_version().decode()
 
 
 #  Expose the "set_prefix_dir" function.
@@ -923,7 +2121,7 @@ def set_prefix_dir(path: str) -> None:
     Called automatically when the Python library is imported when
     required.
     """
-    return _e.set_prefix_dir(path)
+    return _load_lib().set_prefix_dir(path)
 
     set_prefix_dir._DOC_ERRORS = ["plugins"]
 
@@ -932,4 +2130,4 @@ def get_user_config_dir() -> str:
     """Return the path that will be used by some
     Enchant providers to look for custom dictionaries.
     """
-    return _e.get_user_config_dir().decode()
+    return _load_lib().get_user_config_dir().decode()
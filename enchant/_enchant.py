@@ -51,13 +51,16 @@ C API:
 
 import ctypes
 import ctypes.util
+import json
 import os
 import os.path
 import platform
 import sys
+import tempfile
 import textwrap
-from ctypes import CFUNCTYPE, POINTER, c_char_p, c_int, c_size_t, c_void_p, pointer
-from typing import Callable, List, Optional, TypeVar  # noqa F401
+from ctypes import CFUNCTYPE, POINTER, byref, c_char_p, c_int, c_size_t, c_void_p
+from itertools import repeat
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar  # noqa F401
 
 
 def from_prefix(prefix: str) -> str:
@@ -124,6 +127,91 @@ def from_system() -> Optional[str]:
     return None
 
 
+def find_cache_path() -> str:
+    if sys.platform == "win32":
+        cache_home = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+    return os.path.join(cache_home, "pyenchant", "find_cache.json")
+
+
+def find_cache_key() -> str:
+    # Anything that could change the outcome of the search
+    env = sorted(
+        (k, v)
+        for (k, v) in os.environ.items()
+        if k.startswith("PYENCHANT_")
+        and k not in ("PYENCHANT_VERBOSE_FIND", "PYENCHANT_NO_FIND_CACHE")
+    )
+    return json.dumps([sys.executable, sys.version, env])
+
+
+def library_stamp(library_path: str) -> Optional[float]:
+    # find_library() may return a bare soname, resolved by the dynamic
+    # loader through its cache: use that cache as a stand-in.
+    if not os.path.isabs(library_path):
+        library_path = "/etc/ld.so.cache"
+    try:
+        return os.stat(library_path).st_mtime
+    except OSError:
+        return None
+
+
+def read_find_cache() -> Dict[str, Dict]:
+    try:
+        with open(find_cache_path()) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return cache
+
+
+def write_find_cache(cache: Dict[str, Dict]) -> None:
+    path = find_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first, so that concurrent readers
+        # never see a partially written cache.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def from_system_cached() -> Optional[str]:
+    if os.environ.get("PYENCHANT_NO_FIND_CACHE"):
+        find_message("not using the cache (PYENCHANT_NO_FIND_CACHE is set)")
+        return from_system()
+    key = find_cache_key()
+    cache = read_find_cache()
+    entry = cache.get(key)
+    if isinstance(entry, dict):
+        library_path = entry.get("path")
+        stamp = entry.get("stamp")
+        if isinstance(library_path, str) and stamp is not None:
+            if library_stamp(library_path) == stamp:
+                find_message("cache hit in ", find_cache_path())
+                return library_path
+    find_message("cache miss in ", find_cache_path())
+    res = from_system()
+    if res:
+        stamp = library_stamp(res)
+        if stamp is not None:
+            cache[key] = {"path": res, "stamp": stamp}
+            write_find_cache(cache)
+    return res
+
+
 VERBOSE_FIND = False
 
 
@@ -151,7 +239,7 @@ def find_c_enchant_lib() -> Optional[str]:
         return from_package
 
     # Last chance
-    return from_system()
+    return from_system_cached()
 
 
 enchant_lib_path = find_c_enchant_lib()
@@ -323,22 +411,30 @@ def dict_check(dict: _D, word: bytes) -> int:
     return dict_check1(dict, word, len(word))
 
 
+def dict_check_many(dict: _D, words: Sequence[bytes]) -> List[int]:
+    # Let map() drive the loop so that each word costs a single
+    # foreign call, with no Python-level frame in between.
+    return list(map(dict_check1, repeat(dict), words, map(len, words)))
+
+
 dict_suggest1 = e.enchant_dict_suggest
 dict_suggest1.argtypes = [t_dict, c_char_p, c_size_t, POINTER(c_size_t)]
 dict_suggest1.restype = POINTER(c_char_p)
 
 
-def dict_suggest(dict: _D, word: bytes) -> List[bytes]:
-    num_suggs_p = pointer(c_size_t(0))
-    suggs_c = dict_suggest1(dict, word, len(word), num_suggs_p)
-    suggs = []
-    n = 0
-    while n < num_suggs_p.contents.value:
-        suggs.append(suggs_c[n])
-        n = n + 1
-    if num_suggs_p.contents.value > 0:
+def dict_suggest(dict: _D, word: bytes, limit: Optional[int] = None) -> List[bytes]:
+    num_suggs = c_size_t(0)
+    suggs_c = dict_suggest1(dict, word, len(word), byref(num_suggs))
+    n = num_suggs.value
+    if n == 0:
+        return []
+    if limit is not None:
+        n = min(n, limit)
+    try:
+        # Slicing converts the whole array in a single pass
+        return suggs_c[:n]
+    finally:
         dict_free_string_list(dict, suggs_c)
-    return suggs
 
 
 dict_add1 = e.enchant_dict_add
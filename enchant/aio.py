@@ -0,0 +1,315 @@
+# pyenchant
+#
+# Copyright (C) 2004-2008 Ryan Kelly
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+# In addition, as a special exception, you are
+# given permission to link the code of this program with
+# non-LGPL Spelling Provider libraries (eg: a MSFT Office
+# spell checker backend) and distribute linked combinations including
+# the two.  You must obey the GNU Lesser General Public License in all
+# respects for all of the code used other than said providers.  If you modify
+# this file, you may extend this exception to your version of the
+# file, but you are not obligated to do so.  If you do not wish to
+# do so, delete this exception statement from your version.
+#
+"""
+
+enchant.aio:    Spellchecking from asyncio programs
+===================================================
+
+This module provides :py:class:`AsyncDict`, a dictionary whose methods
+are coroutines, so that spellchecking does not block the event loop::
+
+    >>> import asyncio
+    >>> from enchant.aio import AsyncDict
+    >>> async def main():
+    ...     async with AsyncDict("en_US") as d:
+    ...         return await d.suggest("helo")
+    >>> asyncio.run(main())
+    ['hole', 'help', 'helot', 'hello', 'halo', 'hero', 'hell', 'held', 'helm']
+
+and :py:class:`AsyncSpellChecker`, which finds the misspelled words of a
+text along with their suggested replacements.
+
+"""
+
+import asyncio
+import collections
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import (  # noqa F401
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import enchant
+from enchant.errors import TokenizerNotFoundError
+from enchant.tokenize import Chunker, Filter, get_tokenizer
+
+
+class AsyncDict:
+    """Dictionary object with asynchronous methods.
+
+    The methods of :py:class:`enchant.Dict` taking time to complete are
+    available as coroutines.  They are run by a pool of `max_workers`
+    threads (by default, one per processor), each using a dictionary of
+    its own taken from a :py:class:`enchant.DictPool` created for the
+    language `tag` using `broker`.
+
+    Identical requests made while one of them is in progress share its
+    result rather than being run again.  At most `max_pending` requests
+    (by default, four per thread) are handed to the threads at once;
+    callers making further requests wait for some of them to complete.
+
+    An `AsyncDict` must only be used from a single event loop.  It should
+    be closed using :py:meth:`aclose()` or :py:meth:`close()` once it is
+    no longer needed, or used as an asynchronous context manager.
+    """
+
+    def __init__(
+        self,
+        tag: Optional[str] = None,
+        broker: Optional[enchant.Broker] = None,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        self.pool = enchant.DictPool(tag, max_workers, broker)
+        self.tag = self.pool.tag
+        if max_pending is None:
+            max_pending = 4 * self.pool.size
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self._executor = ThreadPoolExecutor(
+            self.pool.size, thread_name_prefix="enchant"
+        )
+        self._semaphore = asyncio.Semaphore(max_pending)
+        self._pending = {}  # type: Dict[Tuple[Any, ...], asyncio.Future]
+
+    async def __aenter__(self) -> "AsyncDict":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """Stop the threads and free the dictionaries."""
+        self._executor.shutdown()
+        self.pool.close()
+
+    async def aclose(self) -> None:
+        """Like :py:meth:`close()`, without blocking the event loop.
+
+        The requests still running are waited for in another thread.
+        """
+        await asyncio.to_thread(self.close)
+
+    async def _run(self, method: str, *args: Any) -> Any:
+        """Call a method of the pool in one of the threads."""
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            func = getattr(self.pool, method)
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _coalesced(self, method: str, *args: Any) -> Any:
+        """Like :py:meth:`_run()`, sharing the result of identical calls."""
+        key = (method,) + args
+        fut = self._pending.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(self._run(method, *args))
+            self._pending[key] = fut
+            fut.add_done_callback(lambda _: self._pending.pop(key, None))
+        # Cancelling one of the callers must not cancel the others
+        return await asyncio.shield(fut)
+
+    async def check(self, word: str) -> bool:
+        """Check spelling of a word, as :py:meth:`enchant.Dict.check` does."""
+        return await self._coalesced("check", word)
+
+    async def check_many(self, words: Iterable[str]) -> bytearray:
+        """Check spelling of many words, as :py:meth:`enchant.Dict.check_many` does."""
+        res = await self._coalesced("check_many", tuple(words))
+        return bytearray(res)
+
+    async def suggest(
+        self, word: str, max_suggestions: Optional[int] = None
+    ) -> List[str]:
+        """Suggest possible spellings, as :py:meth:`enchant.Dict.suggest` does."""
+        res = await self._coalesced("suggest", word, max_suggestions)
+        return list(res)
+
+    async def add(self, word: str) -> None:
+        """Add a word to the user's personal word list."""
+        await self._run("add", word)
+
+    async def remove(self, word: str) -> None:
+        """Add a word to the user's personal exclude list."""
+        await self._run("remove", word)
+
+    async def add_to_session(self, word: str) -> None:
+        """Add a word to the session personal list."""
+        await self._run("add_to_session", word)
+
+    async def remove_from_session(self, word: str) -> None:
+        """Add a word to the session exclude list."""
+        await self._run("remove_from_session", word)
+
+
+class SpellingError(NamedTuple):
+    """A misspelled word found by :py:class:`AsyncSpellChecker`."""
+
+    #: The misspelled word
+    word: str
+    #: The position of the word in the text
+    wordpos: int
+    #: The suggested replacements for the word
+    suggestions: List[str]
+
+
+class AsyncSpellChecker:
+    """Asynchronous iterator over the misspelled words of a text.
+
+    This class finds the misspelled words of a text as
+    :py:class:`enchant.checker.SpellChecker` does, but is used with
+    `async for` and yields :py:class:`SpellingError` tuples giving each
+    word, its position and its suggested replacements::
+
+        >>> async def main():
+        ...     async with AsyncSpellChecker("en_US") as chkr:
+        ...         chkr.set_text("This is sme text")
+        ...         async for err in chkr:
+        ...             print(err.word, err.wordpos, err.suggestions[:2])
+        >>> asyncio.run(main())
+        sme 8 ['same', 'some']
+
+    The first argument is either a language tag, from which an
+    :py:class:`AsyncDict` is created and owned by the checker, or an
+    existing `AsyncDict`.  The arguments `text`, `tokenize`, `chunkers`
+    and `filters` are as for `SpellChecker`.
+
+    The words are checked in batches of `batch_size`, and the suggestions
+    for up to `prefetch` misspelled words are computed ahead of the word
+    being yielded.  If `max_suggestions` is given, at most that many
+    suggestions are given for each word.
+    """
+
+    _DOC_ERRORS = ["sme", "sme", "chkr", "chkr", "chkr", "err", "err", "err"]
+
+    def __init__(
+        self,
+        lang: Union[AsyncDict, str, None] = None,
+        text: Optional[str] = None,
+        tokenize: Any = None,
+        chunkers: Optional[List[Chunker]] = None,
+        filters: Optional[List[Filter]] = None,
+        max_suggestions: Optional[int] = None,
+        batch_size: int = 256,
+        prefetch: int = 16,
+    ) -> None:
+        if isinstance(lang, AsyncDict):
+            self.dict = lang
+            self._owns_dict = False
+        else:
+            self.dict = AsyncDict(lang)
+            self._owns_dict = True
+        self.lang = self.dict.tag
+        if tokenize is None:
+            try:
+                tokenize = get_tokenizer(self.lang, chunkers, filters)
+            except TokenizerNotFoundError:
+                tokenize = get_tokenizer(None, chunkers, filters)
+        self._tokenize = tokenize
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        self.max_suggestions = max_suggestions
+        self.batch_size = batch_size
+        self.prefetch = prefetch
+        self._text = ""
+        if text is not None:
+            self.set_text(text)
+
+    async def __aenter__(self) -> "AsyncSpellChecker":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """Close the dictionary, if it was created by this checker."""
+        if self._owns_dict:
+            self.dict.close()
+
+    async def aclose(self) -> None:
+        """Like :py:meth:`close()`, without blocking the event loop."""
+        if self._owns_dict:
+            await self.dict.aclose()
+
+    def set_text(self, text: str) -> None:
+        """Set the text to be checked."""
+        self._text = text
+
+    def get_text(self) -> str:
+        """Return the text being checked."""
+        return self._text
+
+    def __aiter__(self) -> AsyncIterator[SpellingError]:
+        return self._errors()
+
+    async def _errors(self) -> AsyncIterator[SpellingError]:
+        loop = asyncio.get_running_loop()
+        tokens = self._tokenize(self._text)
+        queue = collections.deque()  # type: Deque[Tuple[str, int, asyncio.Future]]
+        try:
+            while True:
+                # Tokenizing a long text takes time too
+                batch = await loop.run_in_executor(None, _take, tokens, self.batch_size)
+                if not batch:
+                    break
+                results = await self.dict.check_many(word for (word, _) in batch)
+                for (word, pos), ok in zip(batch, results):
+                    if ok:
+                        continue
+                    while len(queue) >= self.prefetch:
+                        yield await self._next_error(queue)
+                    suggs = self.dict.suggest(word, self.max_suggestions)
+                    queue.append((word, pos, asyncio.ensure_future(suggs)))
+            while queue:
+                yield await self._next_error(queue)
+        finally:
+            for _, _, fut in queue:
+                fut.cancel()
+
+    async def _next_error(
+        self, queue: "Deque[Tuple[str, int, asyncio.Future]]"
+    ) -> SpellingError:
+        word, pos, fut = queue.popleft()
+        return SpellingError(word, pos, await fut)
+
+
+def _take(tokens: Iterable[Tuple[str, int]], count: int) -> List[Tuple[str, int]]:
+    """Get the next `count` tokens from a tokenizer."""
+    return list(itertools.islice(tokens, count))
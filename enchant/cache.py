@@ -0,0 +1,166 @@
+# pyenchant
+#
+# Copyright (C) 2004-2008 Ryan Kelly
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+# In addition, as a special exception, you are
+# given permission to link the code of this program with
+# non-LGPL Spelling Provider libraries (eg: a MSFT Office
+# spell checker backend) and distribute linked combinations including
+# the two.  You must obey the GNU Lesser General Public License in all
+# respects for all of the code used other than said providers.  If you modify
+# this file, you may extend this exception to your version of the
+# file, but you are not obligated to do so.  If you do not wish to
+# do so, delete this exception statement from your version.
+#
+"""
+
+enchant.cache:    Caches for spellchecking results
+==================================================
+
+This module provides the caches that can be attached to
+:py:class:`enchant.Dict` objects to avoid asking the underlying
+spellchecker the same question twice: :py:class:`LRUCache` for the
+results of checks, and :py:class:`SuggestionCache` for suggested
+spellings.
+
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional
+
+
+class LRUCache:
+    """Mapping of bounded size, discarding the least recently used entries.
+
+    At most `maxsize` entries are kept.  The number of calls to
+    :py:meth:`get` finding an entry or not are counted in the
+    :py:attr:`hits` and :py:attr:`misses` attributes.
+    """
+
+    _DOC_ERRORS = ["maxsize"]
+
+    def __init__(self, maxsize: int = 10000) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()  # type: OrderedDict[Hashable, Any]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get the value stored for `key`, or `None` if there is none."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store `value` for `key`, discarding the oldest entry if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Discard all entries.  The counters are left untouched."""
+        self._data.clear()
+
+
+class SuggestionCache(LRUCache):
+    """Cache for lists of suggested spellings.
+
+    Like :py:class:`LRUCache`, at most `maxsize` entries are kept.  If
+    `max_bytes` is given, the least recently used entries are also
+    discarded when the approximate memory used by the cached words and
+    suggestions exceeds it; the current estimate is available as the
+    :py:attr:`nbytes` attribute.  If `ttl` is given, entries are
+    discarded once they are older than that many seconds.
+
+    A single cache may be shared by several :py:class:`enchant.Dict`
+    objects.  Entries are keyed on the state of the dictionary, so that
+    adding or removing words or storing a replacement makes previous
+    suggestions for that dictionary unreachable.
+    """
+
+    _DOC_ERRORS = ["LRUCache", "maxsize", "nbytes", "ttl"]
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        super().__init__(maxsize)
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.nbytes = 0
+
+    def get(self, key: Hashable) -> Optional[List[str]]:
+        """Get the suggestions stored for `key`, or `None` if there are none."""
+        try:
+            suggs, size, expires = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        if expires is not None and expires <= time.monotonic():
+            del self._data[key]
+            self.nbytes -= size
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return list(suggs)
+
+    def put(self, key: Hashable, value: List[str]) -> None:
+        """Store the suggestions `value` for `key`, discarding old entries."""
+        suggs = tuple(value)
+        size = sys.getsizeof(key) + sys.getsizeof(suggs)
+        size += sum(sys.getsizeof(s) for s in suggs)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires = None
+        if self.ttl is not None:
+            expires = time.monotonic() + self.ttl
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.nbytes -= old[1]
+        self._data[key] = (suggs, size, expires)
+        self.nbytes += size
+        while len(self._data) > self.maxsize or (
+            self.max_bytes is not None and self.nbytes > self.max_bytes
+        ):
+            _, (_, old_size, _) = self._data.popitem(last=False)
+            self.nbytes -= old_size
+
+    def clear(self) -> None:
+        """Discard all entries.  The counters are left untouched."""
+        super().clear()
+        self.nbytes = 0
@@ -51,6 +51,7 @@ from typing import List, Optional, Type, Union
 
 import enchant
 from enchant import Dict
+from enchant.cache import SuggestionCache
 from enchant.errors import *  # noqa F401,F403
 from enchant.errors import (
     DefaultLanguageNotFoundError,
@@ -134,6 +135,10 @@ class SpellChecker:
         :param chunkers: a list of chunkers to apply during tokenization
         :param filters: a list of filters to apply during tokenization
 
+        A dictionary created from a language tag remembers the results of
+        its checks and suggestions, see :py:meth:`enchant.Dict.enable_check_cache`
+        and :py:class:`enchant.cache.SuggestionCache`.
+
         If `tokenize` is not given and the first argument is a :py:class:`Dict`,
         its `tag` attribute must be a language tag so that a tokenization
         function can be created automatically.  If this attribute is missing
@@ -146,6 +151,8 @@ class SpellChecker:
                 dict = enchant.Dict(lang)
             except DictNotFoundError:
                 raise DefaultLanguageNotFoundError(lang) from None
+            dict.enable_check_cache()
+            dict.suggestion_cache = SuggestionCache()
         else:
             dict = lang
             try:
@@ -0,0 +1,242 @@
+# pyenchant
+#
+# Copyright (C) 2004-2008 Ryan Kelly
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+# In addition, as a special exception, you are
+# given permission to link the code of this program with
+# non-LGPL Spelling Provider libraries (eg: a MSFT Office
+# spell checker backend) and distribute linked combinations including
+# the two.  You must obey the GNU Lesser General Public License in all
+# respects for all of the code used other than said providers.  If you modify
+# this file, you may extend this exception to your version of the
+# file, but you are not obligated to do so.  If you do not wish to
+# do so, delete this exception statement from your version.
+#
+"""
+
+enchant.corpus:    Spellchecking of large collections of documents
+==================================================================
+
+This module provides the function :py:func:`check_corpus`, which finds
+the misspelled words in many documents at once using a pool of worker
+processes::
+
+    >>> from enchant.corpus import check_corpus
+    >>> check_corpus(["this is some text", "another txet"], "en_US")
+    [[], [('txet', 8)]]
+
+Each worker process has a dictionary of its own.  The documents are cut
+into shards of roughly equal size, large documents being split at line
+ends, and each distinct word of a shard is only checked once.
+
+"""
+
+import multiprocessing
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union  # noqa F401
+
+import enchant
+from enchant.errors import Error, TokenizerNotFoundError
+from enchant.tokenize import get_tokenizer
+from enchant.utils import get_default_language
+
+# A piece of a document: its index, the index of the piece in the
+# document, and either the text itself or the path, encoding and byte
+# range to read it from.
+_Piece = Tuple[int, int, Union[str, Tuple[str, str, int, int]]]
+
+# The misspelled words found in a piece: its document and piece indexes,
+# its length in characters, and the words along with their positions.
+_PieceResult = Tuple[int, int, int, List[Tuple[str, int]]]
+
+
+def _split_text(text: str, size: int) -> List[str]:
+    """Split `text` at line ends into pieces of about `size` characters."""
+    pieces = []
+    start = 0
+    while len(text) - start > size:
+        end = text.find("\n", start + size)
+        if end == -1:
+            break
+        pieces.append(text[start : end + 1])
+        start = end + 1
+    pieces.append(text[start:])
+    return pieces
+
+
+def _line_start(f: Any, pos: int) -> int:
+    """Find the start of the first line of `f` beginning at or after `pos`."""
+    if pos == 0:
+        return 0
+    f.seek(pos - 1)
+    f.readline()
+    return f.tell()
+
+
+def _read_piece(path: str, encoding: str, start: int, end: int) -> str:
+    """Read the lines of a file starting within a range of bytes."""
+    with open(path, "rb") as f:
+        start = _line_start(f, start)
+        end = _line_start(f, end)
+        if end <= start:
+            return ""
+        f.seek(start)
+        return f.read(end - start).decode(encoding)
+
+
+class _Worker:
+    """Spellchecking state kept by each worker process."""
+
+    def __init__(
+        self, lang: str, chunkers: Optional[List[Any]], filters: Optional[List[Any]]
+    ) -> None:
+        self.dict = enchant.Dict(lang)
+        # Words are often repeated from one shard to the next
+        self.dict.enable_check_cache()
+        try:
+            self.tokenize = get_tokenizer(lang, chunkers, filters)
+        except TokenizerNotFoundError:
+            self.tokenize = get_tokenizer(None, chunkers, filters)
+
+    def check_shard(self, shard: List[_Piece]) -> List[_PieceResult]:
+        results = []  # type: List[_PieceResult]
+        # Where each distinct word of the shard is found
+        found = {}  # type: Dict[str, List[Tuple[List[Tuple[str, int]], int]]]
+        for doc, index, source in shard:
+            if not isinstance(source, str):
+                source = _read_piece(*source)
+            errors = []  # type: List[Tuple[str, int]]
+            results.append((doc, index, len(source), errors))
+            for word, pos in self.tokenize(source):
+                found.setdefault(word, []).append((errors, pos))
+        words = list(found)
+        for word, ok in zip(words, self.dict.check_many(words)):
+            if not ok:
+                for errors, pos in found[word]:
+                    errors.append((word, pos))
+        for _, _, _, errors in results:
+            errors.sort(key=lambda e: e[1])
+        return results
+
+
+_worker = None  # type: Optional[_Worker]
+
+
+def _init_worker(*args: Any) -> None:
+    global _worker
+    _worker = _Worker(*args)
+
+
+def _check_shard(shard: List[_Piece]) -> List[_PieceResult]:
+    assert _worker is not None
+    return _worker.check_shard(shard)
+
+
+def check_corpus(
+    paths_or_texts: Iterable[Union[str, "os.PathLike[str]"]],
+    lang: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunkers: Optional[List[Any]] = None,
+    filters: Optional[List[Any]] = None,
+    shard_size: int = 1 << 16,
+    encoding: str = "utf-8",
+) -> List[List[Tuple[str, int]]]:
+    """Find the misspelled words in many documents.
+
+    Each item of `paths_or_texts` is a document to check: a string holds
+    the text of the document, while a path object (such as a
+    :py:class:`pathlib.Path`) names a file to read it from, decoded using
+    `encoding`.  The documents are checked using the dictionary for the
+    language `lang` (by default, the language currently in use) and a
+    tokenizer for that language, created using `chunkers` and `filters`
+    as by :py:func:`enchant.tokenize.get_tokenizer`.
+
+    The result holds a list for each document, in the same order,
+    giving the misspelled words found in it as `(word, pos)` tuples,
+    where `pos` is the position of the word in the document, in
+    characters.
+
+    The work is spread over a pool of up to `workers` processes (by
+    default, one per processor); with a single worker, everything is
+    done in the current process.  It is cut into shards of about
+    `shard_size` characters, documents larger than that being split at
+    line ends.  Documents without line ends are never split.
+    """
+    if lang is None:
+        lang = get_default_language()
+        if lang is None:
+            raise Error(
+                "No tag specified and default language could not be determined."
+            )
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+    # Cut the documents into pieces, and group the pieces into shards
+    ndocs = 0
+    shards = []  # type: List[List[_Piece]]
+    shard = []  # type: List[_Piece]
+    shard_len = 0
+    for doc, item in enumerate(paths_or_texts):
+        ndocs += 1
+        sized = []  # type: List[Tuple[Any, int]]
+        if isinstance(item, str):
+            sized = [(text, len(text)) for text in _split_text(item, shard_size)]
+        elif isinstance(item, os.PathLike):
+            path = os.fspath(item)
+            if not isinstance(path, str):
+                raise TypeError("paths must be strings, not %r" % (path,))
+            size = os.path.getsize(path)
+            for start in range(0, max(size, 1), shard_size):
+                end = min(start + shard_size, size)
+                sized.append(((path, encoding, start, end), end - start))
+        else:
+            raise TypeError("expected a string or a path, not %r" % (item,))
+        for index, (source, length) in enumerate(sized):
+            shard.append((doc, index, source))
+            shard_len += length
+            if shard_len >= shard_size:
+                shards.append(shard)
+                shard = []
+                shard_len = 0
+    if shard:
+        shards.append(shard)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(shards))
+    args = (lang, chunkers, filters)
+    pieces = [[] for _ in range(ndocs)]  # type: List[List[_PieceResult]]
+    if workers <= 1:
+        worker = _Worker(*args)
+        for shard in shards:
+            for res in worker.check_shard(shard):
+                pieces[res[0]].append(res)
+    else:
+        with multiprocessing.Pool(workers, _init_worker, args) as pool:
+            for results in pool.imap_unordered(_check_shard, shards):
+                for res in results:
+                    pieces[res[0]].append(res)
+    # Put the pieces of each document back together
+    errors = []  # type: List[List[Tuple[str, int]]]
+    for doc_pieces in pieces:
+        doc_pieces.sort(key=lambda res: res[1])
+        doc_errors = []  # type: List[Tuple[str, int]]
+        offset = 0
+        for _, _, length, piece_errors in doc_pieces:
+            doc_errors.extend((word, pos + offset) for (word, pos) in piece_errors)
+            offset += length
+        errors.append(doc_errors)
+    return errors
@@ -0,0 +1,326 @@
+# pyenchant
+#
+# Copyright (C) 2004-2008 Ryan Kelly
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+# In addition, as a special exception, you are
+# given permission to link the code of this program with
+# non-LGPL Spelling Provider libraries (eg: a MSFT Office
+# spell checker backend) and distribute linked combinations including
+# the two.  You must obey the GNU Lesser General Public License in all
+# respects for all of the code used other than said providers.  If you modify
+# this file, you may extend this exception to your version of the
+# file, but you are not obligated to do so.  If you do not wish to
+# do so, delete this exception statement from your version.
+#
+"""
+
+enchant.metrics:    Performance counters for PyEnchant
+======================================================
+
+This module keeps counters and latency histograms describing the work
+done by PyEnchant.  Nothing is recorded until :py:func:`enable` is called::
+
+    >>> import enchant, enchant.metrics
+    >>> enchant.metrics.enable()
+    >>> enchant.Dict("en_US").check("hello")
+    True
+    >>> enchant.metrics.snapshot()["enchant_call_seconds"][0]["labels"]
+    {'method': 'check', 'provider': 'hunspell'}
+
+The following metrics are available:
+
+    * `enchant_call_seconds`: histogram of the time taken by the methods
+      of :py:class:`enchant.Broker`, :py:class:`enchant.Dict` and
+      :py:class:`enchant.pypwl.PyPWL`, by method and provider
+    * `enchant_c_call_seconds`: histogram of the time spent in the C
+      library, by function.  The difference with the above is the time
+      spent in Python.
+    * `enchant_cache_lookups_total`: number of lookups in the caches of
+      :py:mod:`enchant.cache`, by type of cache and result
+    * `enchant_tokens_total`: number of tokens produced by each stage of
+      the tokenizers, chunkers and filters of :py:mod:`enchant.tokenize`
+    * `enchant_spellchecker_errors_total`: number of errors found by
+      :py:class:`enchant.checker.SpellChecker` objects, by language
+
+They are available as a dictionary from :py:func:`snapshot` and in the
+Prometheus text format from :py:func:`prometheus_text`.
+
+Recording works by replacing the methods concerned with instrumented
+versions, which :py:func:`disable` removes again, so that there is no
+cost at all while disabled.
+
+"""
+
+import bisect
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple  # noqa F401
+
+#: Upper bounds of the buckets of the latency histograms, in seconds
+BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+
+_HELP = {
+    "enchant_call_seconds": "Time taken by PyEnchant methods.",
+    "enchant_c_call_seconds": "Time spent in the enchant C library.",
+    "enchant_cache_lookups_total": "Lookups in PyEnchant caches.",
+    "enchant_tokens_total": "Tokens produced by each tokenization stage.",
+    "enchant_spellchecker_errors_total": "Errors found by SpellChecker objects.",
+}
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+_lock = threading.Lock()
+# Histograms hold the count for each bucket (plus one for larger values)
+# followed by the sum of the observed values.
+_histograms = {}  # type: Dict[Tuple[str, _Labels], List[float]]
+_counters = {}  # type: Dict[Tuple[str, _Labels], int]
+# The (owner, name, original) of the attributes replaced while enabled
+_patches = []  # type: List[Tuple[Any, str, Any]]
+
+
+def observe(name: str, labels: _Labels, value: float) -> None:
+    """Record a value in a histogram."""
+    key = (name, labels)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = [0] * (len(BUCKETS) + 1) + [0.0]
+        hist[bisect.bisect_left(BUCKETS, value)] += 1
+        hist[-1] += value
+
+
+def increment(name: str, labels: _Labels, amount: int = 1) -> None:
+    """Add to a counter."""
+    key = (name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def _provider(obj: Any) -> str:
+    provider = getattr(obj, "provider", None)
+    if provider is None:
+        return type(obj).__name__
+    return provider.name
+
+
+def _timed_method(method: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwds):
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwds)
+        finally:
+            labels = (("method", method), ("provider", _provider(self)))
+            observe("enchant_call_seconds", labels, time.perf_counter() - start)
+
+    return wrapper
+
+
+def _timed_request(method: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwds):
+        start = time.perf_counter()
+        res = func(self, *args, **kwds)
+        labels = (("method", method), ("provider", _provider(res)))
+        observe("enchant_call_seconds", labels, time.perf_counter() - start)
+        return res
+
+    return wrapper
+
+
+def _timed_c_function(name: str, func: Callable) -> Callable:
+    labels = (("function", name),)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwds):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwds)
+        finally:
+            observe("enchant_c_call_seconds", labels, time.perf_counter() - start)
+
+    return wrapper
+
+
+def _counted_lookup(name: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(self, key):
+        res = func(self, key)
+        result = "miss" if res is None else "hit"
+        increment("enchant_cache_lookups_total", (("cache", name), ("result", result)))
+        return res
+
+    return wrapper
+
+
+def _counted_tokens(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(self):
+        res = func(self)
+        # Filters are reported under the name of the filter class
+        stage = getattr(getattr(self, "_skip", None), "__self__", self)
+        increment("enchant_tokens_total", (("stage", type(stage).__name__),))
+        return res
+
+    return wrapper
+
+
+def _counted_errors(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(self):
+        res = func(self)
+        increment("enchant_spellchecker_errors_total", (("lang", str(self.lang)),))
+        return res
+
+    return wrapper
+
+
+def _patch(owner: Any, name: str, wrap: Callable[[Callable], Callable]) -> None:
+    original = getattr(owner, name)
+    _patches.append((owner, name, original))
+    setattr(owner, name, wrap(original))
+
+
+def is_enabled() -> bool:
+    """Check whether metrics are being recorded."""
+    return bool(_patches)
+
+
+def enable() -> None:
+    """Start recording metrics.
+
+    This loads the enchant C library if it has not been loaded yet.  If the
+    library is missing and `PYENCHANT_IGNORE_MISSING_LIB` is set, calls into
+    it are not timed, but everything else is still recorded.
+    """
+    import enchant
+    import enchant.cache
+    import enchant.checker
+    import enchant.pypwl
+    import enchant.tokenize
+
+    with _lock:
+        if _patches:
+            return
+        e = enchant._load_lib()
+        if e is not None:
+            for name in ("dict_check", "dict_check_many", "dict_suggest"):
+                _patch(e, name, functools.partial(_timed_c_function, name))
+        for cls, methods in [
+            (enchant.Dict, ("check", "check_many", "suggest", "suggest_many")),
+            (enchant.pypwl.PyPWL, ("check", "check_many", "suggest")),
+        ]:
+            for method in methods:
+                _patch(cls, method, functools.partial(_timed_method, method))
+        for method in ("request_dict", "request_pwl_dict"):
+            _patch(enchant.Broker, method, functools.partial(_timed_request, method))
+        _patch(
+            enchant.cache.LRUCache, "get", functools.partial(_counted_lookup, "check")
+        )
+        _patch(
+            enchant.cache.SuggestionCache,
+            "get",
+            functools.partial(_counted_lookup, "suggestion"),
+        )
+        _patch(enchant.tokenize.tokenize, "__next__", _counted_tokens)
+        _patch(enchant.tokenize.Filter._TokenFilter, "__next__", _counted_tokens)
+        _patch(enchant.checker.SpellChecker, "next", _counted_errors)
+
+
+enable._DOC_ERRORS = ["PYENCHANT", "LIB"]  # type: ignore
+
+
+def disable() -> None:
+    """Stop recording metrics.  The values recorded so far are kept."""
+    with _lock:
+        while _patches:
+            owner, name, original = _patches.pop()
+            setattr(owner, name, original)
+
+
+def reset() -> None:
+    """Discard the values recorded so far."""
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+
+
+def snapshot() -> Dict[str, List[Dict[str, Any]]]:
+    """Get the values recorded so far.
+
+    The result maps the name of each metric to a list holding a dictionary
+    for each combination of labels.  Each of these has a `labels` entry,
+    and either a `value` entry for counters, or `count`, `sum` and
+    `buckets` entries for histograms.  The latter maps the upper bound
+    of each bucket (as a string, as in the Prometheus format) to the
+    number of values less than or equal to it.
+    """
+    res = {}  # type: Dict[str, List[Dict[str, Any]]]
+    with _lock:
+        for (name, labels), hist in sorted(_histograms.items()):
+            buckets = {}
+            count = 0
+            for bound, n in zip(BUCKETS + (float("inf"),), hist):
+                count += int(n)
+                buckets["+Inf" if bound == float("inf") else repr(bound)] = count
+            entry = {"labels": dict(labels), "count": count, "sum": hist[-1]}
+            entry["buckets"] = buckets
+            res.setdefault(name, []).append(entry)
+        for (name, labels), value in sorted(_counters.items()):
+            res.setdefault(name, []).append({"labels": dict(labels), "value": value})
+    return res
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    items = []
+    for key, value in labels.items():
+        value = value.replace("\\", "\\\\").replace("\n", "\\n")
+        value = value.replace('"', '\\"')
+        items.append('%s="%s"' % (key, value))
+    return "{%s}" % ",".join(items)
+
+
+def prometheus_text() -> str:
+    """Get the values recorded so far in the Prometheus text format."""
+    lines = []
+    for name, entries in snapshot().items():
+        lines.append("# HELP %s %s" % (name, _HELP[name]))
+        if "buckets" in entries[0]:
+            lines.append("# TYPE %s histogram" % name)
+            for entry in entries:
+                labels = entry["labels"]
+                for bound, count in entry["buckets"].items():
+                    bucket_labels = dict(labels, le=bound)
+                    lines.append(
+                        "%s_bucket%s %d" % (name, _format_labels(bucket_labels), count)
+                    )
+                lines.append(
+                    "%s_sum%s %r" % (name, _format_labels(labels), entry["sum"])
+                )
+                lines.append(
+                    "%s_count%s %d" % (name, _format_labels(labels), entry["count"])
+                )
+        else:
+            lines.append("# TYPE %s counter" % name)
+            for entry in entries:
+                labels = _format_labels(entry["labels"])
+                lines.append("%s%s %d" % (name, labels, entry["value"]))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,319 @@
+# pyenchant
+#
+# Copyright (C) 2004-2008 Ryan Kelly
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+# In addition, as a special exception, you are
+# given permission to link the code of this program with
+# non-LGPL Spelling Provider libraries (eg: a MSFT Office
+# spell checker backend) and distribute linked combinations including
+# the two.  You must obey the GNU Lesser General Public License in all
+# respects for all of the code used other than said providers.  If you modify
+# this file, you may extend this exception to your version of the
+# file, but you are not obligated to do so.  If you do not wish to
+# do so, delete this exception statement from your version.
+#
+"""
+
+enchant.profile:    Find where spellchecking time goes
+======================================================
+
+This module provides the function :py:func:`profile_checker`, which runs
+a :py:class:`enchant.checker.SpellChecker` over a text and reports the
+time spent in each stage of its tokenization pipeline (chunkers,
+filters, basic and language-specific tokenizers), in checking words and,
+optionally, in suggesting replacements::
+
+    >>> from enchant.checker import SpellChecker
+    >>> from enchant.profile import profile_checker
+    >>> from enchant.tokenize import HTMLChunker
+    >>> chkr = SpellChecker("en_US", chunkers=[HTMLChunker])
+    >>> print(profile_checker(chkr, "<p>Some <b>txet</b></p>").to_text())
+    ... # doctest: +SKIP
+
+For each stage, the report gives the number of calls, the number of
+tokens it received and produced, the time spent in it including the
+stages it called (`total`) and the time spent in the stage itself
+(`self`).
+
+"""
+
+import functools
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple  # noqa F401
+
+from enchant.tokenize import Filter, tokenize
+
+
+class _Stage:
+    """Measurements for one stage of the pipeline."""
+
+    __slots__ = ("name", "calls", "tokens_in", "tokens_out", "total", "self")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self.total = 0.0
+        self.self = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "tokens_in": self.tokens_in,
+            "tokens_out": self.tokens_out,
+            "total_seconds": self.total,
+            "self_seconds": self.self,
+        }
+
+
+class Profile:
+    """The result of :py:func:`profile_checker`.
+
+    The :py:attr:`stages` attribute holds a dictionary for each stage,
+    in the order they were first entered, with the following entries:
+
+        * `name`:  the name of the stage
+        * `calls`:  the number of times the stage was called
+        * `tokens_in`:  the number of tokens received from the previous stage
+        * `tokens_out`:  the number of tokens produced
+        * `total_seconds`:  the time spent in the stage and the stages it called
+        * `self_seconds`:  the time spent in the stage itself
+
+    The first stage, named after the checker class, covers the whole run.
+    The :py:attr:`errors` attribute holds the number of errors found.
+    """
+
+    def __init__(self, stages: List[Dict[str, Any]], errors: int) -> None:
+        self.stages = stages
+        self.errors = errors
+
+    def to_json(self, **kwds: Any) -> str:
+        """Format the profile as JSON, passing `kwds` to :py:func:`json.dumps`."""
+        return json.dumps({"stages": self.stages, "errors": self.errors}, **kwds)
+
+    to_json._DOC_ERRORS = ["kwds", "json", "dumps"]  # type: ignore
+
+    def to_text(self) -> str:
+        """Format the profile as a table."""
+        total = self.stages[0]["total_seconds"] if self.stages else 0.0
+        width = max([len(s["name"]) for s in self.stages] + [5])
+        header = "%-*s %8s %10s %10s %10s %10s %6s" % (
+            width,
+            "stage",
+            "calls",
+            "tokens in",
+            "tokens out",
+            "total ms",
+            "self ms",
+            "self %",
+        )
+        lines = [header, "-" * len(header)]
+        for s in self.stages:
+            lines.append(
+                "%-*s %8d %10d %10d %10.3f %10.3f %5.1f%%"
+                % (
+                    width,
+                    s["name"],
+                    s["calls"],
+                    s["tokens_in"],
+                    s["tokens_out"],
+                    s["total_seconds"] * 1e3,
+                    s["self_seconds"] * 1e3,
+                    100.0 * s["self_seconds"] / total if total else 0.0,
+                )
+            )
+        lines.append("%d errors found" % (self.errors,))
+        return "\n".join(lines)
+
+
+def _name(obj: Any) -> str:
+    """Get the name of a tokenizer, chunker or filter."""
+    if isinstance(obj, Filter):
+        if type(obj) is Filter:
+            # The glue added by wrap_tokenizer()
+            return "wrap_tokenizer(%s)" % _name(obj._split)
+        return type(obj).__name__
+    cls = obj if isinstance(obj, type) else type(obj)
+    if cls.__module__ == "enchant.tokenize":
+        return cls.__qualname__
+    return "%s.%s" % (cls.__module__, cls.__qualname__)
+
+
+class _Profiler:
+    """Collect measurements for the stages run by a single thread."""
+
+    def __init__(self) -> None:
+        self.stages = {}  # type: Dict[Any, _Stage]
+        # Each frame holds a stage, its start time, and time spent in callees
+        self.stack = []  # type: List[List[Any]]
+
+    def stage(self, key: Any, name: Callable[[], str]) -> _Stage:
+        stage = self.stages.get(key)
+        if stage is None:
+            stage = self.stages[key] = _Stage(name())
+        return stage
+
+    def run(
+        self, stage: _Stage, func: Callable, it: Any = None, token: bool = True
+    ) -> Any:
+        """Call `func` as part of `stage`, which produces a token if `token`.
+
+        `it` is the iterator producing the token, passed to `func`.
+        """
+        stage.calls += 1
+        frame = [stage, time.perf_counter(), 0.0, it]
+        self.stack.append(frame)
+        produced = False
+        try:
+            res = func() if it is None else func(it)
+            produced = token
+            return res
+        finally:
+            elapsed = time.perf_counter() - frame[1]
+            self.stack.pop()
+            stage.total += elapsed
+            stage.self += elapsed - frame[2]
+            if self.stack:
+                parent = self.stack[-1]
+                parent[2] += elapsed
+                # Only count tokens coming from the previous stage, and
+                # not those from splitting its own tokens.
+                upstream = getattr(parent[3], "_tokenizer", it)
+                if produced and (parent[3] is None or upstream is it):
+                    parent[0].tokens_in += 1
+            if produced:
+                stage.tokens_out += 1
+
+    def wrap_call(self, name: str, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwds):
+            stage = self.stage(name, lambda: name)
+            return self.run(stage, lambda: func(*args, **kwds), token=False)
+
+        return wrapper
+
+
+def _filter_of(it: Any) -> Any:
+    # A _TokenFilter is created by a Filter, whose bound methods it keeps
+    return it._skip.__self__
+
+
+def _class_of(it: Any) -> Any:
+    return type(it)
+
+
+# The methods replaced while profiling, and how to find the stage of an iterator
+_PATCHES = [
+    (tokenize, "__next__", _class_of),
+    (Filter._TokenFilter, "__next__", _filter_of),
+]
+
+# The patches are shared by all the threads profiling at the same time, and
+# only removed once the last of them is done.  Each thread records its own
+# stages in the profiler registered for it.
+_lock = threading.Lock()
+_profilers = {}  # type: Dict[int, _Profiler]
+_originals = []  # type: List[Tuple[Any, str, Callable]]
+_users = 0
+
+
+def _wrap_next(func: Callable, stage_of: Callable[[Any], Any]) -> Callable:
+    @functools.wraps(func)
+    def wrapper(it):
+        profiler = _profilers.get(threading.get_ident())
+        if profiler is None:
+            return func(it)
+        key = stage_of(it)
+        return profiler.run(profiler.stage(key, lambda: _name(key)), func, it)
+
+    return wrapper
+
+
+def _install(profiler: _Profiler) -> Optional[_Profiler]:
+    """Start recording the current thread's stages into `profiler`.
+
+    This returns the profiler that was previously registered for the
+    thread, if any.
+    """
+    global _users
+    with _lock:
+        if not _users:
+            for owner, name, stage_of in _PATCHES:
+                func = owner.__dict__[name]
+                _originals.append((owner, name, func))
+                setattr(owner, name, _wrap_next(func, stage_of))
+        _users += 1
+        previous = _profilers.get(threading.get_ident())
+        _profilers[threading.get_ident()] = profiler
+    return previous
+
+
+def _uninstall(previous: Optional[_Profiler]) -> None:
+    """Undo :py:func:`_install`, given the profiler it returned."""
+    global _users
+    with _lock:
+        if previous is None:
+            del _profilers[threading.get_ident()]
+        else:
+            _profilers[threading.get_ident()] = previous
+        _users -= 1
+        if not _users:
+            while _originals:
+                owner, name, func = _originals.pop()
+                setattr(owner, name, func)
+
+
+def profile_checker(checker: Any, text: str, suggest: bool = False) -> Profile:
+    """Profile the spellchecking of `text` by `checker`.
+
+    The text is set on the given :py:class:`enchant.checker.SpellChecker`,
+    and the errors it contains are iterated over.  If `suggest` is true,
+    the suggestions for each error are computed too.  Time spent in the
+    stages of the tokenization pipeline, in checking words and in
+    suggesting replacements is recorded, and returned as a
+    :py:class:`Profile` object.
+    """
+    profiler = _Profiler()
+    top = profiler.stage(None, lambda: type(checker).__name__)
+    d = checker.dict
+    saved = {k: v for (k, v) in vars(d).items() if k in ("check", "suggest")}
+    previous = _install(profiler)
+    try:
+        d.check = profiler.wrap_call("check", d.check)
+        d.suggest = profiler.wrap_call("suggest", d.suggest)
+
+        def run() -> int:
+            errors = 0
+            checker.set_text(text)
+            for err in checker:
+                errors += 1
+                if suggest:
+                    err.suggest()
+            return errors
+
+        errors = profiler.run(top, run, token=False)
+    finally:
+        _uninstall(previous)
+        del d.check
+        del d.suggest
+        vars(d).update(saved)
+    return Profile([s.as_dict() for s in profiler.stages.values()], errors)
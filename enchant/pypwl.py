@@ -44,9 +44,187 @@ prototype for the C version found in Enchant).
 """
 
 
+import heapq
+import locale
 import os
+import stat
+import tempfile
+import time
 import warnings
-from typing import Dict, Iterable, Iterator, List, Optional  # noqa F401
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple  # noqa F401
+
+# A trie is compacted again when the words added or removed since it was
+# last compacted account for more than this many nodes, and for more than
+# a quarter of its nodes.
+_COMPACT_MIN = 1024
+
+# Words added to or removed from a PyPWL file are recorded in a journal
+# next to it, merged into the file once the journal is larger than this
+# many bytes and than a quarter of the file.
+_JOURNAL_MIN = 64 * 1024
+
+
+class _TrieNodes:
+    """The nodes of a `Trie` and of the subtries it contains.
+
+    Nodes are numbered from zero.  Those present when the trie was last
+    compacted are stored in arrays: the labels of the edges leaving node
+    `n` are ``labels[first[n]:first[n + 1]]``, in sorted order, and the
+    nodes they lead to are ``targets[first[n]:first[n + 1]]``.  Children
+    are numbered before their parent, so that the arrays can be filled
+    in a single pass over the sorted words, and the root comes last.
+    Edges added since then are kept in dictionaries, in `extra`, and lead
+    to nodes with higher numbers.  Whether each node ends a word is
+    recorded in `eos`.  Removing a word only clears this flag, leaving its
+    nodes in place until the next compaction.
+    """
+
+    _DOC_ERRORS = ["eos"]
+
+    __slots__ = ("labels", "targets", "first", "eos", "extra", "removed", "root")
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.build(words)
+
+    def build(self, words: Iterable[str]) -> None:
+        """Store the given words, which must be sorted.
+
+        Repeated words are ignored, and :py:exc:`ValueError` is raised if
+        the words are out of order.
+        """
+        labels = []  # type: List[str]
+        targets = array("I")
+        first = array("I")
+        eos = bytearray()
+        # The nodes along the path of the previous word, each as a list
+        # of its letter, whether it ends a word, and its edges so far.
+        path = [["", 0, []]]  # type: List[Any]
+        prev = None  # type: Optional[str]
+
+        def store(end: int, edges: List[Tuple[str, int]]) -> int:
+            node = len(eos)
+            eos.append(end)
+            first.append(len(labels))
+            for ch, child in edges:
+                labels.append(ch)
+                targets.append(child)
+            return node
+
+        def finish(depth: int) -> None:
+            # Store the nodes of the path deeper than `depth`
+            while len(path) > depth + 1:
+                letter, end, edges = path.pop()
+                path[-1][2].append((letter, store(end, edges)))
+
+        for word in words:
+            common = 0
+            if prev is not None:
+                if word <= prev:
+                    if word == prev:
+                        continue
+                    raise ValueError("words are not sorted: %r" % (word,))
+                limit = min(len(word), len(prev))
+                while common < limit and word[common] == prev[common]:
+                    common += 1
+                finish(common)
+            for i in range(common, len(word)):
+                path.append([word[i], 0, []])
+            path[-1][1] = 1
+            prev = word
+        finish(0)
+        self.root = store(path[0][1], path[0][2])
+        first.append(len(labels))
+        self.labels = "".join(labels)
+        self.targets = targets
+        self.first = first
+        self.eos = eos
+        self.extra = {}  # type: Dict[int, Dict[str, int]]
+        self.removed = 0
+
+    def compact(self) -> None:
+        """Store all the words in the arrays, if worth it."""
+        nbase = len(self.first) - 1
+        garbage = len(self.eos) - nbase + self.removed
+        if garbage > _COMPACT_MIN and garbage * 4 > nbase:
+            self.build(self.words(self.root, ""))
+
+    def child(self, node: int, ch: str) -> int:
+        """Get the node reached from `node` by the edge `ch`, or -1."""
+        first = self.first
+        if node < len(first) - 1:
+            i = self.labels.find(ch, first[node], first[node + 1])
+            if i >= 0:
+                return self.targets[i]
+        extra = self.extra.get(node)
+        if extra is not None:
+            return extra.get(ch, -1)
+        return -1
+
+    def children(self, node: int) -> List[Tuple[str, int]]:
+        """List the edges leaving `node`, in sorted order."""
+        res = []  # type: List[Tuple[str, int]]
+        first = self.first
+        if node < len(first) - 1:
+            start, end = first[node], first[node + 1]
+            res.extend(zip(self.labels[start:end], self.targets[start:end]))
+        extra = self.extra.get(node)
+        if extra is not None:
+            res.extend(extra.items())
+            res.sort()
+        return res
+
+    def contains(self, node: int, word: str) -> bool:
+        """Check whether `word` ends at a node below `node`."""
+        first = self.first
+        labels = self.labels
+        nbase = len(first) - 1
+        for ch in word:
+            child = -1
+            if node < nbase:
+                i = labels.find(ch, first[node], first[node + 1])
+                if i >= 0:
+                    child = self.targets[i]
+            if child < 0:
+                extra = self.extra.get(node)
+                if extra is None:
+                    return False
+                child = extra.get(ch, -1)
+                if child < 0:
+                    return False
+            node = child
+        return self.eos[node] == 1
+
+    def insert(self, node: int, word: str) -> None:
+        eos = self.eos
+        for ch in word:
+            child = self.child(node, ch)
+            if child < 0:
+                child = len(eos)
+                eos.append(0)
+                self.extra.setdefault(node, {})[ch] = child
+            node = child
+        eos[node] = 1
+
+    def remove(self, node: int, word: str) -> None:
+        for ch in word:
+            node = self.child(node, ch)
+            if node < 0:
+                return
+        if self.eos[node]:
+            self.eos[node] = 0
+            self.removed += 1
+
+    def words(self, node: int, prefix: str) -> Iterator[str]:
+        """Iterate over the words below `node`, in sorted order."""
+        eos = self.eos
+        stack = [(node, prefix)]
+        while stack:
+            node, prefix = stack.pop()
+            if eos[node]:
+                yield prefix
+            for ch, child in reversed(self.children(node)):
+                stack.append((child, prefix + ch))
 
 
 class Trie:
@@ -55,107 +233,269 @@ class Trie:
     A Trie is a recursive data structure storing words by their prefix.
     "Fuzzy matching" can be done by allowing a certain number of missteps
     when traversing the Trie.
+
+    The nodes are stored compactly in arrays, rather than as one object
+    per node.  Words added afterwards are stored less compactly until
+    there are enough of them to make it worth compacting the whole trie
+    again.  Indexing a trie with a letter gives a view of the subtrie for
+    that letter, which is no longer valid once the trie was compacted.
     """
 
+    __slots__ = ("_nodes", "_node")
+
     def __init__(self, words: Iterable[str] = ()) -> None:
-        self._eos = False  # whether I am the end of a word
-        self._keys = {}  # type: Dict[str, Trie] # letters at this level of the trie
-        for w in words:
-            self.insert(w)
+        self._nodes = _TrieNodes(sorted(set(words)))
+        self._node = self._nodes.root  # the root of this subtrie
+
+    @classmethod
+    def from_sorted(cls, words: Iterable[str]) -> "Trie":
+        """Create a trie from words given in sorted order.
+
+        This is faster than creating it from unsorted words, and the words
+        need not all be held in memory at once, as when reading them from
+        a file.  :py:exc:`ValueError` is raised if they are not sorted.
+        """
+        nodes = _TrieNodes(words)
+        return cls._view(nodes, nodes.root)
+
+    @classmethod
+    def _view(cls, nodes: _TrieNodes, node: int) -> "Trie":
+        """Get the subtrie rooted at the given node."""
+        subtrie = cls.__new__(cls)
+        subtrie._nodes = nodes
+        subtrie._node = node
+        return subtrie
 
     def insert(self, word: str) -> None:
-        if word == "":
-            self._eos = True
-        else:
-            key = word[0]
-            try:
-                subtrie = self[key]
-            except KeyError:
-                subtrie = Trie()
-                self[key] = subtrie
-            subtrie.insert(word[1:])
+        nodes = self._nodes
+        nodes.insert(self._node, word)
+        if self._node == nodes.root:
+            nodes.compact()
+            self._node = nodes.root
 
     def remove(self, word: str) -> None:
-        if word == "":
-            self._eos = False
-        else:
-            key = word[0]
-            try:
-                subtrie = self[key]
-            except KeyError:
-                pass
-            else:
-                subtrie.remove(word[1:])
-
-    def search(self, word: str, nerrs: int = 0) -> List[str]:
+        nodes = self._nodes
+        nodes.remove(self._node, word)
+        if self._node == nodes.root:
+            nodes.compact()
+            self._node = nodes.root
+
+    def search(
+        self, word: str, nerrs: int = 0, max_results: Optional[int] = None
+    ) -> List[str]:
         """Search for the given word, possibly making errors.
 
-        This method searches the trie for the given `word`, making
-        precisely `nerrs` errors.  It returns a list of words found.
+        This method searches the trie for the words that can be obtained
+        from `word` by at most `nerrs` insertions, deletions or
+        substitutions of a letter.  It returns a list of the words found,
+        closest first, and no more than `max_results` of them if given.
         """
-        res = []  # type: List[str]
-        # Terminate if we've run out of errors
-        if nerrs < 0:
-            return res
-        # Precise match at the end of the word
-        if nerrs == 0 and word == "":
-            if self._eos:
-                res.append("")
-        # Precisely match word[0]
-        try:
-            subtrie = self[word[0]]
-            subres = subtrie.search(word[1:], nerrs)
-            for w in subres:
-                w2 = word[0] + w
-                if w2 not in res:
-                    res.append(w2)
-        except (IndexError, KeyError):
-            pass
-        # match with deletion of word[0]
-        try:
-            subres = self.search(word[1:], nerrs - 1)
-            for w in subres:
-                if w not in res:
-                    res.append(w)
-        except (IndexError,):
-            pass
-        # match with insertion before word[0]
-        try:
-            for k in self._keys:
-                subres = self[k].search(word, nerrs - 1)
-                for w in subres:
-                    w2 = k + w
-                    if w2 not in res:
-                        res.append(w2)
-        except (IndexError, KeyError):
-            pass
-        # match on substitution of word[0]
-        try:
-            for k in self._keys:
-                subres = self[k].search(word[1:], nerrs - 1)
-                for w in subres:
-                    w2 = k + w
-                    if w2 not in res:
-                        res.append(w2)
-        except (IndexError, KeyError):
-            pass
-        # All done!
-        return res
+        return [w for w, _ in self.search_distances(word, nerrs, max_results)]
 
     search._DOC_ERRORS = ["nerrs"]  # type: ignore
 
+    def search_distances(
+        self, word: str, nerrs: int = 0, max_results: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        """Search for the given word, with the distance to each word found.
+
+        This method is like `search`, but returns a list of (word, distance)
+        tuples, where the distance is the least number of errors needed to
+        get from `word` to the word found.  The list is sorted by distance,
+        then by word.
+        """
+        res = _search(self._nodes, self._node, word, nerrs)
+        if max_results is not None and len(res) > max_results:
+            return heapq.nsmallest(max_results, res, key=_by_distance)
+        res.sort(key=_by_distance)
+        return res
+
+    def nearest(
+        self,
+        word: str,
+        limit: int,
+        nerrs: int,
+        max_nodes: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Tuple[str, int]]:
+        """Find the words closest to the given word.
+
+        This method returns the same list as ``search_distances(word, nerrs,
+        limit)``, but stops looking as soon as it found the `limit` closest
+        words, rather than finding all the words within `nerrs` errors first.
+
+        The search can be bounded by visiting at most `max_nodes` nodes of
+        the trie, or spending at most `timeout` seconds.  If it is cut short,
+        the closest words found so far are returned instead.
+        """
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        return _nearest(
+            self._nodes, self._node, word, limit, nerrs, max_nodes, deadline
+        )
+
+    nearest._DOC_ERRORS = ["nerrs", "nerrs"]  # type: ignore
+
     def __getitem__(self, key: str) -> "Trie":
-        return self._keys[key]
+        node = self._nodes.child(self._node, key) if len(key) == 1 else -1
+        if node < 0:
+            raise KeyError(key)
+        return self._view(self._nodes, node)
 
     def __setitem__(self, key: str, val: "Trie") -> None:
-        self._keys[key] = val
+        try:
+            old = self[key]
+        except KeyError:
+            pass
+        else:
+            for w in list(old):
+                old.remove(w)
+        for w in list(val):
+            self._nodes.insert(self._node, key + w)
+
+    def __contains__(self, word: str) -> bool:
+        return self._nodes.contains(self._node, word)
 
     def __iter__(self) -> Iterator[str]:
-        if self._eos:
-            yield ""
-        for k in self._keys:
-            for w2 in self._keys[k]:
-                yield k + w2
+        return self._nodes.words(self._node, "")
+
+
+def _by_distance(item: Tuple[str, int]) -> Tuple[int, str]:
+    return item[1], item[0]
+
+
+def _first_row(size: int, over: int) -> List[int]:
+    """Get the row of edit distances at the root of a trie.
+
+    Distances above ``over - 1`` are all recorded as `over`.
+    """
+    return [min(i, over) for i in range(size + 1)]
+
+
+def _next_row(
+    word: str, row: List[int], ch: str, depth: int, nerrs: int
+) -> Tuple[List[int], int]:
+    """Get the row of edit distances at the end of an edge labelled `ch`.
+
+    The distances in `row` are those between `word[:i]` and the prefix
+    leading to the edge, of length ``depth - 1``.  Only the cells within
+    `nerrs` of the diagonal can hold distances up to `nerrs`, so the others
+    are not computed.  The smallest distance in the new row is returned
+    with it.
+    """
+    size = len(word)
+    over = nerrs + 1
+    new_row = [over] * (size + 1)
+    best = new_row[0] = depth if depth < over else over
+    lo = depth - nerrs if depth > nerrs else 1
+    left = new_row[lo - 1]
+    for i in range(lo, min(depth + nerrs, size) + 1):
+        # Substitution (or match), deletion, insertion
+        cost = row[i - 1]
+        if word[i - 1] != ch:
+            cost += 1
+        if row[i] < cost:
+            cost = row[i] + 1
+        if left < cost:
+            cost = left + 1
+        if cost > over:
+            cost = over
+        new_row[i] = left = cost
+        if cost < best:
+            best = cost
+    return new_row, best
+
+
+_next_row._DOC_ERRORS = ["nerrs", "nerrs"]  # type: ignore
+
+
+def _search(
+    nodes: _TrieNodes, node: int, word: str, nerrs: int
+) -> List[Tuple[str, int]]:
+    """Implement `Trie.search_distances` for the subtrie at `node`.
+
+    The trie is walked depth first, computing for each node a row of the
+    edit distances between the prefix leading to it and the prefixes of
+    `word`.  Nodes whose rows only hold distances above `nerrs` lead to no
+    word close enough, and are not visited further.
+    """
+    res = []  # type: List[Tuple[str, int]]
+    if nerrs < 0:
+        return res
+    if nerrs == 0:
+        # Exact match, without computing any rows
+        if nodes.contains(node, word):
+            res.append((word, 0))
+        return res
+    eos = nodes.eos
+    size = len(word)
+    over = nerrs + 1
+    stack = [(node, "", _first_row(size, over))]
+    while stack:
+        node, prefix, row = stack.pop()
+        if eos[node] and row[size] <= nerrs:
+            res.append((prefix, row[size]))
+        depth = len(prefix) + 1
+        for ch, child in nodes.children(node):
+            new_row, best = _next_row(word, row, ch, depth, nerrs)
+            if best <= nerrs:
+                stack.append((child, prefix + ch, new_row))
+    return res
+
+
+_search._DOC_ERRORS = ["nerrs"]  # type: ignore
+
+
+def _nearest(
+    nodes: _TrieNodes,
+    node: int,
+    word: str,
+    limit: int,
+    nerrs: int,
+    max_nodes: Optional[int],
+    deadline: Optional[float],
+) -> List[Tuple[str, int]]:
+    """Implement `Trie.nearest` for the subtrie at `node`.
+
+    The nodes are visited best first, in increasing order of the smallest
+    distance in their row, which no word below them can beat and which is
+    never less than that of their parent.  They wait in one stack per
+    distance.  Once the nodes up to a distance have all been visited, all
+    the words at that distance have been found.
+    """
+    res = []  # type: List[Tuple[str, int]]
+    if nerrs < 0 or limit <= 0:
+        return res
+    eos = nodes.eos
+    size = len(word)
+    pending = [[] for _ in range(nerrs + 1)]  # type: List[List[Any]]
+    pending[0].append((node, "", _first_row(size, nerrs + 1)))
+    found = [[] for _ in range(nerrs + 1)]  # type: List[List[str]]
+    visited = 0
+    for dist in range(nerrs + 1):
+        stack = pending[dist]
+        while stack:
+            if (max_nodes is not None and visited >= max_nodes) or (
+                deadline is not None and time.monotonic() > deadline
+            ):
+                # Out of budget: make do with the words found so far
+                for d in range(dist, nerrs + 1):
+                    res.extend((w, d) for w in sorted(found[d]))
+                return res[:limit]
+            visited += 1
+            node, prefix, row = stack.pop()
+            if eos[node] and row[size] <= nerrs:
+                found[row[size]].append(prefix)
+            depth = len(prefix) + 1
+            for ch, child in nodes.children(node):
+                new_row, best = _next_row(word, row, ch, depth, nerrs)
+                if best <= nerrs:
+                    pending[best].append((child, prefix + ch, new_row))
+        res.extend((w, dist) for w in sorted(found[dist]))
+        if len(res) >= limit:
+            break
+    return res[:limit]
 
 
 class PyPWL:
@@ -171,60 +511,166 @@ class PyPWL:
         will be read from this file, and new entries will be written to
         it automatically.
 
+        Removing words does not rewrite the file.  They are recorded in a
+        journal, a file named like `pwl` with ``.journal`` appended, along
+        with the words added after them.  The journal is replayed when the
+        list is read again, and merged into the file by `compact`, which
+        is called once the journal grows large enough.
+
         If `pwl` is not specified or None, the list is maintained in
         memory only.
         """
         self.provider = None
-        self._words = Trie()
+        # Incremented each time the set of accepted words may have changed
+        self._generation = 0
+        # Distinguishes this word list from others in suggestion caches
+        self._identity = object()
         if pwl is not None:
             self.pwl = os.path.abspath(pwl)  # type: Optional[str]
             self.tag = self.pwl
-            pwl_f = open(pwl)
-            for ln in pwl_f:
-                word = ln.strip()
-                self.add_to_session(word)
-            pwl_f.close()
+            # Building the trie all at once is much faster, and faster
+            # still for the sorted files written by compact().
+            with open(pwl) as pwl_f:
+                try:
+                    self._words = Trie.from_sorted(ln.strip() for ln in pwl_f)
+                except ValueError:
+                    pwl_f.seek(0)
+                    self._words = Trie(ln.strip() for ln in pwl_f)
+                self._pwl_size = os.fstat(pwl_f.fileno()).st_size
+            if self._pwl_size:
+                self._generation += 1
+            self._journal = self.pwl + ".journal"
+            self._journal_size = self._replay()
         else:
+            self._words = Trie()
             self.pwl = None
             self.tag = "PyPWL"
 
+    def _replay(self) -> int:
+        """Apply the records of the journal, returning its size.
+
+        A last record cut short while being written is removed from the
+        journal, so that the next record starts on a line of its own.
+        """
+        try:
+            journal_f = open(self._journal, "r+b")
+        except FileNotFoundError:
+            return 0
+        encoding = locale.getpreferredencoding(False)
+        with journal_f:
+            size = 0
+            for ln in journal_f:
+                if not ln.endswith(b"\n"):
+                    journal_f.truncate(size)
+                    break
+                size += len(ln)
+                record = ln.decode(encoding)
+                if record[0] == "+":
+                    self._words.insert(record[1:].strip())
+                elif record[0] == "-":
+                    self._words.remove(record[1:].strip())
+        if size:
+            self._generation += 1
+        return size
+
+    def _record(self, op: str, word: str) -> None:
+        """Append a record to the journal, compacting it if large enough."""
+        with open(self._journal, "a") as journal_f:
+            journal_f.write("%s%s\n" % (op, word.strip()))
+            journal_f.flush()
+            self._journal_size = os.fstat(journal_f.fileno()).st_size
+        if (
+            self._journal_size > _JOURNAL_MIN
+            and self._journal_size * 4 > self._pwl_size
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Merge the journal into the personal word list file.
+
+        The words are written to a new file, sorted, which then replaces
+        the old one.  The journal is only removed afterwards, so that the
+        words are read correctly even if this is interrupted.
+        """
+        if self.pwl is None:
+            return
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.pwl), prefix=".pwl")
+        try:
+            with os.fdopen(fd, "w") as pwl_f:
+                for w in self._words:
+                    pwl_f.write("%s\n" % (w.strip(),))
+                pwl_f.flush()
+                os.fsync(pwl_f.fileno())
+                size = os.fstat(pwl_f.fileno()).st_size
+            os.chmod(tmp, stat.S_IMODE(os.stat(self.pwl).st_mode))
+            os.replace(tmp, self.pwl)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        try:
+            os.remove(self._journal)
+        except FileNotFoundError:
+            pass
+        self._pwl_size = size
+        self._journal_size = 0
+
     def check(self, word: str) -> bool:
         """Check spelling of a word.
 
         This method takes a word in the dictionary language and returns
         `True` if it is correctly spelled, and `False` otherwise.
         """
-        res = self._words.search(word)
-        return bool(res)
+        return word in self._words
+
+    def check_many(self, words: Iterable[str]) -> bytearray:
+        """Check spelling of many words at once.
 
-    def suggest(self, word: str) -> List[str]:
+        This method returns a `bytearray` aligned with the given words,
+        holding 1 for each word that is correctly spelled and 0 otherwise.
+        """
+        contains = self._words.__contains__
+        return bytearray(contains(w) for w in words)
+
+    check_many._DOC_ERRORS = ["bytearray"]  # type: ignore
+
+    def suggest(
+        self,
+        word: str,
+        max_suggestions: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[str]:
         """Suggest possible spellings for a word.
 
         This method tries to guess the correct spelling for a given
-        word, returning the possibilities in a list.
+        word, returning the possibilities in a list, closest first.  At
+        most `max_suggestions` suggestions are returned, or 10 if it is not
+        given.
+
+        To bound the time taken by a suggestion, the search can be limited
+        to `max_nodes` nodes of the word list or `timeout` seconds, after
+        which the best suggestions found so far are returned.
         """
-        limit = 10
+        limit = 10 if max_suggestions is None else max_suggestions
         maxdepth = 5
-        # Iterative deepening until we get enough matches
-        depth = 0
-        res = self._words.search(word, depth)
-        while len(res) < limit and depth < maxdepth:
-            depth += 1
-            for w in self._words.search(word, depth):
-                if w not in res:
-                    res.append(w)
-        # Limit number of suggs
-        return res[:limit]
+        res = self._words.nearest(word, limit, maxdepth, max_nodes, timeout)
+        return [w for w, _ in res]
 
     def add(self, word: str) -> None:
         """Add a word to the user's personal dictionary.
         For a PWL, this means appending it to the file.
         """
-        if self.pwl is not None:
-            pwl_f = open(self.pwl, "a")
-            pwl_f.write("%s\n" % (word.strip(),))
-            pwl_f.close()
         self.add_to_session(word)
+        if self.pwl is None:
+            return
+        if self._journal_size:
+            # Keep it after the removals already recorded
+            self._record("+", word)
+        else:
+            with open(self.pwl, "a") as pwl_f:
+                pwl_f.write("%s\n" % (word.strip(),))
+                pwl_f.flush()
+                self._pwl_size = os.fstat(pwl_f.fileno()).st_size
 
     def add_to_pwl(self, word: str) -> None:
         """Add a word to the user's personal dictionary.
@@ -242,15 +688,14 @@ class PyPWL:
         # There's no exclude list for a stand-alone PWL.
         # Just remove it from the list.
         self._words.remove(word)
+        self._generation += 1
         if self.pwl is not None:
-            pwl_f = open(self.pwl, "wt")
-            for w in self._words:
-                pwl_f.write("%s\n" % (w.strip(),))
-            pwl_f.close()
+            self._record("-", word)
 
     def add_to_session(self, word: str) -> None:
         """Add a word to the session list."""
         self._words.insert(word)
+        self._generation += 1
 
     def store_replacement(self, mis: str, cor: str) -> None:
         """Store a replacement spelling for a miss-spelled word.
@@ -278,5 +723,14 @@ class PyPWL:
     def _check_this(self, msg: str) -> None:
         pass
 
+    def _cache_token(self) -> int:
+        return self._generation
+
+    def _suggest_state(self) -> Any:
+        if not self._generation:
+            # Empty, and so the same as any other empty list
+            return None
+        return (self._identity, self._generation)
+
     def _free(self) -> None:
         pass
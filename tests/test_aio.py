@@ -0,0 +1,106 @@
+"""Test cases for the asyncio interface in enchant.aio.
+These tests assume that there is at least one working provider
+with a dictionary for the "en_US" language.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from enchant.aio import AsyncDict, AsyncSpellChecker, SpellingError
+from enchant.checker import SpellChecker
+from enchant.tokenize import get_tokenizer
+
+
+def test_async_dict():
+    """Test that AsyncDict gives the same results as Dict."""
+
+    async def run():
+        async with AsyncDict("en_US", max_workers=2) as d:
+            assert await d.check("hello")
+            assert not await d.check("helo")
+            assert list(await d.check_many(["hello", "helo"])) == [1, 0]
+            suggs = await d.suggest("helo")
+            assert "hello" in suggs
+            assert await d.suggest("helo", max_suggestions=1) == suggs[:1]
+            await d.add_to_session("Flagen")
+            assert await d.check("Flagen")
+            await d.remove_from_session("Flagen")
+            assert not await d.check("Flagen")
+            with pytest.raises(ValueError):
+                await d.check("")
+
+    asyncio.run(run())
+
+
+def test_async_dict_coalescing():
+    """Test that identical concurrent requests are only run once."""
+
+    async def run():
+        async with AsyncDict("en_US", max_workers=2, max_pending=1) as d:
+            calls = []
+            suggest = d.pool.suggest
+
+            def counting_suggest(*args):
+                calls.append(args)
+                return suggest(*args)
+
+            d.pool.suggest = counting_suggest
+            results = await asyncio.gather(
+                *[d.suggest("helo") for _ in range(5)], d.suggest("tset")
+            )
+            assert len(calls) == 2
+            assert results[0] == results[4]
+            # Each caller gets a list of its own
+            assert results[0] is not results[1]
+
+    asyncio.run(run())
+
+
+def test_async_spellchecker():
+    """Test that AsyncSpellChecker agrees with SpellChecker."""
+    text = "This is sme text with a fw speling errors in it. " * 10
+
+    async def run(**kwds):
+        async with AsyncSpellChecker("en_US", text, **kwds) as chkr:
+            return [err async for err in chkr]
+
+    chkr = SpellChecker("en_US", text)
+    expected = [SpellingError(e.word, e.wordpos, e.suggest()) for e in chkr]
+    assert asyncio.run(run()) == expected
+    assert asyncio.run(run(batch_size=3, prefetch=1)) == expected
+
+
+def test_async_spellchecker_early_exit():
+    """Test that stopping the iteration early leaves nothing running."""
+
+    async def run():
+        async with AsyncDict("en_US") as d:
+            chkr = AsyncSpellChecker(d, "sme fw speling " * 10)
+            async for err in chkr:
+                assert err.word == "sme"
+                break
+            chkr.close()
+            assert await d.check("hello")
+
+    asyncio.run(run())
+
+
+def test_async_spellchecker_off_loop():
+    """Test that the text is tokenized outside of the event loop thread."""
+    threads = set()
+    base = get_tokenizer("en_US")
+
+    def tokenize(text):
+        for token in base(text):
+            threads.add(threading.current_thread())
+            yield token
+
+    async def run():
+        text = "sme fw speling " * 100
+        async with AsyncSpellChecker("en_US", text, tokenize) as chkr:
+            return [err.word async for err in chkr]
+
+    assert asyncio.run(run()) == ["sme", "fw", "speling"] * 100
+    assert threads and threading.current_thread() not in threads
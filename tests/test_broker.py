@@ -1,6 +1,8 @@
+import os
+
 import pytest
 
-from enchant import Broker
+from enchant import Broker, Error
 
 
 @pytest.fixture
@@ -79,6 +81,68 @@ def test_prov_ordering(broker):
             del b2
 
 
+def test_enumeration_is_cached(broker, monkeypatch):
+    """Test that the broker remembers providers and dictionaries."""
+    from enchant import _enchant
+
+    langs = broker.list_languages()
+    dicts = broker.list_dicts()
+    provs = broker.describe()
+    assert broker.dict_exists("en_US")
+    calls = []
+
+    def forbidden(*args):
+        calls.append(args)
+
+    for name in ["broker_list_dicts", "broker_describe", "broker_dict_exists"]:
+        monkeypatch.setattr(_enchant, name, forbidden)
+    assert broker.list_languages() == langs
+    assert broker.list_dicts() == dicts
+    assert broker.describe() == provs
+    assert broker.dict_exists("en_US")
+    assert not calls
+    # Callers can't corrupt the cache
+    broker.list_languages().clear()
+    assert broker.list_languages() == langs
+    # Changing the ordering invalidates the cache
+    monkeypatch.undo()
+    broker.set_ordering("en_US", provs[0].name)
+    monkeypatch.setattr(_enchant, "broker_dict_exists", forbidden)
+    broker.dict_exists("en_US")
+    assert calls
+
+
+def test_refresh(broker):
+    """Test that refresh() forgets what is known, and free() too."""
+    assert broker.dict_exists("en_US")
+    assert broker.list_languages()
+    broker.refresh()
+    assert broker.dict_exists("en_US")
+    assert broker.list_languages()
+    broker._free()
+    with pytest.raises(Error):
+        broker.dict_exists("en_US")
+
+
+def test_dict_handles_are_shared(broker, monkeypatch):
+    """Test that dicts for the same language are only described once."""
+    from enchant import _enchant
+
+    d1 = broker.request_dict("en_US")
+    monkeypatch.setattr(_enchant, "dict_describe", None)
+    d2 = broker.request_dict("en_US")
+    assert d2._this == d1._this
+    assert (d2.tag, d2.provider) == (d1.tag, d1.provider)
+    assert broker._live_dicts[d1._this] == 2
+    d2._free()
+    assert broker._live_dicts[d1._this] == 1
+    assert d1.check("hello")
+    this = d1._this
+    d1._free()
+    assert this not in broker._live_dicts
+    assert this not in broker._dict_handles
+
+
 def test_get_set_param(broker):
     """
     Scenario:
@@ -102,3 +166,85 @@ def test_get_set_param(broker):
         assert broker.get_param("pyenchant.unittest") == "testing"
         other_broker = Broker()
         assert other_broker.get_param("pyenchant.unittest") is None
+
+
+def test_preload(broker):
+    """Test that preloaded dictionaries are handed out again."""
+    broker.preload(["en_US"])
+    this = broker._preloaded["en_US"]._this
+    d = broker.request_dict("en_US")
+    assert d._this == this
+    assert broker._live_dicts[this] == 2
+    d._free()
+    assert this in broker._live_dicts
+
+
+def _in_child(func):
+    """Fork, and report whether `func()` is true in the child process."""
+    pid = os.fork()
+    if pid == 0:
+        try:
+            ok = func()
+        finally:
+            os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+    return os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="needs fork()")
+@pytest.mark.parametrize("reload_after_fork", [False, True])
+def test_dicts_after_fork(broker, tmp_path, reload_after_fork):
+    """Test that dictionaries can be used in a forked child process."""
+    broker.reload_after_fork = reload_after_fork
+    broker.preload(["en_US"])
+    d = broker.request_dict("en_US")
+    path = tmp_path / "pwl.txt"
+    path.write_text("Flagen\n")
+    pwl = broker.request_pwl_dict(str(path))
+    d.enable_check_cache()
+    assert d.check("hello")
+
+    def check():
+        return (
+            d.check("hello")
+            and not d.check("helo")
+            and "hello" in d.suggest("helo")
+            and pwl.check("Flagen")
+            and broker.request_dict("en_US").check("hello")
+        )
+
+    assert _in_child(check)
+    # The parent's C objects are only replaced when asked for
+    this = d._this
+    assert _in_child(lambda: (d._this != this) == reload_after_fork)
+    # The parent is not affected
+    assert check()
+
+
+def test_dict_budget(broker):
+    """Test that dictionaries are unloaded and loaded again as needed."""
+    tags = [t for t in broker.list_languages() if "_" in t][:3]
+    if len(tags) < 3:
+        pytest.skip("needs three languages")
+    broker.set_dict_budget(max_dicts=2)
+    d1, d2 = broker.request_dict(tags[0]), broker.request_dict(tags[1])
+    d1.check("hello")
+    d3 = broker.request_dict(tags[2])
+    # The least recently used dictionary was unloaded
+    assert [u[0] for u in broker.dict_usage()] == [tags[0], tags[2]]
+    assert broker.evictions == 1
+    assert d2._this is None
+    d2.check("hello")
+    assert [u[0] for u in broker.dict_usage()] == [tags[2], tags[1]]
+    assert broker.evictions == 2
+    assert d1._this is None
+    # Changed dictionaries are kept
+    d2.add_to_session("Flagen")
+    d1.check("hello")
+    d3.check("hello")
+    assert d2.check("Flagen")
+    assert broker.evictions == 4
+    broker.set_dict_budget()
+    d1 = broker.request_dict(tags[0])
+    assert len(broker.dict_usage()) == 3
+    assert all(size >= 0 for _, _, size in broker.dict_usage())
@@ -0,0 +1,62 @@
+"""Test cases for checking many documents at once with enchant.corpus.
+These tests assume that there is at least one working provider
+with a dictionary for the "en_US" language.
+"""
+
+import pytest
+
+from enchant.checker import SpellChecker
+from enchant.corpus import check_corpus
+from enchant.tokenize import URLFilter
+
+TEXTS = [
+    "This is sme text with a few speling mistakes.\n" * 3,
+    "",
+    "Nothing wrong here.",
+    "helo\nhelo there\n\nand wrld\n" * 20,
+]
+
+
+def expected_errors(text, filters=None):
+    chkr = SpellChecker("en_US", text, filters=filters)
+    return [(err.word, err.wordpos) for err in chkr]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_check_corpus(workers):
+    """Test that check_corpus() agrees with SpellChecker."""
+    expected = [expected_errors(text) for text in TEXTS]
+    assert expected[0] and expected[3]
+    assert check_corpus(TEXTS, "en_US", workers=workers) == expected
+    # Small shards split the larger documents
+    assert check_corpus(TEXTS, "en_US", workers=workers, shard_size=20) == expected
+
+
+def test_check_corpus_files(tmp_path):
+    """Test that check_corpus() reads documents from files."""
+    paths = []
+    for i, text in enumerate(TEXTS):
+        path = tmp_path / ("doc%d.txt" % i)
+        path.write_bytes(text.encode("utf-8"))
+        paths.append(path)
+    expected = [expected_errors(text) for text in TEXTS]
+    for shard_size in [7, 50, 1 << 16]:
+        assert check_corpus(paths, "en_US", 2, shard_size=shard_size) == expected
+    # Texts and paths can be mixed
+    mixed = [TEXTS[0], paths[3]]
+    assert check_corpus(mixed, "en_US", 1) == [expected[0], expected[3]]
+
+
+def test_check_corpus_filters():
+    """Test that check_corpus() applies the given filters."""
+    text = "see http://www.example.com/speling\n"
+    expected = expected_errors(text, [URLFilter])
+    assert expected == []
+    assert check_corpus([text], "en_US", 1, filters=[URLFilter]) == [expected]
+    assert check_corpus([text], "en_US", 1) != [[]]
+
+
+def test_check_corpus_bad_items():
+    """Test that check_corpus() rejects items that are not texts or paths."""
+    with pytest.raises(TypeError):
+        check_corpus([b"some bytes"], "en_US", 1)
@@ -9,6 +9,7 @@ import pytest
 
 import enchant
 from enchant import Dict, DictNotFoundError, Error, dict_exists
+from enchant.cache import SuggestionCache
 from enchant.utils import get_default_language
 
 
@@ -34,6 +35,90 @@ def test_check(en_us_dict):
         en_us_dict.check("")
 
 
+def test_check_many(en_us_dict):
+    """Test that check_many() agrees with check()."""
+    words = ["hello", "helo", "test", "testt", "hello"]
+    res = en_us_dict.check_many(words)
+    assert isinstance(res, bytearray)
+    assert list(res) == [en_us_dict.check(w) for w in words]
+    assert en_us_dict.check_many(iter(words)) == res
+    assert en_us_dict.check_many([]) == bytearray()
+    with pytest.raises(ValueError):
+        en_us_dict.check_many(["hello", ""])
+
+
+def test_check_cache(en_us_dict):
+    """Test that the check cache remembers results and is invalidated."""
+    en_us_dict.enable_check_cache(maxsize=2)
+    cache = en_us_dict.check_cache
+    assert not en_us_dict.check("Flagen")
+    assert not en_us_dict.check("Flagen")
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert list(en_us_dict.check_many(["Flagen", "hello", "Flagen"])) == [0, 1, 0]
+    assert (cache.hits, cache.misses) == (3, 2)
+    assert en_us_dict.check("test")
+    assert len(cache) == 2
+    # Changes made through another object sharing the dictionary are seen
+    other = Dict("en_US")
+    other.add_to_session("Flagen")
+    assert en_us_dict.check("Flagen")
+    other.remove_from_session("Flagen")
+    assert not en_us_dict.check("Flagen")
+    en_us_dict.disable_check_cache()
+    assert en_us_dict.check_cache is None
+    assert en_us_dict.check("hello")
+
+
+def test_suggestion_cache(en_us_dict):
+    """Test that the suggestion cache remembers results and is invalidated."""
+    cache = en_us_dict.suggestion_cache = SuggestionCache()
+    expected = en_us_dict.suggest("helo")
+    assert en_us_dict.suggest("helo") == expected
+    assert en_us_dict.suggest("helo", max_suggestions=1) == expected[:1]
+    assert (cache.hits, cache.misses) == (1, 2)
+    # Dictionaries in the same state share entries
+    other = Dict("en_US")
+    other.suggestion_cache = cache
+    assert other.suggest("helo") == expected
+    assert cache.hits == 2
+    # Changes made to the dictionary make the old entries unreachable
+    other.add_to_session("helio")
+    assert "helio" in en_us_dict.suggest("helo")
+    other.store_replacement("helo", "hello")
+    assert en_us_dict.suggest("helo")
+    assert (cache.hits, cache.misses) == (2, 4)
+    other.remove_from_session("helio")
+    assert "helio" not in en_us_dict.suggest("helo")
+
+
+def test_suggestion_cache_limits(monkeypatch):
+    """Test that the suggestion cache respects its size and age limits."""
+    cache = SuggestionCache(maxsize=2)
+    cache.put("a", ["x"])
+    cache.put("b", ["y"])
+    assert cache.get("a") == ["x"]
+    cache.put("c", ["z"])
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    cache = SuggestionCache(max_bytes=1000)
+    cache.put("a", ["x" * 500])
+    cache.put("b", ["y" * 500])
+    assert cache.get("a") is None
+    assert cache.get("b") == ["y" * 500]
+    assert 500 < cache.nbytes <= 1000
+    cache.put("c", ["z" * 2000])
+    assert cache.get("c") is None
+    now = [100.0]
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+    cache = SuggestionCache(ttl=10)
+    cache.put("a", ["x"])
+    now[0] += 5
+    assert cache.get("a") == ["x"]
+    now[0] += 5
+    assert cache.get("a") is None
+    assert cache.nbytes == 0
+
+
 def test_broker(en_us_dict):
     """Test that the dict's broker is set correctly."""
     assert en_us_dict._broker is enchant._broker
@@ -52,6 +137,29 @@ def test_suggest(en_us_dict):
         en_us_dict.suggest("")
 
 
+def test_suggest_max_suggestions(en_us_dict):
+    """Test that suggest() can be limited to the best suggestions."""
+    suggs = en_us_dict.suggest("helo")
+    assert len(suggs) > 2
+    assert en_us_dict.suggest("helo", max_suggestions=2) == suggs[:2]
+    assert en_us_dict.suggest("helo", max_suggestions=100) == suggs
+    assert en_us_dict.suggest("helo", max_suggestions=0) == []
+
+
+def test_suggest_many(en_us_dict):
+    """Test that suggest_many() agrees with suggest(), in input order."""
+    words = ["helo", "recieve", "teh", "Thiis", "helo"]
+    expected = [en_us_dict.suggest(w) for w in words]
+    for max_workers in (1, 3):
+        timings = []
+        assert en_us_dict.suggest_many(words, max_workers, timings) == expected
+        assert len(timings) == len(words)
+        assert all(t >= 0 for t in timings)
+    assert en_us_dict.suggest_many([]) == []
+    with pytest.raises(ValueError):
+        en_us_dict.suggest_many(["helo", ""])
+
+
 def test_suggest_hang_1(en_us_dict):
     """Test whether suggest() hangs on some inputs (Bug #1404196)"""
     assert en_us_dict.suggest("Thiis")
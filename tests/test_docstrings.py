@@ -44,15 +44,20 @@ WORDS = [
     "docstring",
     "docstrings",
     "stopiteration",
+    "valueerror",
     "pwls",
     "pypwl",
     "dictwithpwl",
+    "dictpool",
+    "multidict",
     "skippable",
     "dicts",
     "dict's",
     "filenames",
     "fr",
     "trie",
+    "subtrie",
+    "subtries",
     "api",
     "ctypes",
     "wxspellcheckerdialog",
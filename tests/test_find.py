@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from enchant import _enchant
+
+
+@pytest.fixture
+def find_env(tmp_path, monkeypatch):
+    """Make the library search go through a fake from_system()."""
+    for name in list(os.environ):
+        if name.startswith("PYENCHANT_"):
+            monkeypatch.delenv(name)
+    cache_path = tmp_path / "cache" / "find_cache.json"
+    monkeypatch.setattr(_enchant, "find_cache_path", lambda: str(cache_path))
+    monkeypatch.setattr(_enchant, "from_package_resources", lambda: None)
+    monkeypatch.setattr(_enchant, "VERBOSE_FIND", False)
+    library_path = tmp_path / "libenchant-fake.so"
+    library_path.write_text("")
+    calls = []
+
+    def from_system():
+        calls.append(1)
+        return str(library_path)
+
+    monkeypatch.setattr(_enchant, "from_system", from_system)
+    return library_path, calls
+
+
+def test_find_cache(find_env):
+    """Test that the result of the system search is cached."""
+    library_path, calls = find_env
+    assert _enchant.find_c_enchant_lib() == str(library_path)
+    assert _enchant.find_c_enchant_lib() == str(library_path)
+    assert len(calls) == 1
+
+
+def test_find_cache_invalidation(find_env, monkeypatch):
+    """Test that the cache is invalidated when the library or env change."""
+    library_path, calls = find_env
+    _enchant.find_c_enchant_lib()
+    stat = os.stat(library_path)
+    os.utime(library_path, (stat.st_atime, stat.st_mtime + 10))
+    _enchant.find_c_enchant_lib()
+    assert len(calls) == 2
+    monkeypatch.setenv("PYENCHANT_SOMETHING", "else")
+    _enchant.find_c_enchant_lib()
+    assert len(calls) == 3
+    _enchant.find_c_enchant_lib()
+    assert len(calls) == 3
+
+
+def test_find_cache_bypass(find_env, monkeypatch, capsys):
+    """Test that the cache can be bypassed, and reports hits when verbose."""
+    library_path, calls = find_env
+    monkeypatch.setenv("PYENCHANT_VERBOSE_FIND", "1")
+    _enchant.find_c_enchant_lib()
+    assert "cache miss" in capsys.readouterr().out
+    _enchant.find_c_enchant_lib()
+    assert "cache hit" in capsys.readouterr().out
+    monkeypatch.setenv("PYENCHANT_NO_FIND_CACHE", "1")
+    _enchant.find_c_enchant_lib()
+    assert len(calls) == 2
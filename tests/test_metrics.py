@@ -0,0 +1,127 @@
+"""Test cases for the performance counters in enchant.metrics.
+These tests assume that there is at least one working provider
+with a dictionary for the "en_US" language.
+"""
+
+import pytest
+
+import enchant
+from enchant import metrics
+from enchant.checker import SpellChecker
+from enchant.tokenize import URLFilter
+
+
+@pytest.fixture
+def recording():
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def values(name):
+    return {
+        tuple(sorted(entry["labels"].items())): entry
+        for entry in metrics.snapshot().get(name, [])
+    }
+
+
+def test_disabled():
+    """Test that nothing is recorded or replaced while disabled."""
+    check = enchant.Dict.check
+    metrics.reset()
+    metrics.enable()
+    assert metrics.is_enabled()
+    assert enchant.Dict.check is not check
+    metrics.disable()
+    assert not metrics.is_enabled()
+    assert enchant.Dict.check is check
+    metrics.reset()
+    enchant.Dict("en_US").check("hello")
+    assert metrics.snapshot() == {}
+
+
+def test_missing_lib(monkeypatch):
+    """Test that metrics can be enabled without the C library."""
+    check = enchant.pypwl.PyPWL.check
+    monkeypatch.setattr(enchant, "_load_lib", lambda: None)
+    metrics.reset()
+    metrics.enable()
+    try:
+        assert metrics.is_enabled()
+        assert enchant.pypwl.PyPWL.check is not check
+    finally:
+        metrics.disable()
+    assert enchant.pypwl.PyPWL.check is check
+
+
+def test_histogram_counts(recording):
+    """Test that histogram counts are integers."""
+    metrics.observe("example_seconds", (), 0.5)
+    metrics.observe("example_seconds", (), 100.0)
+    (entry,) = metrics.snapshot()["example_seconds"]
+    assert entry["count"] == 2
+    assert isinstance(entry["count"], int)
+    assert entry["buckets"]["+Inf"] == 2
+    assert all(isinstance(n, int) for n in entry["buckets"].values())
+
+
+def test_calls(recording):
+    """Test that calls are counted and timed by method and provider."""
+    d = enchant.Dict("en_US")
+    provider = d.provider.name
+    d.check("hello")
+    d.check("helo")
+    d.check_many(["hello", "helo"])
+    d.suggest("helo")
+    enchant.Broker().request_dict("en_US")
+    calls = values("enchant_call_seconds")
+    entry = calls[(("method", "check"), ("provider", provider))]
+    assert entry["count"] == 2
+    assert entry["buckets"]["+Inf"] == 2
+    assert entry["sum"] > 0
+    assert calls[(("method", "check_many"), ("provider", provider))]["count"] == 1
+    assert calls[(("method", "suggest"), ("provider", provider))]["count"] == 1
+    assert calls[(("method", "request_dict"), ("provider", provider))]["count"] == 1
+    c_calls = values("enchant_c_call_seconds")
+    assert c_calls[(("function", "dict_check"),)]["count"] == 2
+    assert c_calls[(("function", "dict_suggest"),)]["count"] == 1
+
+
+def test_caches(recording):
+    """Test that cache lookups are counted."""
+    d = enchant.Dict("en_US")
+    d.enable_check_cache()
+    d.check("hello")
+    d.check("hello")
+    lookups = values("enchant_cache_lookups_total")
+    assert lookups[(("cache", "check"), ("result", "hit"))]["value"] == 1
+    assert lookups[(("cache", "check"), ("result", "miss"))]["value"] == 1
+
+
+def test_spellchecker(recording):
+    """Test that tokens and errors are counted."""
+    chkr = SpellChecker("en_US", filters=[URLFilter])
+    chkr.set_text("This is sme text, see http://example.com")
+    assert [err.word for err in chkr] == ["sme"]
+    assert values("enchant_spellchecker_errors_total") == {
+        (("lang", "en_US"),): {"labels": {"lang": "en_US"}, "value": 1}
+    }
+    tokens = values("enchant_tokens_total")
+    assert tokens[(("stage", "URLFilter"),)]["value"] == 5
+    assert tokens[(("stage", "basic_tokenize"),)]["value"] == 6
+
+
+def test_prometheus_text(recording):
+    """Test the output in the Prometheus text format."""
+    d = enchant.Dict("en_US")
+    d.check("hello")
+    text = metrics.prometheus_text()
+    provider = d.provider.name
+    labels = 'method="check",provider="%s"' % provider
+    assert "# TYPE enchant_call_seconds histogram\n" in text
+    assert 'enchant_call_seconds_bucket{%s,le="+Inf"} 1\n' % labels in text
+    assert "enchant_call_seconds_count{%s} 1\n" % labels in text
+    assert text.endswith("\n")
+    assert metrics._format_labels({"a": 'x"y\n'}) == '{a="x\\"y\\n"}'
@@ -1,3 +1,7 @@
+import subprocess
+import sys
+import textwrap
+
 import enchant
 
 
@@ -14,3 +18,22 @@ def test_get_user_config_dir():
         assert user_dir
     except AttributeError:
         assert True
+
+
+def test_import_is_lazy():
+    """Importing enchant must not load the C library or create a broker."""
+    code = textwrap.dedent(
+        """\
+        import sys
+        import enchant
+        import enchant.checker
+        import enchant.tokenize
+        import enchant.utils
+        assert "enchant._enchant" not in sys.modules
+        assert "_broker" not in vars(enchant)
+        assert enchant.dict_exists("en_US")
+        assert "enchant._enchant" in sys.modules
+        assert enchant.request_dict.__self__ is enchant._broker
+        """
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,124 @@
+import threading
+
+import pytest
+
+from enchant import Broker, DictNotFoundError, MultiDict
+from enchant.cache import SuggestionCache
+from enchant.checker import SpellChecker
+
+
+@pytest.fixture
+def broker():
+    res = Broker()
+    yield res
+    del res
+
+
+@pytest.fixture
+def multi(broker, tmp_path):
+    path = tmp_path / "pwl.txt"
+    path.write_text("Flagen\nFlagon\n")
+    res = MultiDict(["en_US", broker.request_pwl_dict(str(path))], broker)
+    yield res
+    res.close()
+
+
+def test_check(multi):
+    """Test that words of any of the dictionaries are accepted."""
+    assert multi.tag == "en_US"
+    assert multi.check("hello")
+    assert multi._last == 0
+    assert multi.check("Flagen")
+    assert multi._last == 1
+    assert multi.check("hello")
+    assert not multi.check("helo")
+    with pytest.raises(ValueError):
+        multi.check("")
+
+
+def test_check_many(multi):
+    """Test that check_many() agrees with check()."""
+    words = ["hello", "Flagen", "helo", "Flagon", "test"]
+    assert list(multi.check_many(words)) == [multi.check(w) for w in words]
+    assert multi.check_many([]) == bytearray()
+
+
+def test_check_tries_last_match_first(multi, monkeypatch):
+    """Test that the dictionary which last accepted a word is tried first."""
+    assert multi.check("Flagen")
+    calls = []
+    en_us = multi.dicts[0]
+    monkeypatch.setattr(en_us, "check", lambda w: calls.append(w) or True)
+    assert multi.check("Flagon")
+    assert calls == []
+
+
+def test_suggest(multi):
+    """Test that suggestions are merged and ranked by distance."""
+    en_us, pwl = multi.dicts
+    suggs = multi.suggest("Flagn")
+    assert suggs[:2] == ["Flagen", "Flagon"] or suggs[:2] == ["Flagon", "Flagen"]
+    assert set(suggs) == set(en_us.suggest("Flagn")) | set(pwl.suggest("Flagn"))
+    assert len(set(suggs)) == len(suggs)
+    assert multi.suggest("Flagn", max_suggestions=1) == suggs[:1]
+    assert "hello" in multi.suggest("helo")
+    # Any distance can be used
+    multi.distance = lambda a, b: -len(b)
+    suggs = multi.suggest("Flagn")
+    assert [len(s) for s in suggs] == sorted((len(s) for s in suggs), reverse=True)
+
+
+def test_suggest_threads(broker):
+    """Test that the threads use copies of the dictionaries, not their caches."""
+    threads = set()
+
+    class RecordingCache(SuggestionCache):
+        def get(self, key):
+            threads.add(threading.current_thread())
+            return super().get(key)
+
+        def put(self, key, value):
+            threads.add(threading.current_thread())
+            super().put(key, value)
+
+    with MultiDict(["en_US", "en_US"], broker) as multi:
+        cache = RecordingCache()
+        for d in multi.dicts:
+            d.suggestion_cache = cache
+        expected = multi.dicts[0]._suggest("helo")
+        assert multi.suggest("helo") == expected
+        assert multi.suggest("helo") == expected
+        assert threads == {threading.current_thread()}
+        copies = [copy for _, copy in multi._copies.values()]
+        assert len(copies) == 2
+        assert all(c._broker is not broker for c in copies)
+        # A dictionary whose session changed is used directly
+        multi.dicts[1].add_to_session("Flagen")
+        assert multi._copy(1) is None
+        assert "hello" in multi.suggest("helo")
+    assert multi._copies == {}
+
+
+def test_session(multi):
+    """Test that words are added to the first dictionary only."""
+    multi.add_to_session("Lozz")
+    assert multi.dicts[0].check("Lozz")
+    assert multi.is_added("Lozz")
+    multi.remove_from_session("Flagen")
+    assert not multi.check("Flagen")
+    assert multi.is_removed("Flagen")
+
+
+def test_spellchecker(multi):
+    """Test that a MultiDict can be used by SpellChecker."""
+    chkr = SpellChecker(multi, "hello Flagen helo")
+    assert [err.word for err in chkr] == ["helo"]
+    assert "hello" in chkr.suggest("helo")
+
+
+def test_errors(broker):
+    """Test that missing or unknown dictionaries are rejected."""
+    with pytest.raises(ValueError):
+        MultiDict([])
+    with pytest.raises(DictNotFoundError):
+        MultiDict(["en_US", "xx_YY"], broker)
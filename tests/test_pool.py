@@ -0,0 +1,99 @@
+"""Test cases for sharing dictionaries between threads using DictPool.
+These tests assume that there is at least one working provider
+with a dictionary for the "en_US" language.
+"""
+
+import threading
+
+import pytest
+
+from enchant import DictNotFoundError, DictPool, Error
+
+
+@pytest.fixture
+def pool():
+    res = DictPool("en_US", size=2)
+    yield res
+    res.close()
+
+
+def test_missing_language():
+    """Test that DictPool fails early for unknown languages."""
+    with pytest.raises(DictNotFoundError):
+        DictPool("zz_ZZ")
+
+
+def test_acquire(pool):
+    """Test that borrowed dictionaries are independent and reused."""
+    with pool.acquire() as d1:
+        with pool.acquire() as d2:
+            assert d1 is not d2
+            assert d1._this != d2._this
+            assert d1.check("hello") and d2.check("hello")
+    with pool.acquire() as d3:
+        assert d3 is d2
+    assert pool.check("hello")
+    assert not pool.check("helo")
+    assert list(pool.check_many(["hello", "helo"])) == [1, 0]
+    assert "hello" in pool.suggest("helo")
+
+
+def test_acquire_waits(pool):
+    """Test that acquire() waits for a dictionary to be given back."""
+    acquired = threading.Event()
+    with pool.acquire() as d1:
+        with pool.acquire():
+
+            def borrow():
+                with pool.acquire() as d:
+                    assert d is d1
+                    acquired.set()
+
+            t = threading.Thread(target=borrow)
+            t.start()
+            assert not acquired.wait(0.1)
+    t.join()
+    assert acquired.is_set()
+
+
+def test_session_is_shared(pool):
+    """Test that session changes made through the pool reach every dictionary."""
+    with pool.acquire():
+        pool.add_to_session("Flagen")
+    with pool.acquire() as d1:
+        with pool.acquire() as d2:
+            assert d1.check("Flagen") and d2.check("Flagen")
+    pool.remove_from_session("hello")
+    pool.remove_from_session("Flagen")
+    with pool.acquire() as d1:
+        with pool.acquire() as d2:
+            assert not d1.check("Flagen") and not d2.check("Flagen")
+            assert not d1.check("hello") and not d2.check("hello")
+
+
+def test_threads(pool):
+    """Test that many threads can check words through the pool at once."""
+    words = ["hello", "helo", "test", "testt"] * 50
+    expected = pool.check_many(words)
+    results = []
+
+    def run():
+        for _ in range(10):
+            results.append(pool.check_many(words) == expected)
+            results.append(all(pool.check(w) == v for w, v in zip(words, expected)))
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [True] * 160
+    assert pool._count <= pool.size
+
+
+def test_close():
+    """Test that a closed pool refuses to lend dictionaries."""
+    with DictPool("en_US", size=1) as pool:
+        assert pool.check("hello")
+    with pytest.raises(Error):
+        pool.check("hello")
@@ -0,0 +1,81 @@
+"""Test cases for profiling spellchecking with enchant.profile.
+These tests assume that there is at least one working provider
+with a dictionary for the "en_US" language.
+"""
+
+import json
+import threading
+
+from enchant.checker import SpellChecker
+from enchant.profile import profile_checker
+from enchant.tokenize import HTMLChunker, URLFilter, tokenize
+
+TEXT = "<p>Some <b>txet</b>, see http://example.com/speling</p>\n" * 10
+
+
+def test_profile_checker():
+    """Test that each stage of the pipeline is measured."""
+    chkr = SpellChecker("en_US", chunkers=[HTMLChunker], filters=[URLFilter])
+    chkr.set_text(TEXT)
+    expected = [(err.word, err.wordpos) for err in chkr]
+    next_method = tokenize.__next__
+    profile = profile_checker(chkr, TEXT, suggest=True)
+    stages = {s["name"]: s for s in profile.stages}
+    assert profile.stages[0]["name"] == "SpellChecker"
+    assert profile.errors == 10
+    assert stages["SpellChecker"]["tokens_in"] == 30
+    assert stages["check"]["calls"] == 30
+    assert stages["suggest"]["calls"] == 10
+    assert stages["URLFilter"]["tokens_in"] == 40
+    assert stages["URLFilter"]["tokens_out"] == 30
+    assert stages["HTMLChunker"]["tokens_out"] == 40
+    assert stages["enchant.tokenize.en.tokenize"]["tokens_out"] == 30
+    for s in profile.stages:
+        assert 0 <= s["self_seconds"] <= s["total_seconds"]
+    total = sum(s["self_seconds"] for s in profile.stages)
+    assert abs(total - stages["SpellChecker"]["total_seconds"]) < 1e-3
+    # Everything is put back as it was
+    assert tokenize.__next__ is next_method
+    assert "check" not in vars(chkr.dict)
+    chkr.set_text(TEXT)
+    assert [(err.word, err.wordpos) for err in chkr] == expected
+    # Output formats
+    assert json.loads(profile.to_json())["stages"] == profile.stages
+    text = profile.to_text()
+    assert "URLFilter" in text
+    assert text.endswith("10 errors found")
+
+
+def test_profile_checker_threads():
+    """Test that overlapping profiles in two threads are both measured."""
+    started = threading.Event()
+    release = threading.Event()
+    next_method = tokenize.__next__
+    profiles = []
+
+    def blocking_check(word):
+        started.set()
+        release.wait()
+        return True
+
+    def profile_blocked():
+        chkr = SpellChecker("en_US", filters=[URLFilter])
+        chkr.dict.check = blocking_check
+        profiles.append(profile_checker(chkr, "see http://example.com"))
+
+    thread = threading.Thread(target=profile_blocked)
+    thread.start()
+    try:
+        started.wait()
+        chkr = SpellChecker("en_US", chunkers=[HTMLChunker], filters=[URLFilter])
+        profile = profile_checker(chkr, TEXT)
+        assert profile.errors == 10
+        # The other thread is still being profiled
+        assert tokenize.__next__ is not next_method
+    finally:
+        release.set()
+        thread.join()
+    stages = {s["name"]: s for s in profiles[0].stages}
+    assert stages["URLFilter"]["tokens_in"] == 2
+    assert stages["URLFilter"]["tokens_out"] == 1
+    assert tokenize.__next__ is next_method
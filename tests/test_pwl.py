@@ -1,8 +1,11 @@
+import pickle
 import sys
 
 import pytest
 
-from enchant import DictWithPWL, PyPWL, request_pwl_dict
+from enchant import Dict, DictWithPWL, PyPWL, request_pwl_dict
+from enchant.cache import SuggestionCache
+from enchant.pypwl import Trie
 
 
 @pytest.fixture
@@ -78,6 +81,129 @@ def test_dwpwl(tmp_path, pwl_path):
     assert not d.check("Lozz")
 
 
+def test_dwpwl_check_many(tmp_path, pwl_path):
+    """Test that DictWithPWL.check_many() agrees with check()."""
+    set_pwl_contents(pwl_path, ["Sazz", "Lozz"])
+    d = DictWithPWL("en_US", str(pwl_path), str(tmp_path / "pel.txt"))
+    d.remove("hello")
+    words = ["Sazz", "hello", "helo", "there", "Lozz", "Flagen"]
+    assert list(d.check_many(words)) == [d.check(w) for w in words]
+    assert list(d.check_many(words)) == [1, 0, 0, 1, 1, 0]
+
+
+def test_dwpwl_check_cache(tmp_path, pwl_path):
+    """Test that editing the word lists invalidates the check cache."""
+    set_pwl_contents(pwl_path, ["Sazz", "Lozz"])
+    for pwl, pel in [(str(pwl_path), str(tmp_path / "pel.txt")), (None, None)]:
+        d = DictWithPWL("en_US", pwl, pel)
+        d.enable_check_cache()
+        assert d.check("hello")
+        assert not d.check("Flagen")
+        d.add("Flagen")
+        assert d.check("Flagen")
+        d.remove("hello")
+        assert not d.check("hello")
+        assert list(d.check_many(["hello", "Flagen"])) == [0, 1]
+        d.pel.remove("hello")
+        assert d.check("hello")
+
+
+def test_dwpwl_suggestion_cache(tmp_path, pwl_path):
+    """Test that editing the word lists invalidates cached suggestions."""
+    set_pwl_contents(pwl_path, ["Sazz", "Lozz"])
+    d = DictWithPWL("en_US", str(pwl_path), str(tmp_path / "pel.txt"))
+    d.suggestion_cache = SuggestionCache()
+    assert "Sazz" in d.suggest("Sazzz")
+    assert "Lozz" not in d.suggest("Sazzz")
+    d.add("Sazzy")
+    assert "Sazzy" in d.suggest("Sazzz")
+    d.remove("Sazz")
+    assert "Sazz" not in d.suggest("Sazzz")
+    assert d.suggest("Sazzz", max_suggestions=1) == d.suggest("Sazzz")[:1]
+    # A plain dictionary sharing the cache does not see the word lists
+    plain = Dict("en_US")
+    plain.suggestion_cache = d.suggestion_cache
+    assert "Sazzy" not in plain.suggest("Sazzz")
+
+
+def test_pwl_suggestion_cache_shared(tmp_path):
+    """Test that dictionaries for different PWL files share a cache safely."""
+    path_a = tmp_path / "a.txt"
+    path_b = tmp_path / "b.txt"
+    set_pwl_contents(path_a, ["apple", "apricot"])
+    set_pwl_contents(path_b, ["almond", "avocado"])
+    cache = SuggestionCache()
+    pa = request_pwl_dict(str(path_a))
+    pb = request_pwl_dict(str(path_b))
+    pa.suggestion_cache = pb.suggestion_cache = cache
+    assert "apple" in pa.suggest("apxle")
+    assert "apple" not in pb.suggest("apxle")
+    da = DictWithPWL("en_US", str(path_a))
+    db = DictWithPWL("en_US", str(path_b))
+    da.suggestion_cache = db.suggestion_cache = cache
+    assert "apricot" in da.suggest("apricxt")
+    assert "apricot" not in db.suggest("apricxt")
+
+
+def test_dwpwl_snapshots():
+    """Test that in-memory word lists are checked using up-to-date sets."""
+    d = DictWithPWL("en_US", None, None)
+    assert not d.check("Flagen")
+    d.add("Flagen")
+    assert d.check("Flagen")
+    assert d._snapshots["pwl"][1] == {"Flagen"}
+    d.remove("hello")
+    assert list(d.check_many(["hello", "Flagen", "there"])) == [0, 1, 1]
+    # Changes made directly to the word lists are noticed
+    d.pwl.add_to_session("Sazz")
+    d.pel.remove("hello")
+    assert d.check("Sazz")
+    assert d.check("hello")
+    assert list(d.check_many(["hello", "Sazz"])) == [1, 1]
+    # So is replacing them with other lists at the same generation
+    generation = d.pwl._generation
+    d.pwl = PyPWL()
+    d.pwl.add_to_session("bar")
+    d.pwl.add_to_session("baz")
+    assert d.pwl._generation == generation
+    assert not d.check("Sazz")
+    assert d.check("bar")
+
+
+def test_dwpwl_suggest_order(tmp_path, pwl_path):
+    """Test the order of suggestions and the effect of max_suggestions."""
+    set_pwl_contents(pwl_path, ["Helo", "helot"])
+    for pel in [str(tmp_path / "pel.txt"), None]:
+        d = DictWithPWL("en_US", str(pwl_path), pel)
+        base = Dict("en_US").suggest("helo")
+        from_pwl = [w for w in d.pwl.suggest("helo") if w not in base]
+        assert from_pwl
+        assert d.suggest("helo") == base + from_pwl
+        d.remove(base[0])
+        assert d.suggest("helo") == base[1:] + from_pwl
+        # The word list is only searched if needed
+        calls = []
+        pwl_suggest = d.pwl.suggest
+        d.pwl.suggest = lambda w: calls.append(w) or pwl_suggest(w)
+        assert d.suggest("helo", max_suggestions=2) == base[1:3]
+        assert calls == []
+        n = len(base) + 1
+        assert d.suggest("helo", max_suggestions=n) == (base[1:] + from_pwl)[:n]
+        assert calls == ["helo"]
+
+
+def test_dwpwl_suggest_many(tmp_path, pwl_path):
+    """Test that DictWithPWL.suggest_many() agrees with suggest()."""
+    set_pwl_contents(pwl_path, ["Sazz", "Lozz"])
+    d = DictWithPWL("en_US", str(pwl_path), str(tmp_path / "pel.txt"))
+    d.remove("hello")
+    words = ["helo", "Sazzz", "Loz"]
+    expected = [d.suggest(w) for w in words]
+    assert "hello" not in expected[0]
+    assert "Sazz" in expected[1]
+    assert d.suggest_many(words, max_workers=2) == expected
+
+
 def test_dwpwl_empty(tmp_path):
     """Test functionality of DictWithPWL using transient dicts."""
     d = DictWithPWL("en_US", None, None)
@@ -104,9 +230,156 @@ def test_pypwl(tmp_path):
     assert "hello" in ws
     assert "there" in ws
     assert "duck" in ws
+    assert list(d.check_many(["duck", "goose", "hello"])) == [1, 0, 1]
     d.remove("duck")
     d.remove("notinthere")
     ws = list(d._words)
     assert len(ws) == 2
     assert "hello" in ws
     assert "there" in ws
+
+
+def test_trie():
+    """Test the compact trie behind PyPWL."""
+    words = ["duck", "duckling", "dude", "", "zebra", "été", "duck"]
+    t = Trie(words)
+    assert list(t) == sorted(set(words))
+    assert sorted(t["d"]["u"]) == ["ck", "ckling", "de"]
+    with pytest.raises(KeyError):
+        t["x"]
+    assert t.search("duck") == ["duck"]
+    assert "duck" in t
+    assert "" in t
+    assert "du" not in t
+    assert "ducks" not in t
+    assert "ck" in t["d"]["u"]
+    assert t.search("duk", 1) == ["duck"]
+    assert sorted(t.search("duk", 2)) == ["duck", "dude"]
+    assert t.search("éte", 1) == ["été"]
+    t.insert("dune")
+    t.insert("ax")
+    t.remove("duck")
+    t.remove("notinthere")
+    assert list(t) == sorted(set(words) - {"duck"} | {"dune", "ax"})
+    assert t.search("duck") == []
+    assert "duck" not in t
+    assert "dune" in t
+    assert "ax" in t
+    assert "a" not in t
+    t2 = pickle.loads(pickle.dumps(t))
+    assert list(t2) == list(t)
+
+
+def test_trie_compaction():
+    """Test that words added or removed survive compaction of the trie."""
+    t = Trie(["w%d" % i for i in range(0, 5000, 2)])
+    nodes = t._nodes
+    size = len(nodes.first)
+    for i in range(1, 5000, 2):
+        t.insert("w%d" % i)
+        t.remove("w%d" % (i - 1))
+    # The trie was compacted, keeping only the words left
+    assert len(nodes.first) != size
+    assert len(nodes.eos) < 2 * size
+    assert list(t) == sorted("w%d" % i for i in range(1, 5000, 2))
+    assert t.search("w4999") == ["w4999"]
+    assert t.search("w4998") == []
+
+
+def test_trie_search_distances():
+    """Test that fuzzy searches rank each word found by its distance."""
+    t = Trie(["duck", "duckling", "dude", "dune", "luck", "deck", "due"])
+    assert t.search_distances("duck", 0) == [("duck", 0)]
+    assert t.search_distances("duck", 2) == [
+        ("duck", 0),
+        ("deck", 1),
+        ("luck", 1),
+        ("dude", 2),
+        ("due", 2),
+        ("dune", 2),
+    ]
+    assert t.search("duck", 2, max_results=3) == ["duck", "deck", "luck"]
+    assert t.search("dukling", 1) == ["duckling"]
+    assert t.search("dukling", -1) == []
+    assert t["d"].search_distances("ock", 1) == [("eck", 1), ("uck", 1)]
+
+
+def test_trie_from_sorted():
+    """Test building a trie from words that are already sorted."""
+    words = ["", "duck", "duck", "duckling", "dude", "zebra", "été"]
+    t = Trie.from_sorted(iter(words))
+    assert list(t) == sorted(set(words))
+    assert t.search("duk", 1) == ["duck"]
+    t.insert("dun")
+    t.remove("dude")
+    assert list(t) == ["", "duck", "duckling", "dun", "zebra", "été"]
+    assert list(Trie.from_sorted([])) == []
+    with pytest.raises(ValueError):
+        Trie.from_sorted(["duck", "ant"])
+
+
+def test_pypwl_unsorted_file(tmp_path):
+    """Test that PyPWL reads both sorted and unsorted word lists."""
+    for words in (["ant", "bee", "cat"], ["cat", "ant", "bee", "ant"]):
+        pwl_path = tmp_path / "pwl.txt"
+        pwl_path.write_text("".join(w + "\n" for w in words))
+        d = PyPWL(str(pwl_path))
+        assert list(d._words) == ["ant", "bee", "cat"]
+        assert d.check("bee")
+        assert not d.check("dog")
+
+
+def test_pypwl_suggest():
+    """Test that PyPWL suggests the closest words first, within budget."""
+    d = PyPWL()
+    for w in ["hello", "help", "hell", "yellow", "world", "held", "halo"]:
+        d.add_to_session(w)
+    suggs = ["halo", "held", "hell", "hello", "help", "yellow", "world"]
+    assert d.suggest("helo") == suggs
+    assert d.suggest("helo", max_suggestions=2) == suggs[:2]
+    assert d.suggest("hello", max_suggestions=1) == ["hello"]
+    assert d._words.nearest("helo", 10, 5) == d._words.search_distances("helo", 5)
+    # A search cut short still gives the words found so far
+    assert d.suggest("helo", max_nodes=0) == []
+    partial = d.suggest("helo", max_nodes=5)
+    assert set(partial) <= set(suggs)
+    assert d.suggest("helo", timeout=60) == suggs
+
+
+def test_pypwl_journal(tmp_path, monkeypatch):
+    """Test that PyPWL records removals in a journal instead of rewriting."""
+    pwl_path = tmp_path / "pwl.txt"
+    journal_path = tmp_path / "pwl.txt.journal"
+    pwl_path.write_text("ant\nbee\ncat\n")
+    d = PyPWL(str(pwl_path))
+    d.add("dog")
+    assert pwl_path.read_text() == "ant\nbee\ncat\ndog\n"
+    assert not journal_path.exists()
+    d.remove("bee")
+    d.add("bee")
+    d.remove("cat")
+    d.add("eel")
+    assert pwl_path.read_text() == "ant\nbee\ncat\ndog\n"
+    assert journal_path.read_text() == "-bee\n+bee\n-cat\n+eel\n"
+    assert list(PyPWL(str(pwl_path))._words) == ["ant", "bee", "dog", "eel"]
+    # A record cut short is ignored, and does not spoil the next one
+    with journal_path.open("a") as f:
+        f.write("-an")
+    d = PyPWL(str(pwl_path))
+    assert list(d._words) == ["ant", "bee", "dog", "eel"]
+    d.add("fox")
+    assert journal_path.read_text() == "-bee\n+bee\n-cat\n+eel\n+fox\n"
+    assert list(PyPWL(str(pwl_path))._words) == ["ant", "bee", "dog", "eel", "fox"]
+    d.remove("fox")
+    d.compact()
+    assert pwl_path.read_text() == "ant\nbee\ndog\neel\n"
+    assert not journal_path.exists()
+    # The journal is merged into the file once it grows large enough
+    monkeypatch.setattr("enchant.pypwl._JOURNAL_MIN", 10)
+    d.remove("ant")
+    assert journal_path.exists()
+    d.remove("bee")
+    d.remove("dog")
+    assert pwl_path.read_text() == "eel\n"
+    assert not journal_path.exists()
+    assert list(PyPWL(str(pwl_path))._words) == ["eel"]
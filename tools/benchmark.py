@@ -0,0 +1,805 @@
+#!python
+#
+#  This script is placed in the public domain.
+#
+# Micro-benchmarks for the performance-sensitive parts of PyEnchant.
+#
+# Each benchmark is a function registered with the @benchmark decorator.
+# Run them all with:
+#
+#     python tools/benchmark.py
+#
+# or pick some by name:
+#
+#     python tools/benchmark.py check_many
+#
+# Benchmarks that need a dictionary use the language given by the
+# BENCH_LANG environment variable, defaulting to "en_US".
+#
+
+import os
+import subprocess
+import sys
+import time
+import timeit
+
+lang = os.environ.get("BENCH_LANG", "en_US")
+
+# Registered benchmarks, by name
+benchmarks = {}
+
+
+def benchmark(func):
+    benchmarks[func.__name__] = func
+    return func
+
+
+def report(label, seconds, count):
+    print("  %-40s %10.3f us/op" % (label, seconds * 1e6 / count))
+
+
+def best_of(stmt, number, repeat=5):
+    return min(timeit.repeat(stmt, number=number, repeat=repeat))
+
+
+def sample_words(count):
+    """A Zipf-ish mix of correct and misspelled words."""
+    common = ["the", "of", "and", "to", "in", "is", "that", "it", "was", "for"]
+    rare = ["spelling", "dictionary", "receive", "recieve", "teh", "enchnt"]
+    words = []
+    for i in range(count):
+        if i % 4:
+            words.append(common[i % len(common)])
+        else:
+            words.append(rare[i % len(rare)])
+    return words
+
+
+@benchmark
+def check_many():
+    import enchant
+
+    d = enchant.Dict(lang)
+    words = sample_words(100000)
+
+    def loop():
+        return [d.check(w) for w in words]
+
+    def batch():
+        return d.check_many(words)
+
+    assert list(batch()) == loop()
+    t_loop = best_of(loop, 1)
+    t_batch = best_of(batch, 1)
+    report("Dict.check() loop", t_loop, len(words))
+    report("Dict.check_many()", t_batch, len(words))
+    print("  speedup: %.2fx" % (t_loop / t_batch))
+
+
+@benchmark
+def suggest_many():
+    import enchant
+
+    d = enchant.Dict(lang)
+    words = ["recieve", "teh", "enchnt", "spellling", "dictonary", "langauge"] * 20
+    start = timeit.default_timer()
+    for w in words:
+        d.suggest(w)
+    t_loop = timeit.default_timer() - start
+    report("Dict.suggest() loop", t_loop, len(words))
+    for workers in (1, 2, 4, 8):
+        timings = []
+        start = timeit.default_timer()
+        d.suggest_many(words, max_workers=workers, timings=timings)
+        elapsed = timeit.default_timer() - start
+        timings.sort()
+        report("Dict.suggest_many(max_workers=%d)" % workers, elapsed, len(words))
+        print(
+            "    per-call latency: p50 %.3f ms, p99 %.3f ms"
+            % (
+                timings[len(timings) // 2] * 1e3,
+                timings[int(len(timings) * 0.99)] * 1e3,
+            )
+        )
+
+
+@benchmark
+def import_time():
+    def run(code):
+        cmd = [sys.executable, "-c", code]
+        return best_of(lambda: subprocess.run(cmd, check=True), 1, repeat=10)
+
+    baseline = run("pass")
+    for label, code in [
+        ("import enchant", "import enchant"),
+        ("import enchant.tokenize", "import enchant.tokenize"),
+        ("import enchant; enchant.Broker()", "import enchant; enchant.Broker()"),
+    ]:
+        report(label, run(code) - baseline, 1)
+
+
+@benchmark
+def find_library():
+    from enchant import _enchant
+
+    report("from_system()", best_of(_enchant.from_system, 1), 1)
+    _enchant.from_system_cached()
+    report("from_system_cached(), warm", best_of(_enchant.from_system_cached, 1), 1)
+
+
+@benchmark
+def suggest_conversion():
+    from ctypes import POINTER, c_char_p, cast
+
+    # A C array of 15 strings, as returned by enchant_dict_suggest
+    items = [("suggestion%d" % i).encode() for i in range(15)]
+    suggs_c = cast((c_char_p * 16)(*items), POINTER(c_char_p))
+
+    def loop():
+        # What dict_suggest() and Dict.suggest() used to do
+        suggs = []
+        n = 0
+        while n < 15:
+            suggs.append(suggs_c[n])
+            n = n + 1
+        return [w.decode() for w in suggs]
+
+    def bulk():
+        return b"\0".join(suggs_c[:15]).decode().split("\0")
+
+    def top3():
+        return b"\0".join(suggs_c[:3]).decode().split("\0")
+
+    assert loop() == bulk()
+    report("index loop + per-item decode", best_of(loop, 100000), 100000)
+    report("slice + single decode", best_of(bulk, 100000), 100000)
+    report("slice + single decode, top 3", best_of(top3, 100000), 100000)
+
+
+@benchmark
+def broker_enumeration():
+    import enchant
+
+    b = enchant.Broker()
+
+    def uncached(method):
+        def run():
+            b.refresh()
+            return method()
+
+        return run
+
+    for name in ["dict_exists", "list_languages", "describe"]:
+        method = getattr(b, name)
+        if name == "dict_exists":
+            method = lambda: b.dict_exists(lang)  # noqa: E731
+        report("Broker.%s(), uncached" % name, best_of(uncached(method), 1000), 1000)
+        report("Broker.%s(), cached" % name, best_of(method, 1000), 1000)
+
+
+@benchmark
+def dict_construction():
+    import enchant
+
+    b = enchant.Broker()
+    keep = b.request_dict(lang)  # noqa: F841
+
+    def construct():
+        d = enchant.Dict(lang, b)
+        d._free()
+
+    report("Dict(tag), language already loaded", best_of(construct, 10000), 10000)
+
+
+@benchmark
+def check_cache():
+    import enchant
+
+    d = enchant.Dict(lang)
+    words = sample_words(100000)
+
+    def loop():
+        return [d.check(w) for w in words]
+
+    t_plain = best_of(loop, 1)
+    d.enable_check_cache()
+    t_cached = best_of(loop, 1)
+    report("Dict.check() loop", t_plain, len(words))
+    report("Dict.check() loop, check cache", t_cached, len(words))
+    cache = d.check_cache
+    print("  hit rate: %.2f%%" % (100.0 * cache.hits / (cache.hits + cache.misses)))
+    t_batch = best_of(lambda: d.check_many(words), 1)
+    report("Dict.check_many(), check cache", t_batch, len(words))
+
+
+@benchmark
+def suggestion_cache():
+    import enchant
+    from enchant.cache import SuggestionCache
+
+    d = enchant.Dict(lang)
+    words = [w for w in sample_words(2000) if not d.check(w)]
+
+    def loop():
+        return [d.suggest(w) for w in words]
+
+    t_plain = best_of(loop, 1, repeat=3)
+    d.suggestion_cache = cache = SuggestionCache()
+    t_cached = best_of(loop, 1, repeat=3)
+    report("Dict.suggest() loop", t_plain, len(words))
+    report("Dict.suggest() loop, suggestion cache", t_cached, len(words))
+    print("  cache size: %d entries, ~%d bytes" % (len(cache), cache.nbytes))
+
+
+@benchmark
+def dict_pool():
+    import threading
+
+    import enchant
+
+    words = sample_words(20000)
+    d = enchant.Dict(lang)
+    lock = threading.Lock()
+
+    def run_threads(nthreads, work):
+        threads = [threading.Thread(target=work) for _ in range(nthreads)]
+        start = timeit.default_timer()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return timeit.default_timer() - start
+
+    def locked():
+        for w in words:
+            with lock:
+                d.check(w)
+
+    for nthreads in (1, 2, 4, 8):
+        pool = enchant.DictPool(lang, size=nthreads)
+
+        def pooled():
+            with pool.acquire() as pd:
+                for w in words:
+                    pd.check(w)
+
+        count = nthreads * len(words)
+        t_locked = run_threads(nthreads, locked)
+        t_pooled = run_threads(nthreads, pooled)
+        report("%d threads, global lock" % nthreads, t_locked, count)
+        report("%d threads, DictPool" % nthreads, t_pooled, count)
+        pool.close()
+
+
+@benchmark
+def check_corpus():
+    from enchant.checker import SpellChecker
+    from enchant.corpus import check_corpus
+
+    # A few large documents among many small ones
+    line = " ".join(sample_words(12)) + "\n"
+    texts = [line * 5] * 2000 + [line * 5000] * 4
+    nwords = sum(len(t.split()) for t in texts)
+
+    def spellchecker():
+        chkr = SpellChecker(lang)
+        for text in texts:
+            chkr.set_text(text)
+            [err.wordpos for err in chkr]
+
+    report("SpellChecker loop", best_of(spellchecker, 1, repeat=1), nwords)
+    for workers in (1, 2, 4, 8):
+        t = best_of(lambda: check_corpus(texts, lang, workers), 1, repeat=3)
+        report("check_corpus(workers=%d)" % workers, t, nwords)
+
+
+@benchmark
+def async_dict():
+    import asyncio
+
+    import enchant
+    from enchant.aio import AsyncDict
+
+    words = ["recieve", "teh", "enchnt", "spellling", "dictonary", "langauge"] * 20
+
+    async def ticker(stalls):
+        # Measure how long the event loop is kept from running
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(0)
+            stalls.append(loop.time() - start)
+
+    async def run(suggest):
+        stalls = []
+        tick = asyncio.ensure_future(ticker(stalls))
+        await asyncio.sleep(0)
+        start = timeit.default_timer()
+        await suggest()
+        elapsed = timeit.default_timer() - start
+        tick.cancel()
+        return elapsed, max(stalls)
+
+    d = enchant.Dict(lang)
+
+    async def inline():
+        for w in words:
+            d.suggest(w)
+            await asyncio.sleep(0)
+
+    async def offloaded():
+        async with AsyncDict(lang) as ad:
+            await asyncio.gather(*[ad.suggest(w) for w in words])
+
+    for label, func in [
+        ("Dict.suggest() inline", inline),
+        ("AsyncDict.suggest()", offloaded),
+    ]:
+        elapsed, stall = asyncio.run(run(func))
+        report(label, elapsed, len(words))
+        print("    longest event loop stall: %.3f ms" % (stall * 1e3))
+
+
+@benchmark
+def dwpwl_check():
+    import enchant
+
+    d = enchant.DictWithPWL(lang)
+    for w in ["pyenchant", "Enchant", "spellchecker", "hunspell"]:
+        d.add(w)
+    d.remove("teh")
+    words = sample_words(50000)
+
+    def old_check(w):
+        # What DictWithPWL.check() used to do
+        if d.pel.check(w):
+            return False
+        if d.pwl.check(w):
+            return True
+        return enchant.Dict._check(d, w)
+
+    def old_loop():
+        return [old_check(w) for w in words]
+
+    def loop():
+        return [d.check(w) for w in words]
+
+    assert old_loop() == loop()
+    report("word list tries + Dict.check()", best_of(old_loop, 1), len(words))
+    report("DictWithPWL.check()", best_of(loop, 1), len(words))
+    report(
+        "DictWithPWL.check_many()", best_of(lambda: d.check_many(words), 1), len(words)
+    )
+
+
+@benchmark
+def dwpwl_suggest():
+    import enchant
+
+    d = enchant.DictWithPWL(lang)
+    for w in ["receiver", "recipe", "ten", "tea", "enchanter"]:
+        d.add(w)
+        d.remove(w.upper())
+    words = ["recieve", "teh", "enchnt"] * 10
+
+    def old_suggest(word):
+        # What DictWithPWL.suggest() used to do
+        suggs = enchant.Dict._suggest(d, word)
+        suggs.extend([w for w in d.pwl.suggest(word) if w not in suggs])
+        for i in range(len(suggs) - 1, -1, -1):
+            if d.pel.check(suggs[i]):
+                del suggs[i]
+        return suggs
+
+    assert [old_suggest(w) for w in words] == [d.suggest(w) for w in words]
+    for label, func in [
+        ("list merge + exclude list per word", old_suggest),
+        ("DictWithPWL.suggest()", d.suggest),
+        ("DictWithPWL.suggest(max_suggestions=3)", lambda w: d.suggest(w, 3)),
+    ]:
+        report(label, best_of(lambda: [func(w) for w in words], 1), len(words))
+
+
+@benchmark
+def metrics_overhead():
+    import enchant
+    from enchant import metrics
+
+    d = enchant.Dict(lang)
+    words = sample_words(100000)
+
+    def loop():
+        return [d.check(w) for w in words]
+
+    report("Dict.check(), metrics disabled", best_of(loop, 1), len(words))
+    metrics.enable()
+    try:
+        report("Dict.check(), metrics enabled", best_of(loop, 1), len(words))
+    finally:
+        metrics.disable()
+        metrics.reset()
+
+
+@benchmark
+def dict_budget():
+    import enchant
+
+    broker = enchant.Broker()
+    tags = [t for t in broker.list_languages() if "_" in t][:3]
+    dicts = [broker.request_dict(t) for t in tags]
+    words = sample_words(10000)
+
+    def loop():
+        return [d.check(w) for w in words for d in dicts]
+
+    count = len(words) * len(dicts)
+    report("Dict.check(), no budget", best_of(loop, 1), count)
+    broker.set_dict_budget(max_dicts=len(dicts))
+    report("Dict.check(), all dicts within budget", best_of(loop, 1), count)
+    broker.set_dict_budget(max_dicts=len(dicts) - 1)
+    report("Dict.check(), reloading round-robin", best_of(loop, 1), count)
+    print("  %-40s %10d" % ("evictions", broker.evictions))
+    for tag, provider, size in broker.dict_usage():
+        print(
+            "  %-40s %10d KiB"
+            % ("size of %s (%s)" % (tag, provider.name), size // 1024)
+        )
+
+
+@benchmark
+def multi_dict():
+    import enchant
+
+    tags = [t for t in enchant.list_languages() if "_" in t][:3]
+    dicts = [enchant.Dict(t) for t in tags]
+    multi = enchant.MultiDict(dicts)
+    words = sample_words(10000)
+
+    def loop_check(w):
+        return any(d.check(w) for d in dicts)
+
+    def loop_suggest(w):
+        return enchant.utils.trim_suggestions(
+            w, [s for d in dicts for s in d.suggest(w)], 100
+        )
+
+    report(
+        "any(d.check()) loop",
+        best_of(lambda: [loop_check(w) for w in words], 1),
+        len(words),
+    )
+    report(
+        "MultiDict.check()",
+        best_of(lambda: [multi.check(w) for w in words], 1),
+        len(words),
+    )
+    words = words[:200]
+    report(
+        "sequential suggest() + trim_suggestions",
+        best_of(lambda: [loop_suggest(w) for w in words], 1),
+        len(words),
+    )
+    report(
+        "MultiDict.suggest()",
+        best_of(lambda: [multi.suggest(w) for w in words], 1),
+        len(words),
+    )
+    multi.close()
+
+
+def glossary_words(count):
+    """Distinct made-up words, with prefixes in common as in real ones."""
+    import random
+
+    rnd = random.Random(0)
+    stems = [
+        "".join(rnd.choice("aeioubcdfglmnprst") for _ in range(4)) for _ in range(500)
+    ]
+    words = set()
+    while len(words) < count:
+        tail = "".join(
+            rnd.choice("abcdefghilmnoprstuvz") for _ in range(rnd.randint(2, 8))
+        )
+        words.add(rnd.choice(stems) + tail)
+    words = list(words)
+    rnd.shuffle(words)
+    return words
+
+
+class _ObjectTrie:
+    """The previous layout of pypwl.Trie, with an object per node."""
+
+    def __init__(self, words=()):
+        self._eos = False
+        self._keys = {}
+        for w in words:
+            self.insert(w)
+
+    def insert(self, word):
+        if word == "":
+            self._eos = True
+        else:
+            subtrie = self._keys.get(word[0])
+            if subtrie is None:
+                subtrie = self._keys[word[0]] = _ObjectTrie()
+            subtrie.insert(word[1:])
+
+
+@benchmark
+def trie_memory():
+    import tracemalloc
+
+    from enchant.pypwl import Trie
+
+    for count in (10000, 100000, 1000000):
+        words = glossary_words(count)
+        impls = [("Trie", Trie)]
+        if count <= 100000:
+            impls.append(("object per node", _ObjectTrie))
+        for label, impl in impls:
+            start = time.perf_counter()
+            tracemalloc.start()
+            trie = impl(words)
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            elapsed = time.perf_counter() - start
+            del trie
+            label = "%s, %d words" % (label, count)
+            print("  %-40s %10.3f s %10d KiB" % (label, elapsed, size // 1024))
+        start = time.perf_counter()
+        Trie(words)
+        report("Trie, %d words, untraced" % count, time.perf_counter() - start, count)
+
+
+@benchmark
+def pwl_load():
+    import tempfile
+
+    from enchant.pypwl import PyPWL, Trie
+
+    for count in (10000, 100000, 1000000):
+        words = glossary_words(count)
+
+        def one_by_one():
+            trie = Trie()
+            for w in words:
+                trie.insert(w)
+
+        def object_per_node():
+            trie = _ObjectTrie()
+            for w in words:
+                trie.insert(w)
+
+        impls = [
+            ("Trie.insert() loop", one_by_one),
+            ("Trie(words)", lambda: Trie(words)),
+            ("Trie.from_sorted(words)", lambda: Trie.from_sorted(sorted(words))),
+        ]
+        if count <= 100000:
+            impls.insert(0, ("recursive insert, object per node", object_per_node))
+        for label, func in impls:
+            report("%s, %d words" % (label, count), best_of(func, 1, 3), count)
+        with tempfile.TemporaryDirectory() as tmp:
+            for label, order in [("unsorted", words), ("sorted", sorted(words))]:
+                path = os.path.join(tmp, label)
+                with open(path, "w") as f:
+                    f.writelines(w + "\n" for w in order)
+                t = best_of(lambda: PyPWL(path), 1, 3)
+                report("PyPWL(%s file), %d words" % (label, count), t, count)
+
+
+class _RecursiveSearch:
+    """The previous fuzzy search of pypwl.Trie, on its nodes."""
+
+    def __init__(self, trie):
+        self.nodes = trie._nodes
+        self.root = trie._node
+
+    def search(self, word, nerrs, node=None):
+        node = self.root if node is None else node
+        nodes = self.nodes
+        res = []
+        if nerrs < 0:
+            return res
+        if nerrs == 0 and word == "" and nodes.eos[node]:
+            res.append("")
+        if word:
+            child = nodes.child(node, word[0])
+            if child >= 0:
+                for w in self.search(word[1:], nerrs, child):
+                    if word[0] + w not in res:
+                        res.append(word[0] + w)
+        for w in self.search(word[1:], nerrs - 1, node):
+            if w not in res:
+                res.append(w)
+        children = nodes.children(node)
+        for rest in (word, word[1:]):
+            for k, child in children:
+                for w in self.search(rest, nerrs - 1, child):
+                    if k + w not in res:
+                        res.append(k + w)
+        return res
+
+
+@benchmark
+def trie_search():
+    from enchant.pypwl import Trie
+
+    trie = Trie(glossary_words(100000))
+    old = _RecursiveSearch(trie)
+    words = ["spellchecker", "recieve", "glosary", "pyenchnt"]
+    for nerrs in (1, 2, 3, 4):
+        if nerrs <= 2:
+            for w in words:
+                assert set(old.search(w, nerrs)) == set(trie.search(w, nerrs))
+        if nerrs <= 3:
+            t = best_of(lambda: [old.search(w, nerrs) for w in words], 1, 1)
+            report("recursive search, nerrs=%d" % nerrs, t, len(words))
+        t = best_of(lambda: [trie.search(w, nerrs) for w in words], 1, 3)
+        report("Trie.search(), nerrs=%d" % nerrs, t, len(words))
+        t = best_of(lambda: [trie.search(w, nerrs, 10) for w in words], 1, 3)
+        report("Trie.search(max_results=10), nerrs=%d" % nerrs, t, len(words))
+
+
+@benchmark
+def pwl_suggest():
+    from enchant.pypwl import PyPWL
+
+    pwl = PyPWL()
+    for w in glossary_words(100000):
+        pwl.add_to_session(w)
+    old = _RecursiveSearch(pwl._words)
+
+    def old_suggest(word):
+        # What PyPWL.suggest() used to do: iterative deepening
+        res = old.search(word, 0)
+        depth = 0
+        while len(res) < 10 and depth < 5:
+            depth += 1
+            res.extend(w for w in old.search(word, depth) if w not in res)
+        return res[:10]
+
+    for word in ["spellchecker", "glossary", "pyenchnt", "tabcdefghilmn"]:
+        if len(word) <= 8:
+            t = best_of(lambda: old_suggest(word), 1, 1)
+            report("iterative deepening, %s" % word, t, 1)
+        report(
+            "PyPWL.suggest(), %s" % word, best_of(lambda: pwl.suggest(word), 1, 3), 1
+        )
+        t = best_of(lambda: pwl.suggest(word, timeout=0.01), 1, 3)
+        report("timeout=0.01, %s" % word, t, 1)
+
+
+@benchmark
+def pwl_check():
+    from enchant.pypwl import PyPWL
+
+    pwl = PyPWL()
+    glossary = glossary_words(100000)
+    for w in glossary:
+        pwl.add_to_session(w)
+    old = _RecursiveSearch(pwl._words)
+    # Half of them in the word list, half of them not
+    words = [w + "x" if i % 2 else w for i, w in enumerate(glossary[:50000])]
+    lookups = [
+        (
+            "recursive Trie.search(word)",
+            lambda: [bool(old.search(w, 0)) for w in words],
+        ),
+        ("PyPWL.check()", lambda: [pwl.check(w) for w in words]),
+        ("PyPWL.check_many()", lambda: pwl.check_many(words)),
+    ]
+    expected = list(lookups[0][1]())
+    for label, func in lookups:
+        assert list(func()) == expected
+        report(label, best_of(func, 1), len(words))
+
+
+@benchmark
+def pwl_remove():
+    import tempfile
+
+    from enchant.pypwl import PyPWL
+
+    words = sorted(glossary_words(200000))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pwl.txt")
+        with open(path, "w") as f:
+            f.writelines(w + "\n" for w in words)
+        pwl = PyPWL(path)
+        count = 20
+
+        def rewrite():
+            # What PyPWL.remove() used to do
+            for w in words[:count]:
+                pwl._words.remove(w)
+                with open(path, "wt") as f:
+                    for w in pwl._words:
+                        f.write("%s\n" % (w.strip(),))
+
+        def journal():
+            for w in words[count : 2 * count]:
+                pwl.remove(w)
+
+        report("remove(), rewriting the file", best_of(rewrite, 1, 1), count)
+        report("remove(), journal", best_of(journal, 1, 1), count)
+        report("compact()", best_of(pwl.compact, 1, 1), 1)
+        report("PyPWL(), 200000 words", best_of(lambda: PyPWL(path), 1, 3), 1)
+        for w in words[::2]:
+            pwl.remove(w)
+        t = best_of(lambda: PyPWL(path), 1, 3)
+        report("PyPWL(), after removing half of them", t, 1)
+
+
+def _rss_kib():
+    with open("/proc/self/status") as f:
+        for ln in f:
+            if ln.startswith("VmRSS:"):
+                return int(ln.split()[1])
+    return 0
+
+
+def _private_kib():
+    """Memory not shared with other processes, or RSS if unavailable."""
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            return sum(int(ln.split()[1]) for ln in f if ln.startswith("Private_"))
+    except OSError:
+        return _rss_kib()
+
+
+@benchmark
+def prefork():
+    if not hasattr(os, "fork"):
+        print("  skipped: needs fork()")
+        return
+    import enchant
+
+    words = sample_words(100)
+    nchildren = 8
+
+    def run(preload):
+        broker = enchant.Broker()
+        if preload:
+            broker.preload([lang])
+        times = []
+        mem = []
+        for _ in range(nchildren):
+            r, w = os.pipe()
+            start = time.perf_counter()
+            pid = os.fork()
+            if pid == 0:
+                os.close(r)
+                d = enchant.Dict(lang, broker)
+                for word in words:
+                    d.check(word)
+                os.write(w, b"%f %d" % (time.perf_counter() - start, _private_kib()))
+                os._exit(0)
+            os.close(w)
+            with os.fdopen(r, "rb") as f:
+                elapsed, kib = f.read().split()
+            os.waitpid(pid, 0)
+            times.append(float(elapsed))
+            mem.append(int(kib))
+        label = "with preload" if preload else "without preload"
+        report("child startup, " + label, min(times), 1)
+        print("  %-40s %10d KiB" % ("child private memory, " + label, max(mem)))
+
+    run(False)
+    run(True)
+
+
+def main(names):
+    if not names:
+        names = list(benchmarks)
+    for name in names:
+        if name not in benchmarks:
+            sys.exit(
+                "unknown benchmark: %s (choose from %s)" % (name, ", ".join(benchmarks))
+            )
+        print(name)
+        benchmarks[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])